@@ -0,0 +1,164 @@
+"""
+Microbenchmarks for the engine's hot paths at scaled obstacle counts. Runs in-process
+under the SDL dummy video driver on a headless game that draws to an off-screen surface.
+
+Usage:
+    python -m benchmark.bench_engine --output before.json
+    python -m benchmark.bench_engine --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from side_scroller.game import Game
+from side_scroller.inputs import idle_input
+from side_scroller.obstacle import Obstacle, move_obstacles
+from side_scroller.settings import GameSettings
+from side_scroller.death_animation import display_player_death_animation
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_COUNTS = (10, 100, 1000, 10000)
+
+def create_game(obstacle_count: int, seed: int = 0) -> Game:
+    """ RETURNS: A headless game with obstacle_count obstacles spread over the screen. """
+    game = Game(headless=True, input_source=idle_input, seed=seed)
+    populate_obstacles(game, obstacle_count)
+    return game
+
+def populate_obstacles(game: Game, obstacle_count: int):
+    rng = random.Random(obstacle_count)
+    game.obstacles.clear()
+    for _ in range(obstacle_count):
+        game.obstacles.add(
+            rng.randrange(0, GameSettings.width * 2),
+            rng.randrange(0, GameSettings.height),
+            rng.randrange(0, len(Obstacle.images)),
+            rng.randint(1, 2))
+
+def time_calls(function, setup, repeat: int, number: int) -> list:
+    """
+    Calls setup, then times number calls of function, repeat times.
+
+    RETURNS: Seconds per call for each repeat.
+    """
+    timings = []
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+def bench_move_obstacles(game: Game, count: int, repeat: int) -> list:
+    return time_calls(
+        lambda: move_obstacles(game), lambda: populate_obstacles(game, count), repeat, 20)
+
+def bench_collision(game: Game, count: int, repeat: int) -> list:
+    return time_calls(
+        lambda: game.player.is_colliding_with_obstacles(game.obstacles), lambda: None, repeat, 200)
+
+def bench_obstacles_in_player_path(game: Game, count: int, repeat: int) -> list:
+    return time_calls(game.get_obstacles_in_player_path_y, lambda: None, repeat, 200)
+
+def bench_score_hud(game: Game, count: int, repeat: int) -> list:
+    def redraw_changed_score():
+        game.player.score.score += 1
+        game.update_score_hud()
+        game.flush_render_queue()
+    return time_calls(redraw_changed_score, lambda: None, repeat, 200)
+
+def bench_death_animation(game: Game, count: int, repeat: int) -> list:
+    start_y = game.player.y
+    def reset_player():
+        game.player.move_to_y(start_y)
+        game.player.game_settings.set_defaults()
+    return time_calls(lambda: display_player_death_animation(game), reset_player, repeat, 1)
+
+BENCHMARKS = {
+    "move_obstacles": bench_move_obstacles,
+    "is_colliding_with_obstacles": bench_collision,
+    "get_obstacles_in_player_path_y": bench_obstacles_in_player_path,
+    "update_score_hud": bench_score_hud,
+    "display_player_death_animation": bench_death_animation}
+
+def run_benchmarks(counts: tuple = DEFAULT_COUNTS, names: list = None, repeat: int = 7) -> list:
+    """ RETURNS: One result row per benchmark and obstacle count. """
+    results = []
+    for count in counts:
+        for name in names or BENCHMARKS:
+            game = create_game(count)
+            timings = BENCHMARKS[name](game, count, repeat)
+            results.append({
+                "benchmark": name,
+                "obstacles": count,
+                "median_us": statistics.median(timings) * 1e6,
+                "min_us": min(timings) * 1e6,
+                "repeat": repeat})
+    return results
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPOSITORY_DIRECTORY,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def get_environment() -> dict:
+    return {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine()}
+
+def compare(results: list, baseline: list) -> list:
+    """ RETURNS: (benchmark, obstacles, baseline us, current us, speedup) for rows in both. """
+    baseline_rows = {(row["benchmark"], row["obstacles"]): row for row in baseline}
+    rows = []
+    for row in results:
+        before = baseline_rows.get((row["benchmark"], row["obstacles"]))
+        if before is not None:
+            rows.append((row["benchmark"], row["obstacles"], before["median_us"], row["median_us"],
+                         before["median_us"] / row["median_us"]))
+    return rows
+
+def print_results(results: list):
+    for row in results:
+        print(f"{row['benchmark']:<34}{row['obstacles']:>7}{row['median_us']:>14.1f} us")
+
+def print_comparison(rows: list):
+    for name, count, before, after, speedup in rows:
+        print(f"{name:<34}{count:>7}{before:>14.1f} us{after:>14.1f} us{speedup:>8.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Time engine hot paths at scaled obstacle counts.")
+    parser.add_argument("--counts", type=int, nargs="+", default=DEFAULT_COUNTS)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Run only these benchmarks.")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results of an earlier run to compare with.")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.counts, args.only, args.repeat)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            print_comparison(compare(results, json.load(baseline_file)["results"]))
+    else:
+        print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"environment": get_environment(), "results": results}, output_file, indent=2)
+
+if __name__ == "__main__":
+    main()
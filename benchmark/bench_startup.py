@@ -0,0 +1,73 @@
+"""
+Measures cold-start cost in fresh interpreters: time to import the game modules and
+time from interpreter start to the first presented frame. Runs under the SDL dummy
+video driver from a scratch working directory, so nothing depends on the cwd.
+
+Usage: python -m benchmark.bench_startup --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import side_scroller.side_scroller
+print(time.perf_counter() - start)
+"""
+
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+from side_scroller.game import Game
+from side_scroller.inputs import idle_input
+import side_scroller.side_scroller as side_scroller
+game = Game(input_source=idle_input)
+side_scroller.run_frame(game)
+print(time.perf_counter() - start)
+"""
+
+def time_script(script: str, runs: int) -> list:
+    """ RETURNS: Seconds reported by script for each run in a fresh interpreter. """
+    environment = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                       PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONPATH=REPOSITORY_DIRECTORY)
+    timings = []
+    with tempfile.TemporaryDirectory() as working_directory:
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-W", "ignore", "-c", script],
+                cwd=working_directory, env=environment,
+                capture_output=True, text=True, check=True).stdout
+            timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+def summarize(timings: list) -> dict:
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "max_ms": max(timings) * 1000,
+        "runs": len(timings)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import and first-frame time.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    results = {
+        "time_to_import": summarize(time_script(IMPORT_SCRIPT, args.runs)),
+        "time_to_first_frame": summarize(time_script(FIRST_FRAME_SCRIPT, args.runs))}
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,23 @@
+import argparse
 import side_scroller.side_scroller as game
+from side_scroller.ghost import parse_address
 
 if __name__ == "__main__":
-    game.start_game()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--replays", metavar="DIRECTORY", help="Save a replay of every run here.")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Time each frame phase (F3 toggles the overlay) and write a JSON summary here on exit.")
+    parser.add_argument("--record", metavar="PATH", help="Record the screen to this file.")
+    parser.add_argument("--render-scale", type=float, metavar="SCALE",
+                        help="Draw at this fraction of the window's resolution, e.g. 0.5, and scale up to present.")
+    parser.add_argument("--pipelined", action="store_true", default=None,
+                        help="Simulate on a worker thread while the last frame is drawn.")
+    parser.add_argument("--race", metavar="HOST:PORT",
+                        help="Race a ghost of whoever joins this relay (python -m side_scroller.relay) with the same seed.")
+    parser.add_argument("--race-seed", type=int, default=0, metavar="SEED",
+                        help="Course both racers play. Defaults to 0.")
+    args = parser.parse_args()
+
+    game.start_game(replay_directory=args.replays, profile_path=args.profile, record_path=args.record,
+                    render_scale=args.render_scale, pipelined=args.pipelined,
+                    race_address=parse_address(args.race) if args.race else None, race_seed=args.race_seed)
@@ -0,0 +1,210 @@
+import json
+import os
+import time
+import pygame
+from side_scroller.constants import ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH
+
+class AssetRecord():
+    """ Load statistics for a single asset. """
+    def __init__(self, name: str, path: str = None, base_name: str = None, builder=None):
+        self.name = name
+        self.path = path
+        self.base_name = base_name
+        self.builder = builder
+        self.load_seconds = 0
+        self.bytes = 0
+
+    @property
+    def is_derived(self) -> bool:
+        return self.base_name is not None
+
+class AssetManager():
+    """
+    Registry for every image surface and font in the game. Assets are registered by name
+    and only loaded the first time they are used. Loaded images are converted to the
+    display's pixel format once a display exists, and derived variants are generated
+    from their base image instead of being loaded from disk. Collision masks are built
+    from an image's alpha the first time they are asked for.
+
+    Images packed into an atlas are subsurface views of the one atlas surface. Since
+    the first registration of a name wins, registering the atlas before the modules
+    that register the individual files makes those files a fallback only.
+    """
+    def __init__(self):
+        self.images = {}
+        self.masks = {}
+        self.records = {}
+        self.fonts = {}
+        self.converted = False
+        self.version = 0
+
+    def register_image(self, name: str, path: str):
+        """ Registers an image file to be loaded on first use. """
+        if name not in self.records:
+            self.records[name] = AssetRecord(name, path)
+
+    def register_derived_image(self, name: str, base_name: str, builder):
+        """ Registers an image built on first use by calling builder with the base image. """
+        if name not in self.records:
+            self.records[name] = AssetRecord(name, base_name=base_name, builder=builder)
+
+    def register_atlas(self, name: str, image_path: str, index_path: str):
+        """ Registers an atlas image and a subsurface view of it for every sprite in its index. """
+        self.register_image(name, image_path)
+        for sprite_name, rect in read_atlas_index(index_path).items():
+            self.register_derived_image(sprite_name, name, get_atlas_view_builder(rect))
+
+    def image(self, name: str) -> pygame.Surface:
+        surface = self.images.get(name)
+        if surface is None:
+            surface = self._load(self.records[name])
+        return surface
+
+    def _load(self, record: AssetRecord) -> pygame.Surface:
+        start = time.perf_counter()
+        if record.is_derived:
+            surface = record.builder(self.image(record.base_name))
+        else:
+            surface = pygame.image.load(record.path)
+            if self.converted and pygame.display.get_surface() is not None:
+                surface = convert_surface(surface)
+        self._store(record, surface)
+        record.load_seconds = time.perf_counter() - start
+        return surface
+
+    def _store(self, record: AssetRecord, surface: pygame.Surface):
+        self.images[record.name] = surface
+        #Views share their parent's pixels, which its own record already counts
+        record.bytes = 0 if surface.get_parent() is not None else surface.get_pitch() * surface.get_height()
+
+    def mask(self, name: str) -> pygame.mask.Mask:
+        """ RETURNS: The cached collision mask of a named image's opaque pixels. """
+        mask = self.masks.get(name)
+        if mask is None:
+            mask = pygame.mask.from_surface(self.image(name))
+            self.masks[name] = mask
+        return mask
+
+    def font(self, name: str, size: int) -> pygame.font.Font:
+        """
+        RETURNS: A cached system font. The cache is dropped whenever the font module
+        has been shut down, since fonts from a previous init cannot be rendered with.
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+            self.fonts.clear()
+        font = self.fonts.get((name, size))
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self.fonts[(name, size)] = font
+        return font
+
+    def convert(self):
+        """
+        Converts every loaded image to the display format so blits skip per-pixel
+        conversion. Images loaded afterwards are converted as they load.
+        Does nothing until a display mode has been set.
+        """
+        if self.converted or pygame.display.get_surface() is None:
+            return
+        for record in self.records.values():
+            if not record.is_derived and record.name in self.images:
+                self._store(record, convert_surface(self.images[record.name]))
+        for record in self.records.values():
+            if record.is_derived and record.name in self.images:
+                self._store(record, record.builder(self.image(record.base_name)))
+        self.masks.clear()
+        self.converted = True
+        self.version += 1
+
+    def report(self) -> list:
+        """ RETURNS: (name, load milliseconds, bytes) for every loaded image. """
+        return [(record.name, record.load_seconds * 1000, record.bytes)
+                for record in self.records.values() if record.name in self.images]
+
+def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+def read_atlas_index(path: str) -> dict:
+    """ RETURNS: The [x, y, width, height] of every sprite in an atlas, by asset name. """
+    with open(path) as index_file:
+        return json.load(index_file)["sprites"]
+
+def get_atlas_view_builder(rect: list):
+    def build_view(atlas: pygame.Surface) -> pygame.Surface:
+        return atlas.subsurface(pygame.Rect(rect))
+    return build_view
+
+def make_flash_variant(surface: pygame.Surface) -> pygame.Surface:
+    """ RETURNS: A white silhouette of surface that keeps its transparency. """
+    flash = surface.copy()
+    flash.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_MAX)
+    return flash
+
+class ImageAsset():
+    """ Class attribute that resolves to the current surface of a named asset. """
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner) -> pygame.Surface:
+        return assets.image(self.name)
+
+class FontAsset():
+    """ Class attribute that resolves to a lazily created system font. """
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+
+    def __get__(self, instance, owner) -> pygame.font.Font:
+        return assets.font(self.name, self.size)
+
+class LazyValue():
+    """ Class attribute computed on first access, for values that depend on loading assets. """
+    def __init__(self, compute):
+        self.compute = compute
+        self.value = None
+        self.computed = False
+
+    def __get__(self, instance, owner):
+        if not self.computed:
+            self.value = self.compute()
+            self.computed = True
+        return self.value
+
+class ImageAssetList():
+    """ Class attribute that resolves to the current surfaces of several named assets. """
+    def __init__(self, names: list):
+        self.names = names
+
+    def __get__(self, instance, owner) -> list:
+        return [assets.image(name) for name in self.names]
+
+class MaskAssetList():
+    """ Class attribute that resolves to the collision masks of several named images. """
+    def __init__(self, names: list):
+        self.names = names
+
+    def __get__(self, instance, owner) -> list:
+        return [assets.mask(name) for name in self.names]
+
+assets = AssetManager()
+if os.path.exists(ATLAS_INDEX_PATH):
+    assets.register_atlas("atlas", ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH)
+
+def print_report(manager: AssetManager):
+    rows = manager.report()
+    for name, load_ms, size in rows:
+        print(f"{name:<24}{load_ms:>8.2f} ms{size / 1024:>10.1f} KiB")
+    print(f"{'total':<24}{sum(row[1] for row in rows):>8.2f} ms"
+          f"{sum(row[2] for row in rows) / 1024:>10.1f} KiB")
+
+if __name__ == "__main__":
+    #Import through the package so the report covers the manager the game modules populate
+    from side_scroller.game import Game
+    import side_scroller.assets
+    Game()
+    for name in side_scroller.assets.assets.records:
+        side_scroller.assets.assets.image(name)
+    print_report(side_scroller.assets.assets)
@@ -0,0 +1,85 @@
+"""
+Packs the player and obstacle sprites into one atlas image, so the game opens one file
+and keeps one surface for all of them. White variants are packed too, so they are never
+generated at runtime. AssetManager hands out subsurface views of the atlas using the
+index written next to it, and falls back to the individual files when there is no index.
+
+Rerun after changing a sprite or adding one to OBSTACLE_IMAGE_FILES.
+
+Usage: python -m side_scroller.atlas
+"""
+import json
+import math
+import pygame
+from side_scroller.constants import PLAYER_PATH, OBSTACLE_PATH, ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH
+from side_scroller.assets import make_flash_variant
+from side_scroller.player import DIRECTIONS
+from side_scroller.obstacle import OBSTACLE_IMAGE_FILES
+
+ATLAS_VERSION = 1
+
+def get_atlas_sprites() -> list:
+    """ RETURNS: (asset name, surface) of every sprite the atlas holds, loaded from the source files. """
+    sprites = []
+    for state in DIRECTIONS.values():
+        image = pygame.image.load(f"{PLAYER_PATH}{state}_state.png")
+        sprites.append((f"player/{state}", image))
+        sprites.append((f"player/{state}_white", make_flash_variant(image)))
+    for image_file in OBSTACLE_IMAGE_FILES:
+        sprites.append((f"obstacles/{image_file}", pygame.image.load(f"{OBSTACLE_PATH}{image_file}")))
+    return sprites
+
+def pack_shelves(sizes: list, padding: int = 1) -> tuple:
+    """
+    Places rects tallest first along shelves of a roughly square sheet.
+    padding: Transparent pixels kept between sprites so filtering never blends neighbours.
+
+    RETURNS: The (x, y) of each size in the given order, and the sheet's size.
+    """
+    area = sum((width + padding) * (height + padding) for width, height in sizes)
+    sheet_width = max(max(width for width, _ in sizes), math.ceil(math.sqrt(area)))
+
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for index in sorted(range(len(sizes)), key=lambda index: -sizes[index][1]):
+        width, height = sizes[index]
+        if x + width > sheet_width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        positions[index] = (x, y)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    return positions, (sheet_width, y + shelf_height)
+
+def build_atlas(sprites: list, padding: int = 1) -> tuple:
+    """ RETURNS: The atlas surface and the index mapping each name to its [x, y, width, height]. """
+    positions, size = pack_shelves([image.get_size() for _, image in sprites], padding)
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    index = {}
+    for (name, image), position in zip(sprites, positions):
+        copy_pixels(image, atlas, position)
+        index[name] = [position[0], position[1], image.get_width(), image.get_height()]
+    return atlas, index
+
+def copy_pixels(source: pygame.Surface, destination: pygame.Surface, position: tuple):
+    """ Copies color and alpha exactly. A blit would blend source alpha into the destination. """
+    x, y = position
+    width, height = source.get_size()
+    pygame.surfarray.pixels3d(destination)[x:x + width, y:y + height] = pygame.surfarray.pixels3d(source)
+    pygame.surfarray.pixels_alpha(destination)[x:x + width, y:y + height] = pygame.surfarray.pixels_alpha(source)
+
+def save_atlas(atlas: pygame.Surface, index: dict, image_path: str, index_path: str):
+    pygame.image.save(atlas, image_path)
+    with open(index_path, "w") as index_file:
+        json.dump({"version": ATLAS_VERSION, "sprites": index}, index_file, separators=(",", ":"))
+
+def main():
+    sprites = get_atlas_sprites()
+    atlas, index = build_atlas(sprites)
+    save_atlas(atlas, index, ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH)
+    print(f"{len(index)} sprites packed into {atlas.get_width()}x{atlas.get_height()} {ATLAS_IMAGE_PATH}")
+
+if __name__ == "__main__":
+    main()
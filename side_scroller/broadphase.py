@@ -0,0 +1,75 @@
+import numpy as np
+import pygame
+
+class SpatialGrid():
+    """
+    Uniform grid broadphase over obstacle slots. Each slot is listed in every cell its
+    rect touches. Obstacles only move horizontally, so after a move only the slots whose
+    column range changed are re-bucketed. Empty cells are kept for reuse.
+    """
+    def __init__(self, cell_size: int = 64, capacity: int = 64):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.column_start = np.zeros(capacity, dtype=np.int32)
+        self.column_end = np.zeros(capacity, dtype=np.int32)
+        self.row_start = np.zeros(capacity, dtype=np.int32)
+        self.row_end = np.zeros(capacity, dtype=np.int32)
+
+    def grow(self, capacity: int):
+        for name in ("column_start", "column_end", "row_start", "row_end"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def clear(self):
+        for bucket in self.cells.values():
+            bucket.clear()
+
+    def insert(self, slot: int, x: int, y: int, width: int, height: int):
+        self.column_start[slot] = x // self.cell_size
+        self.column_end[slot] = (x + width - 1) // self.cell_size
+        self.row_start[slot] = y // self.cell_size
+        self.row_end[slot] = (y + height - 1) // self.cell_size
+        self._add_to_cells(slot)
+
+    def remove(self, slot: int):
+        for cell in self._cells_of(slot):
+            self.cells[cell].discard(slot)
+
+    def update_columns(self, slots: np.ndarray, x: np.ndarray, width: np.ndarray):
+        """ Re-buckets the slots whose column range changed after a horizontal move. """
+        new_start = x // self.cell_size
+        new_end = (x + width - 1) // self.cell_size
+        changed = (new_start != self.column_start[slots]) | (new_end != self.column_end[slots])
+        for slot, start, end in zip(slots[changed].tolist(),
+                                    new_start[changed].tolist(),
+                                    new_end[changed].tolist()):
+            self.remove(slot)
+            self.column_start[slot] = start
+            self.column_end[slot] = end
+            self._add_to_cells(slot)
+
+    def query(self, rect: pygame.Rect) -> set:
+        """ RETURNS: Slots listed in any cell rect touches. Callers still need an exact test. """
+        found = set()
+        cells = self.cells
+        for column in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+            for row in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1):
+                bucket = cells.get((column, row))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+    def _cells_of(self, slot: int):
+        for column in range(int(self.column_start[slot]), int(self.column_end[slot]) + 1):
+            for row in range(int(self.row_start[slot]), int(self.row_end[slot]) + 1):
+                yield (column, row)
+
+    def _add_to_cells(self, slot: int):
+        for cell in self._cells_of(slot):
+            bucket = self.cells.get(cell)
+            if bucket is None:
+                self.cells[cell] = {slot}
+            else:
+                bucket.add(slot)
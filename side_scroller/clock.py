@@ -0,0 +1,53 @@
+import time
+import pygame
+
+class SimulationClock():
+    """
+    Fixed-timestep clock. Real time accumulates each render frame and is spent in whole
+    simulation ticks of 1 / tick_rate seconds. The remainder becomes alpha, the fraction
+    of a tick to interpolate by when drawing. Rendering is capped at render_fps on its own,
+    so raising the simulation rate does not raise the frame rate.
+
+    A clock that is not realtime runs exactly one tick per frame and never sleeps.
+    """
+    def __init__(self, render_fps: int, realtime: bool = True, max_ticks_per_frame: int = 8,
+                 time_source=time.perf_counter):
+        self.render_fps = render_fps
+        self.realtime = realtime
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.time_source = time_source
+        self.render_clock = pygame.time.Clock()
+        self.reset()
+
+    def reset(self):
+        """ Forgets accumulated time, e.g. after a pause. The next frame runs one tick. """
+        self.last_time = None
+        self.accumulator = 0
+        self.alpha = 1
+
+    def begin_frame(self, tick_rate: float) -> int:
+        """ RETURNS: Number of simulation ticks to run before drawing this frame. """
+        if not self.realtime:
+            return 1
+
+        now = self.time_source()
+        tick_length = 1 / tick_rate
+        if self.last_time is None:
+            self.accumulator = tick_length
+        else:
+            self.accumulator += now - self.last_time
+        self.last_time = now
+
+        ticks = int(self.accumulator / tick_length)
+        if ticks > self.max_ticks_per_frame:
+            #Too far behind to catch up, drop the time instead of spiralling
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0
+        else:
+            self.accumulator -= ticks * tick_length
+        self.alpha = self.accumulator / tick_length
+        return ticks
+
+    def wait_for_next_frame(self):
+        if self.realtime:
+            self.render_clock.tick(self.render_fps)
@@ -0,0 +1,73 @@
+import pygame
+
+class FrameCompositor():
+    """
+    Collects the screen regions drawn to during a frame and pushes only those regions
+    to the display. Falls back to a full display update when the damaged area is large
+    enough that tracking it no longer pays off.
+    """
+    def __init__(self, screen_rect: pygame.Rect, full_update_ratio: float = 0.5, max_rects: int = 64):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.full_update_area = self.screen_rect.width * self.screen_rect.height * full_update_ratio
+        self.max_rects = max_rects
+
+        self.damaged = []
+        self.damaged_area = 0
+        self.full_update = True
+
+    def add(self, rect: pygame.Rect):
+        if self.full_update or not rect:
+            return
+        rect = rect.clip(self.screen_rect)
+        if not rect:
+            return
+        self.damaged.append(rect)
+        self.damaged_area += rect.width * rect.height
+        if self.damaged_area > self.full_update_area:
+            self.invalidate_all()
+
+    def add_all(self, rects: list):
+        for rect in rects:
+            self.add(rect)
+
+    def invalidate_all(self):
+        """ Marks the whole screen as damaged for the current frame. """
+        self.full_update = True
+        self.damaged = []
+
+    def clear(self):
+        self.damaged = []
+        self.damaged_area = 0
+        self.full_update = False
+
+    def get_update_rects(self) -> list:
+        """
+        RETURNS: Non-overlapping rects covering the frame's damage, or None when
+        the whole screen should be pushed.
+        """
+        if self.full_update:
+            return None
+        merged = merge_rects(self.damaged)
+        if len(merged) > self.max_rects:
+            return None
+        return merged
+
+    def present(self):
+        """ Pushes the frame's damage to the display and starts a new frame. """
+        rects = self.get_update_rects()
+        if rects is None:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+        self.clear()
+
+def merge_rects(rects: list) -> list:
+    """ Unions overlapping rects until none of the returned rects overlap. """
+    merged = []
+    for rect in sorted(rects, key=lambda rect: rect.x):
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
@@ -1,12 +1,16 @@
+import os
+
 GAME_NAME = "Sky Scroller"
 
-MAIN_DIRECTORY = "side_scroller/"
+MAIN_DIRECTORY = f"{os.path.dirname(os.path.abspath(__file__))}/"
 
 IMAGE_PATH = f"{MAIN_DIRECTORY}img/"
 OBSTACLE_PATH = f"{IMAGE_PATH}obstacles/"
 PLAYER_PATH = f"{IMAGE_PATH}player/"
+ATLAS_IMAGE_PATH = f"{IMAGE_PATH}atlas.png"
+ATLAS_INDEX_PATH = f"{IMAGE_PATH}atlas.json"
 
-SCORE_PATH = f"{MAIN_DIRECTORY}/score/"
+SCORE_PATH = f"{MAIN_DIRECTORY}score/"
 
 #region Initializing Colors
 BLACK = (0, 0, 0)
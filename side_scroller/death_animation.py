@@ -2,59 +2,80 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from side_scroller.game import Game
-import pygame
 from side_scroller.settings import GameSettings
+from side_scroller.player import Player
+from side_scroller.scenes import Scene, run_scenes, if_necessary_quit_game
 
 def display_player_death_animation(current_game: Game):
-    obstacles_in_player_path_y = [(obstacle.image, obstacle.rect) for obstacle in current_game.get_obstacles_in_player_path_y()]
-
-    current_game.player.blink_white(current_game)
-    _move_player_up(current_game, obstacles_in_player_path_y)
-    _drop_player_off_screen(current_game, obstacles_in_player_path_y)
-
-def _move_player_up(current_game: Game, obstacles_in_player_path_y: list):
-    for _ in range(1, GameSettings.death_raise_duration):
-        current_game.refresh_player_location_background()
-
-        current_game.player.decrease_y_axis(GameSettings.death_raise_speed, False)
-        current_game.screen.blit(
-            current_game.player.neutral,
-            (current_game.player.x, current_game.player.y)
-        )
-
-        current_game.screen.blits(
-            obstacles_in_player_path_y
-        )
-
-        pygame.display.update()
-        current_game.tick_game_fps_clock()
-
-def _drop_player_off_screen(current_game: Game, obstacles_in_player_path_y: list):
-    count = 0
-    player_height = current_game.player.down.get_rect().height
-
-    while not _is_player_off_screen_bottom(current_game, player_height):
-        current_game.refresh_player_location_background()
-
-        current_game.player.increase_y_axis(
-            current_game.player.game_settings.death_fall_speed,
-            False)
-
-        current_game.screen.blit(
-            current_game.player.down,
-            (current_game.player.x, current_game.player.y)
-        )
-        current_game.screen.blits(
-            obstacles_in_player_path_y
-        )
-
-        pygame.display.update()
-        current_game.tick_game_fps_clock()
-
-        count += 1
-        if count % current_game.player.game_settings.death_acceleration_frequency == 0:
-            current_game.player.game_settings.increase_death_fall_speed()
-            count = 0
+    run_scenes(DeathAnimationScene(current_game))
+
+class DeathAnimationScene(Scene):
+    """
+    Blinks the player white, raises it briefly, then drops it off the bottom of the
+    screen. Draws one frame per update.
+    """
+    def __init__(self, current_game: Game):
+        self.game = current_game
+        self.obstacles_in_player_path_y = [
+            (obstacle.image, obstacle.rect) for obstacle in current_game.get_obstacles_in_player_path_y()]
+        self.player_height = current_game.player.down.get_rect().height
+        self.step = self._blink_white
+        self.frame = 0
+        self.image = f"{current_game.player.orientation}_white"
+        self.fall_count = 0
+
+    def update(self):
+        if not self.game.headless:
+            if_necessary_quit_game()
+        self.frame += 1
+        self.step()
+        if self.step is None:
+            return None
+
+        self.game.update_display()
+        self.game.tick_game_fps_clock()
+        return self
+
+    def _next_step(self, step):
+        self.step = step
+        self.frame = 0
+
+    def _blink_white(self):
+        player = self.game.player
+        self.game.blit(getattr(player, self.image), (player.x, player.y))
+
+        if self.frame % GameSettings.death_white_frequency == 0:
+            self.image = Player._get_inverse_image(self.image)
+        if self.frame >= GameSettings.death_white_duration - 1:
+            self._next_step(self._move_player_up)
+
+    def _move_player_up(self):
+        player = self.game.player
+        self.game.refresh_player_location_background()
+
+        player.decrease_y_axis(GameSettings.death_raise_speed, False)
+        self.game.blit(player.neutral, (player.x, player.y))
+        self.game.blits(self.obstacles_in_player_path_y)
+
+        if self.frame >= GameSettings.death_raise_duration - 1:
+            self._next_step(self._drop_player_off_screen)
+
+    def _drop_player_off_screen(self):
+        player = self.game.player
+        if _is_player_off_screen_bottom(self.game, self.player_height):
+            self.step = None
+            return
+
+        self.game.refresh_player_location_background()
+
+        player.increase_y_axis(player.game_settings.death_fall_speed, False)
+        self.game.blit(player.down, (player.x, player.y))
+        self.game.blits(self.obstacles_in_player_path_y)
+
+        self.fall_count += 1
+        if self.fall_count % player.game_settings.death_acceleration_frequency == 0:
+            player.game_settings.increase_death_fall_speed()
+            self.fall_count = 0
 
 def _is_player_off_screen_bottom(current_game: Game, player_height: int=None):
     """
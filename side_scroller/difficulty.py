@@ -0,0 +1,156 @@
+"""
+The difficulty curve as a table indexed by level.
+
+The simulation always runs at GameSettings.minFps ticks per second, so every column is
+per tick. speed_scale multiplies how far obstacles and the player move each tick. It
+climbs by fpsTick / minFps per level up to maxFps / minFps, the pace raising the tick rate
+from minFps to maxFps used to give. After that obstacle_speed adds pixels per tick and
+level_speed_boost adds to the player's speed. spawn_interval is in ticks.
+
+Each level-up used to work out the next level's values from the previous level's through
+branching updates. DifficultyTable runs those rules once, up to the level where every value
+either stops changing or grows by the same step each level, and answers every later level
+from that last row. get_difficulty_table rebuilds the table only when a setting it depends
+on changed.
+
+Spawn intervals shrink every frequencyTick / levelTick levels: by obstacle_tick_adjustment
+while they are larger than it, by halving after that, but never below min_obstacle_frequency.
+Without the floor the halving reaches zero, which spawns an obstacle every tick.
+
+Usage: python -m side_scroller.difficulty --levels 60 --output difficulty.csv
+"""
+import argparse
+import csv
+import json
+import numpy as np
+from side_scroller.settings import GameSettings
+
+COLUMNS = ("speed_scale", "obstacle_speed", "spawn_interval", "level_speed_boost")
+
+#Settings the table is built from
+DIFFICULTY_SETTINGS = ("minFps", "maxFps", "fpsTick", "levelTick", "frequencyTick", "obstacle_frequency",
+                       "obstacle_tick_adjustment", "min_obstacle_frequency", "obstacle_tick_speed_adjustments")
+
+MAX_TABLE_LEVELS = 10000
+
+class DifficultyLevel():
+    """ One row of the table. level_speed_boost is the total boost earned by this level. """
+    __slots__ = ("level",) + COLUMNS
+
+    def __init__(self, level: int, speed_scale: float, obstacle_speed: float, spawn_interval: float,
+                 level_speed_boost: float):
+        self.level = level
+        self.speed_scale = speed_scale
+        self.obstacle_speed = obstacle_speed
+        self.spawn_interval = spawn_interval
+        self.level_speed_boost = level_speed_boost
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class DifficultyTable():
+    """
+    Per-tick difficulty values of each level, starting at level 1. Levels past the last row
+    only add obstacle speed and player speed boost, at a fixed step per level.
+    """
+    def __init__(self, settings=GameSettings):
+        self.settings_key = get_settings_key(settings)
+        self.speed_step = settings.obstacle_tick_speed_adjustments
+        self.boost_step = settings.obstacle_tick_speed_adjustments / 2
+        self.frequency_levels = max(1, round(settings.frequencyTick / settings.levelTick))
+
+        pace = settings.minFps
+        obstacle_speed = 0
+        spawn_interval = settings.obstacle_frequency
+        boost = 0
+        self.rows = []
+        while True:
+            level = len(self.rows) + 1
+            self.rows.append(DifficultyLevel(level, pace / settings.minFps, obstacle_speed, spawn_interval, boost))
+
+            next_interval = spawn_interval
+            if level % self.frequency_levels == 0:
+                next_interval = get_next_spawn_interval(spawn_interval, settings)
+            if (pace >= settings.maxFps and get_next_spawn_interval(spawn_interval, settings) == spawn_interval) \
+                    or level >= MAX_TABLE_LEVELS:
+                break
+
+            if pace < settings.maxFps:
+                pace += settings.fpsTick
+            else:
+                obstacle_speed += self.speed_step
+                boost += self.boost_step
+            spawn_interval = next_interval
+
+        self.columns = {name: np.array([getattr(row, name) for row in self.rows], dtype=float)
+                        for name in COLUMNS}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, level: int) -> DifficultyLevel:
+        """ RETURNS: The difficulty of level. """
+        if level <= len(self.rows):
+            return self.rows[max(level, 1) - 1]
+        last = self.rows[-1]
+        extra_levels = level - last.level
+        return DifficultyLevel(level, last.speed_scale, last.obstacle_speed + self.speed_step * extra_levels,
+                               last.spawn_interval, last.level_speed_boost + self.boost_step * extra_levels)
+
+    def lookup(self, column: str, levels: np.ndarray) -> np.ndarray:
+        """ RETURNS: column's value at each of levels, for updating many games at once. """
+        levels = np.asarray(levels)
+        index = np.clip(levels, 1, len(self.rows)) - 1
+        values = self.columns[column][index]
+        step = {"obstacle_speed": self.speed_step, "level_speed_boost": self.boost_step}.get(column)
+        if step:
+            values = values + np.maximum(levels - len(self.rows), 0) * step
+        return values
+
+    def export(self, path: str, levels: int = None):
+        """ Writes levels 1 through levels, by default the stored rows, as CSV or else JSON by extension. """
+        rows = [self.get(level).as_dict() for level in range(1, (levels or len(self.rows)) + 1)]
+        with open(path, "w", newline="") as export_file:
+            if path.endswith(".csv"):
+                writer = csv.DictWriter(export_file, fieldnames=list(DifficultyLevel.__slots__))
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                json.dump(rows, export_file, indent=2)
+
+def get_next_spawn_interval(spawn_interval: float, settings=GameSettings) -> float:
+    if spawn_interval > settings.obstacle_tick_adjustment:
+        spawn_interval -= settings.obstacle_tick_adjustment
+    else:
+        spawn_interval = int(spawn_interval / 2)
+    return max(spawn_interval, settings.min_obstacle_frequency)
+
+def get_settings_key(settings=GameSettings) -> tuple:
+    return tuple(getattr(settings, name) for name in DIFFICULTY_SETTINGS)
+
+_table = None
+
+def get_difficulty_table() -> DifficultyTable:
+    """ RETURNS: The table for the current GameSettings, rebuilt only after they change. """
+    global _table
+    if _table is None or _table.settings_key != get_settings_key():
+        _table = DifficultyTable()
+    return _table
+
+def main():
+    parser = argparse.ArgumentParser(description="Print or export the difficulty of each level.")
+    parser.add_argument("--levels", type=int, help="Levels to include. Defaults to the stored rows.")
+    parser.add_argument("--output", help="Write the table here, as CSV for .csv paths and JSON otherwise.")
+    args = parser.parse_args()
+
+    table = get_difficulty_table()
+    if args.output:
+        table.export(args.output, args.levels)
+        return
+    print(f"{'level':>6}{'scale':>8}{'speed':>8}{'interval':>10}{'boost':>8}")
+    for level in range(1, (args.levels or len(table)) + 1):
+        row = table.get(level)
+        print(f"{row.level:>6}{row.speed_scale:>8.3g}{row.obstacle_speed:>8g}{row.spawn_interval:>10g}{row.level_speed_boost:>8g}")
+
+if __name__ == "__main__":
+    main()
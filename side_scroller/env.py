@@ -0,0 +1,353 @@
+"""
+Gym-style environments for training agents.
+
+SideScrollerEnv wraps a headless Game and steps it one simulation tick per action.
+VectorSideScrollerEnv steps many independent games in lockstep. It keeps every game's
+state in NumPy arrays and applies the rules of simulate_tick, states.py and
+move_obstacles to all of them at once, so the cost of a step barely depends on how
+many games there are. It collides on the player's hitbox rects, as the game does with
+GameSettings.pixel_perfect_collision turned off.
+
+Actions are 0 (no key), 1 (up) and 2 (down). Observations are float32:
+    player y / screen height, orientation one-hot (neutral, up, down),
+    then for the nearest obstacles that have not passed the player, left to right:
+    x distance / screen width, y / screen height, width / screen width, height / screen height.
+Missing obstacles read as (1, 0, 0, 0). The reward is the score gained during the step.
+"""
+import numpy as np
+from side_scroller.game import Game
+from side_scroller.inputs import NO_KEYS, UP_KEYS, DOWN_KEYS
+from side_scroller.obstacle import Obstacle
+from side_scroller.leaderboard import Leaderboard
+from side_scroller.score import Score
+from side_scroller.player import Player, DIRECTIONS
+from side_scroller.settings import GameSettings
+from side_scroller.difficulty import get_difficulty_table
+from side_scroller.side_scroller import simulate_tick
+
+ACTION_KEYS = (NO_KEYS, UP_KEYS, DOWN_KEYS)
+ORIENTATIONS = {name: index for index, name in DIRECTIONS.items()}
+NEUTRAL, UP, DOWN = 0, 1, 2
+OBSTACLE_FEATURES = 4
+
+def get_observation_size(nearest_obstacles: int) -> int:
+    return 4 + OBSTACLE_FEATURES * nearest_obstacles
+
+def build_observations(player_y: np.ndarray, orientation: np.ndarray, player_x: int,
+                       x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray,
+                       active: np.ndarray, nearest_obstacles: int) -> np.ndarray:
+    """
+    Builds one observation row per game. Player arrays have shape (games,) and
+    obstacle arrays (games, obstacle slots).
+    """
+    games = len(player_y)
+    observations = np.zeros((games, get_observation_size(nearest_obstacles)), dtype=np.float32)
+    observations[:, 0] = player_y / GameSettings.height
+    observations[np.arange(games), 1 + orientation] = 1
+
+    ahead = active & (x + width > player_x)
+    order = np.argsort(np.where(ahead, x, np.iinfo(np.int32).max), axis=1, kind="stable")[:, :nearest_obstacles]
+    found = np.take_along_axis(ahead, order, axis=1)
+    features = np.stack([
+        (np.take_along_axis(x, order, axis=1) - player_x) / GameSettings.width,
+        np.take_along_axis(y, order, axis=1) / GameSettings.height,
+        np.take_along_axis(width, order, axis=1) / GameSettings.width,
+        np.take_along_axis(height, order, axis=1) / GameSettings.height], axis=2)
+    features[~found] = (1, 0, 0, 0)
+
+    slots = features.shape[1]
+    observations[:, 4:4 + slots * OBSTACLE_FEATURES] = features.reshape(games, -1)
+    observations[:, 4 + slots * OBSTACLE_FEATURES::OBSTACLE_FEATURES] = 1
+    return observations
+
+class SideScrollerEnv():
+    """ One headless game advanced a simulation tick per step. """
+    def __init__(self, nearest_obstacles: int = 4, seed: int = None):
+        self.nearest_obstacles = nearest_obstacles
+        self.action = NEUTRAL
+        self.game = Game(headless=True, render=False, input_source=self.get_action_keys, seed=seed)
+        #Training runs keep their high scores in memory, off the saved leaderboard
+        self.game.player.score = Score(Leaderboard())
+        self.next_seed = seed
+
+    @property
+    def observation_size(self) -> int:
+        return get_observation_size(self.nearest_obstacles)
+
+    def get_action_keys(self):
+        return ACTION_KEYS[self.action]
+
+    def reset(self, seed: int = None) -> np.ndarray:
+        if seed is None:
+            seed = self.next_seed
+        self.next_seed = None
+        self.game.prepare_new_game(seed)
+        self.action = NEUTRAL
+        return self.get_observation()
+
+    def step(self, action: int) -> tuple:
+        """ RETURNS: (observation, reward, done, info). """
+        score = self.game.player.score
+        previous_score = score.score
+        self.action = action
+        done = simulate_tick(self.game)
+        info = {"score": score.score, "level": score.level}
+        return self.get_observation(), score.score - previous_score, done, info
+
+    def get_observation(self) -> np.ndarray:
+        player = self.game.player
+        store = self.game.obstacles
+        return build_observations(
+            np.array([player.y]), np.array([ORIENTATIONS[player.orientation]]), player.x,
+            store.x[None], store.y[None], store.width[None], store.height[None], store.active[None],
+            self.nearest_obstacles)[0]
+
+class VectorSideScrollerEnv():
+    """
+    games independent games stepped in lockstep with batched array math. A game that
+    ends is reset straight away: its observation is the first of the next run, and the
+    ended run's score is reported in info["final_score"].
+    """
+    def __init__(self, games: int, nearest_obstacles: int = 4, seed: int = None, obstacle_capacity: int = 32):
+        self.games = games
+        self.nearest_obstacles = nearest_obstacles
+        self.rng = np.random.default_rng(seed)
+
+        self.player_x = 0
+        self.player_width = Player.width
+        self.player_height = Player.height
+        self.half_width = round(Player.width / 2)
+        self.half_height = round(Player.height / 2)
+        self.y_bottom_barrier = Player.y_bottom_barrier
+        self.image_widths = np.array([image.get_width() for image in Obstacle.images], dtype=np.int32)
+        self.image_heights = np.array([image.get_height() for image in Obstacle.images], dtype=np.int32)
+
+        self.y = np.zeros(games, dtype=np.int64)
+        self.orientation = np.zeros(games, dtype=np.int64)
+        self.counter_direction = np.zeros(games, dtype=np.int64)
+        self.counter_count = np.zeros(games, dtype=np.int64)
+        self.current_speed = np.zeros(games, dtype=np.int64)
+        self.level_speed_boost = np.zeros(games)
+        self.progress_to_move = np.zeros(games)
+        self.neutral_count = np.zeros(games)
+        self.score = np.zeros(games)
+        self.level = np.zeros(games, dtype=np.int64)
+        self.count_to_obstacle_tick = np.zeros(games)
+        self.count_to_level_tick = np.zeros(games)
+        self.speed_scale = np.zeros(games)
+        self.obstacle_speed = np.zeros(games)
+        self.spawn_interval = np.zeros(games)
+
+        shape = (games, obstacle_capacity)
+        self.obstacle_x = np.zeros(shape, dtype=np.int32)
+        self.obstacle_x_remainder = np.zeros(shape)
+        self.obstacle_y = np.zeros(shape, dtype=np.int32)
+        self.obstacle_width = np.zeros(shape, dtype=np.int32)
+        self.obstacle_height = np.zeros(shape, dtype=np.int32)
+        self.obstacle_speed_offset = np.zeros(shape, dtype=np.int32)
+        self.obstacle_active = np.zeros(shape, dtype=bool)
+
+    @property
+    def observation_size(self) -> int:
+        return get_observation_size(self.nearest_obstacles)
+
+    def reset(self) -> np.ndarray:
+        """ Starts every game over. RETURNS: Observations with shape (games, observation size). """
+        self.reset_games(np.ones(self.games, dtype=bool))
+        return self.get_observations()
+
+    def reset_games(self, mask: np.ndarray):
+        """ Starts the masked games over, like Game.prepare_new_game. """
+        count = int(mask.sum())
+        quarter_window = GameSettings.height // 4
+        self.y[mask] = quarter_window * 2 + self.rng.integers(-quarter_window, quarter_window, count)
+        self.orientation[mask] = NEUTRAL
+        self.counter_direction[mask] = NEUTRAL
+        self.counter_count[mask] = 0
+        self.current_speed[mask] = GameSettings.minSpeed
+        self.level_speed_boost[mask] = 0
+        self.progress_to_move[mask] = 0
+        self.neutral_count[mask] = 0
+        self.score[mask] = 0
+        self.level[mask] = 1
+        self.count_to_obstacle_tick[mask] = 0
+        self.count_to_level_tick[mask] = 0
+        self.speed_scale[mask] = 1
+        self.obstacle_speed[mask] = 0
+        self.spawn_interval[mask] = GameSettings.obstacle_frequency
+        self.obstacle_active[mask] = False
+
+    def step(self, actions: np.ndarray) -> tuple:
+        """
+        Advances every game one simulation tick.
+
+        RETURNS: (observations, rewards, dones, info), one row or value per game.
+        """
+        actions = np.asarray(actions)
+        rewards = np.ones(self.games)
+        self.score += rewards
+
+        self.respond_to_actions(actions)
+        self.tick_adjustments()
+        self.move_obstacles()
+        dones = self.get_collisions()
+
+        info = {"score": self.score.copy(), "level": self.level.copy(), "final_score": np.where(dones, self.score, np.nan)}
+        if dones.any():
+            self.reset_games(dones)
+        return self.get_observations(), rewards, dones, info
+
+    def respond_to_actions(self, actions: np.ndarray):
+        """ respond_to_key_press and the key states of states.py for every game at once. """
+        up = actions == UP
+        down = ~up & ((actions == DOWN) | (self.neutral_count > GameSettings.hoverLimit))
+        neutral = ~up & ~down
+
+        previous_orientation = self.orientation.copy()
+
+        #Up key
+        self.orientation[up] = UP
+        moving = up & (self.y != 0)
+        distance = self.get_move_distance(moving, previous_orientation)
+        self.y[moving] = np.maximum(self.y[moving] - distance[moving], 0)
+        self.increase_speed_counter(moving, UP)
+        self.neutral_count[up] = 0
+
+        #Down key or hovering too long
+        self.orientation[down] = DOWN
+        moving = down & (self.y < self.y_bottom_barrier)
+        distance = self.get_move_distance(moving, previous_orientation)
+        self.y[moving] = np.minimum(self.y[moving] + distance[moving], self.y_bottom_barrier)
+        self.neutral_count[down & (self.neutral_count <= GameSettings.hoverLimit)] = 0
+        self.increase_speed_counter(down, DOWN)
+
+        #No key
+        stopping = neutral & (self.counter_direction == UP)
+        self.reset_speed(stopping)
+        self.orientation[stopping] = NEUTRAL
+        falling = neutral & (self.counter_direction == DOWN) & (self.y < self.y_bottom_barrier)
+        distance = self.get_move_distance(falling, previous_orientation)
+        self.y[falling] = np.minimum(self.y[falling] + distance[falling], self.y_bottom_barrier)
+        self.orientation[falling] = DOWN
+        self.neutral_count[neutral] += 1
+
+    def get_move_distance(self, mask: np.ndarray, previous_orientation: np.ndarray) -> np.ndarray:
+        """ Player.get_move_distance for the masked games. RETURNS: Pixels each game moves, 0 outside mask. """
+        turned = mask & (previous_orientation != self.orientation)
+        self.progress_to_move[turned] = 0
+        going = mask & ~turned
+        step = self.current_speed + np.trunc(self.level_speed_boost).astype(np.int64)
+        self.progress_to_move[going] += step[going] * self.speed_scale[going]
+        distance = np.zeros(self.games, dtype=np.int64)
+        distance[going] = self.progress_to_move[going].astype(np.int64)
+        self.progress_to_move[going] -= distance[going]
+        return distance
+
+    def reset_speed(self, mask: np.ndarray):
+        self.counter_count[mask] = 0
+        self.current_speed[mask] = GameSettings.minSpeed
+        self.level_speed_boost[mask] = 0
+        self.progress_to_move[mask] = 0
+
+    def increase_speed_counter(self, mask: np.ndarray, direction: int):
+        """ Player.increase_speed_counter for the masked games. """
+        turned = mask & (self.counter_direction != direction)
+        self.reset_speed(turned)
+        self.counter_direction[turned] = direction
+
+        counting = mask & (self.current_speed != GameSettings.maxSpeed)
+        self.counter_count[counting] += 1
+        self.current_speed[counting & (self.counter_count % GameSettings.speed_increment_count == 0)] += 1
+
+    def tick_adjustments(self):
+        self.count_to_obstacle_tick += 1
+        self.count_to_level_tick += 1
+
+        spawning = self.count_to_obstacle_tick > self.spawn_interval
+        if spawning.any():
+            self.add_obstacles(np.flatnonzero(spawning))
+            self.count_to_obstacle_tick[spawning] -= self.spawn_interval[spawning]
+
+        leveling = self.count_to_level_tick > GameSettings.levelTick
+        if not leveling.any():
+            return
+        self.count_to_level_tick[leveling] -= GameSettings.levelTick
+        previous_levels = self.level[leveling]
+        levels = previous_levels + 1
+        self.level[leveling] = levels
+
+        difficulty = get_difficulty_table()
+        self.speed_scale[leveling] = difficulty.lookup("speed_scale", levels)
+        self.obstacle_speed[leveling] = difficulty.lookup("obstacle_speed", levels)
+        self.spawn_interval[leveling] = difficulty.lookup("spawn_interval", levels)
+        self.level_speed_boost[leveling] += (difficulty.lookup("level_speed_boost", levels)
+                                             - difficulty.lookup("level_speed_boost", previous_levels))
+
+    def add_obstacles(self, games: np.ndarray):
+        """ Spawns one obstacle in each of the given games, like the spawn scheduler. """
+        if self.obstacle_active[games].all(axis=1).any():
+            self.grow_obstacles()
+        slots = np.argmin(self.obstacle_active[games], axis=1)
+        count = len(games)
+
+        x = self.rng.integers(GameSettings.width, GameSettings.width + 50, count)
+        y = self.rng.integers(0, GameSettings.height, count)
+        image_index = self.rng.integers(0, len(self.image_widths), count)
+        width = self.image_widths[image_index]
+        height = self.image_heights[image_index]
+
+        self.obstacle_x[games, slots] = x + width
+        self.obstacle_x_remainder[games, slots] = 0
+        self.obstacle_y[games, slots] = np.minimum(y, GameSettings.height - height)
+        self.obstacle_width[games, slots] = width
+        self.obstacle_height[games, slots] = height
+        self.obstacle_speed_offset[games, slots] = self.rng.integers(1, 3, count)
+        self.obstacle_active[games, slots] = True
+
+    def grow_obstacles(self):
+        for name in ("obstacle_x", "obstacle_x_remainder", "obstacle_y", "obstacle_width", "obstacle_height",
+                     "obstacle_speed_offset", "obstacle_active"):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)], axis=1))
+
+    def move_obstacles(self):
+        base_shift = np.trunc(self.obstacle_speed + self.level).astype(np.int32)
+        distance = (base_shift[:, None] + self.obstacle_speed_offset) * self.speed_scale[:, None] + self.obstacle_x_remainder
+        steps = np.where(self.obstacle_active, distance.astype(np.int32), 0)
+        self.obstacle_x_remainder = np.where(self.obstacle_active, distance - steps, 0)
+        self.obstacle_x -= steps
+        self.obstacle_active &= self.obstacle_x >= -self.obstacle_width
+
+    def get_hitboxes(self) -> tuple:
+        """ RETURNS: Two (x, y, width, height) hitboxes per game for its orientation, as arrays. """
+        ones = np.ones(self.games, dtype=np.int64)
+        is_up = self.orientation == UP
+        is_down = self.orientation == DOWN
+        first = (
+            self.player_x * ones,
+            np.where(is_down, self.y + self.half_height, self.y),
+            self.player_width * ones,
+            np.where(is_up | is_down, self.half_height, self.player_height))
+        second = (
+            self.player_x * ones,
+            self.y,
+            np.where(is_up | is_down, self.half_width, self.player_width),
+            self.player_height * ones)
+        return first, second
+
+    def get_collisions(self) -> np.ndarray:
+        """ RETURNS: Mask of games whose player hitboxes overlap an obstacle. """
+        colliding = np.zeros(self.games, dtype=bool)
+        for x, y, width, height in self.get_hitboxes():
+            overlap = (self.obstacle_active
+                       & (self.obstacle_x < (x + width)[:, None])
+                       & (x[:, None] < self.obstacle_x + self.obstacle_width)
+                       & (self.obstacle_y < (y + height)[:, None])
+                       & (y[:, None] < self.obstacle_y + self.obstacle_height))
+            colliding |= overlap.any(axis=1)
+        return colliding
+
+    def get_observations(self) -> np.ndarray:
+        return build_observations(
+            self.y, self.orientation, self.player_x, self.obstacle_x, self.obstacle_y,
+            self.obstacle_width, self.obstacle_height, self.obstacle_active, self.nearest_obstacles)
@@ -1,87 +1,263 @@
+import random
 import pygame
 from side_scroller.constants import BLACK
 from side_scroller.settings import GameSettings, Fonts
-from side_scroller.player import Player, Hitbox
+from side_scroller.player import Player
+from side_scroller.obstacle import ObstacleStore
+from side_scroller.compositor import FrameCompositor
+from side_scroller.assets import assets
+from side_scroller.clock import SimulationClock
+from side_scroller.text import get_digit_atlas
+from side_scroller.profiler import NULL_PROFILER
+from side_scroller.spawner import SpawnScheduler
+from side_scroller.difficulty import get_difficulty_table
+from side_scroller.render_scale import RenderScaler
+from side_scroller.render_queue import RenderQueue
 from side_scroller.constants import GAME_NAME
 
+#Seeds wrap into 64 bits, the size a replay header stores
+SEED_MASK = 2 ** 64 - 1
+
+class NullSurface():
+    """
+    Surface stand-in for headless games that skip rendering. Drawing calls are no-ops.
+    """
+    def __init__(self, size: tuple):
+        self.size = size
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return pygame.Rect(0, 0, 0, 0)
+
+    def blits(self, blit_sequence, doreturn=1):
+        return [] if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        return pygame.Rect(0, 0, 0, 0)
+
+    def copy(self):
+        return self
+
+    def get_size(self):
+        return self.size
+
+    def get_rect(self, **kwargs):
+        return pygame.Rect((0, 0), self.size)
+
 class Game():
 
-    def __init__(self):
+    def __init__(self, headless: bool = False, render: bool = True, input_source=None, seed: int = None,
+                 profiler=None, render_scale: float = None):
+        """
+        headless: Draw to an off-screen surface instead of a window and never sleep on the clock.
+        render: When False (headless only), drawing calls become no-ops.
+        input_source: Callable returning the pressed key state. Defaults to pygame.key.get_pressed.
+        seed: Seed for this game's random numbers. Picked at random when not given.
+        profiler: FrameProfiler timing each frame's phases. Defaults to one that does nothing.
+        render_scale: Internal resolution relative to the window. Defaults to GameSettings.render_scale.
+        """
+        self.reseed(seed)
+        self.headless = headless
+        self.render = render or not headless
+        self.input_source = input_source or pygame.key.get_pressed
+        self.profiler = profiler or NULL_PROFILER
+        self.frame_recorder = None
+        self.ghost = None
+
+        if render_scale is None:
+            render_scale = GameSettings.render_scale
+        self.scaler = RenderScaler(render_scale) if self.render and render_scale != 1 else None
+
         self.player = Player(0, Player.y_bottom_barrier)
-        self.screen = pygame.display.set_mode((GameSettings.width, GameSettings.height))
+        self.player_path_y = pygame.Rect(0, 0, Player.width, GameSettings.height)
+        self.screen_rect = pygame.Rect(0, 0, GameSettings.width, GameSettings.height)
+        self.window = self.create_screen()
+        self.screen = self.create_render_target()
+        self.compositor = FrameCompositor(
+            self.screen.get_rect(), GameSettings.full_update_area_ratio, GameSettings.max_dirty_rects)
+        self.render_queue = RenderQueue(self.screen_rect)
 
-        self.game_fps = GameSettings.minFps
         self.fps_clock = pygame.time.Clock()
-        self.fps_over_min = 1
-        self.per_loop_adjustment = 1
+        self.simulation_clock = SimulationClock(GameSettings.render_fps, realtime=not headless)
+        self.drawn_rects = []
+        self.hud_value = None
+        self.hud_rect = pygame.Rect(0, 0, 0, 0)
 
         self.neutral_count = 0
-        self.obstacles = list()
+        self.pause_requested = False
+        self.obstacles = ObstacleStore()
+        self.difficulty = get_difficulty_table()
+        self.spawn_scheduler = SpawnScheduler(self.rng, self.difficulty)
 
         self.initialize_game()
 
+    def create_screen(self):
+        size = (GameSettings.width, GameSettings.height)
+        if not self.headless:
+            return pygame.display.set_mode(size)
+        if self.render:
+            return pygame.Surface(size)
+        return NullSurface(size)
+
+    def create_render_target(self):
+        """
+        The surface everything is drawn to. The window itself, unless rendering at another
+        scale, in which case update_display scales it onto the window.
+        """
+        if self.scaler is None:
+            return self.window
+        return pygame.Surface(self.scaler.scale_size(self.window.get_size()))
+
     def initialize_game(self):
-        pygame.init()
-        pygame.display.set_caption(GAME_NAME)
+        if not self.headless:
+            pygame.init()
+            pygame.display.set_caption(GAME_NAME)
+            assets.convert()
         self.initialize_background()
 
     def initialize_background(self):
-        self.screen.blit(GameSettings.background.image, GameSettings.background.rect)
+        self.render_queue.clear()
+        self.blit(GameSettings.background.image, GameSettings.background.rect)
+        self.compositor.invalidate_all()
+        self.hud_value = None
 
     def refresh_player_location_background(self):
-        self.screen.blit(GameSettings.background.image, self.player.rect, self.player.rect)
+        self.blit(GameSettings.background.image, self.player.rect, self.player.rect)
 
-    def update_score_hud(self):
-        score_text = Fonts.hud_font.render(
-            f"Score: {int(self.player.score.score)}", True, BLACK
-        )
+    def erase_drawn_sprites(self):
+        """ Queues restoring the background under everything drawn by draw_player and draw_obstacles. """
+        background = GameSettings.background.image
+        self.render_queue.extend([(background, rect, rect) for rect in self.drawn_rects])
+        if self.hud_rect.collidelist(self.drawn_rects) != -1:
+            self.hud_value = None
+        self.drawn_rects = []
 
-        self.screen.blit(
-            GameSettings.background.image,
-            score_text.get_rect(),
-            score_text.get_rect())
+    def draw_player(self, alpha: float = 1, player=None):
+        """
+        Queues the player between its last two simulated positions.
+        player: Draw this snapshot of the player instead of the live one.
+        """
+        if player is None:
+            player = self.player
+        self.render_queue.submit(
+            player.get_display_image(), (player.x, player.get_interpolated_y(alpha)), track=True)
 
-        self.screen.blit(score_text, score_text.get_rect())
+    def flush_render_queue(self):
+        """ Draws the frame's queued commands, keeping the sprite regions for erase_drawn_sprites. """
+        self.drawn_rects.extend(self.render_queue.flush(self))
+
+    def blit(self, source: pygame.Surface, dest, area=None) -> pygame.Rect:
+        """
+        Draws onto the screen and marks the drawn region for the next display update.
+        dest and area are in window coordinates whatever the render scale.
+
+        RETURNS: The drawn region in window coordinates.
+        """
+        if self.scaler is None:
+            rect = self.screen.blit(source, dest, area)
+            self.compositor.add(rect)
+            return rect
+
+        self.compositor.add(self.screen.blit(*self.scaler.map_blit(source, dest, area)))
+        return self.get_window_rect(source, dest, area)
+
+    def blits(self, blit_sequence: list) -> list:
+        """ Surface.blits counterpart of blit. """
+        if self.scaler is None:
+            rects = self.screen.blits(blit_sequence)
+            self.compositor.add_all(rects)
+            return rects
+
+        self.compositor.add_all(self.screen.blits([self.scaler.map_blit(*blit) for blit in blit_sequence]))
+        return [self.get_window_rect(*blit) for blit in blit_sequence]
+
+    def get_window_rect(self, source: pygame.Surface, dest, area=None) -> pygame.Rect:
+        """ RETURNS: The window region a blit covers, clipped to the window. """
+        size = source.get_size() if area is None else pygame.Rect(area).size
+        return pygame.Rect((dest[0], dest[1]), size).clip(self.screen_rect)
+
+    def update_score_hud(self, value: int = None):
+        """
+        Queues redrawing the score from cached glyphs, only when the displayed value changed.
+        value: Score to show. Defaults to the player's.
+        """
+        if not self.render:
+            return
+
+        if value is None:
+            value = int(self.player.score.score)
+        if value == self.hud_value:
+            return
+
+        blits, rect = get_digit_atlas(Fonts.hud_font, BLACK, "Score: ").layout(value)
+        stale_rect = self.hud_rect.union(rect)
+        self.render_queue.submit(GameSettings.background.image, stale_rect, stale_rect)
+        self.render_queue.extend(blits)
+
+        self.hud_value = value
+        self.hud_rect = rect
 
     def update_high_score(self):
         self.player.adjust_high_scores()
 
-    def prepare_new_game(self):
-        self.player.prepare_new_game()
-        self.obstacles = list()
+    def reseed(self, seed: int = None):
+        """
+        Starts a new random sequence. Every random choice in a game comes from self.rng.
+        seed: Any int. Wrapped into SEED_MASK, so negative seeds play a course of their own.
+        """
+        self.seed = random.getrandbits(63) if seed is None else seed & SEED_MASK
+        self.rng = random.Random(self.seed)
+
+    def prepare_new_game(self, seed: int = None):
+        self.reseed(seed)
+        self.player.prepare_new_game(self.rng)
+        self.obstacles.clear()
+        self.difficulty = get_difficulty_table()
+        self.spawn_scheduler = SpawnScheduler(self.rng, self.difficulty)
+        self.drawn_rects = []
         self.initialize_background()
         self.neutral_count = 0
+        self.pause_requested = False
 
-    def set_current_fps_over_min_fps(self):
-        self.fps_over_min = self.game_fps / GameSettings.minFps
+    def is_hover_limit_reached(self):
+        return self.neutral_count > GameSettings.hoverLimit
 
-    def set_per_loop_adjustment(self):
-        self.per_loop_adjustment = GameSettings.minFps / self.game_fps
+    def tick_game_fps_clock(self):
+        """ Holds frame-per-tick animations to the simulation tick rate. """
+        if not self.headless:
+            self.fps_clock.tick(GameSettings.minFps)
 
-    def is_hover_limit_reached(self):
-        return self.neutral_count > GameSettings.hoverLimit * self.fps_over_min
+    def wait_for_next_frame(self):
+        """ Sleeps to hold the render frame rate, which is independent of the simulation tick rate. """
+        self.simulation_clock.wait_for_next_frame()
 
-    def increase_count_to_obstacle_tick(self):
-        self.player.score.countToObstacleTick += self.per_loop_adjustment
+    def update_display(self):
+        """ Pushes the regions drawn since the last update to the window. """
+        if self.frame_recorder is not None:
+            self.frame_recorder.capture(self.screen, self.compositor.get_update_rects())
+        if self.headless:
+            self.compositor.clear()
+        elif self.scaler is None:
+            self.compositor.present()
+        else:
+            self.present_scaled()
 
-    def increase_count_to_level_tick(self):
-        self.player.score.countToLevelTick += self.per_loop_adjustment
+    def present_scaled(self):
+        """ Scales the render target onto the window and pushes the regions drawn this frame. """
+        rects = self.compositor.get_update_rects()
+        if rects is None or rects:
+            rects = self.scaler.present(self.screen, self.window, rects)
+            if rects is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(rects)
+        self.compositor.clear()
 
-    def tick_game_fps_clock(self):
-        self.fps_clock.tick(self.game_fps)
+    def get_pressed_keys(self):
+        return self.input_source()
     
     def get_obstacles_in_player_path_y(self) -> list:
         """
         Returns a list of obstacles that could be hit if the player moved along y axis.
         """
-        player_path_y = Hitbox(
-            pygame.Rect(
-                0,
-                0,
-                self.player.width,
-                10000
-            ),
-            "neutral"
-        )
-
-        return pygame.sprite.spritecollide(player_path_y, self.obstacles, False)
+        self.player_path_y.x = self.player.x
+        return self.obstacles.query(self.player_path_y)
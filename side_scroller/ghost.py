@@ -0,0 +1,352 @@
+"""
+Ghost racing: two players race the same seeded course on separate machines, each seeing
+the other as a translucent ghost. Clients talk over UDP through side_scroller.relay.
+
+Every render frame, GhostClient drains its socket and, at GameSettings.ghost_send_rate,
+sends one packet. Each packet holds a snapshot of the player's y and orientation, plus
+the keys held on every tick the peer has not acknowledged. Sends and receives never
+block: a packet the socket cannot take is dropped and the next one carries the same
+unacknowledged input. Since the course only depends on the seed, the peer's exchanged
+input replays their whole run exactly, and GhostClient.peer_replay holds it as a Replay.
+
+Snapshots are delta compressed against the last snapshot the peer acknowledged: y is
+sent as a signed byte difference when it fits, or in full otherwise.
+
+Packet layout (little-endian):
+    2s  magic b"SG"
+    B   protocol version
+    I   race, the low 32 bits of the course seed
+    B   round, counting the games raced on this course
+    H H sequence, last sequence received from the peer
+    I   tick of the snapshot
+    B   flags: orientation in bits 0-1, FULL_POSITION, ENDED, HAS_ACK
+    then h y with FULL_POSITION, otherwise H baseline sequence and b y difference,
+    then varint first input tick, B run count and (B key bits, varint ticks) runs.
+"""
+from __future__ import annotations
+import socket
+import struct
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from side_scroller.game import Game
+import pygame
+from side_scroller.settings import GameSettings
+from side_scroller.assets import assets
+from side_scroller.player import DIRECTIONS
+from side_scroller.pipeline import PlayerSnapshot
+from side_scroller.replay import Replay, ReplayError, encode_keys, write_varint, read_varint
+
+GHOST_MAGIC = b"SG"
+GHOST_VERSION = 1
+HEADER = struct.Struct("<2sBIBHH")
+SNAPSHOT = struct.Struct("<IB")
+FULL_Y = struct.Struct("<h")
+DELTA_Y = struct.Struct("<Hb")
+
+ORIENTATION_MASK = 3
+FULL_POSITION = 4
+ENDED = 8
+HAS_ACK = 16
+
+SEQUENCE_MODULO = 0x10000
+HISTORY = 64 #Snapshots kept as delta baselines, on both ends
+MAX_INPUT_TICKS = 128 #Unacknowledged ticks of input sent per packet. Fewer than the 255 runs a packet holds
+MAX_PACKET_SIZE = 1024
+
+ORIENTATIONS = list(DIRECTIONS.values())
+
+def make_ghost_variant(surface: pygame.Surface) -> pygame.Surface:
+    """ RETURNS: A copy of surface with its alpha scaled down to GameSettings.ghost_alpha. """
+    ghost = surface.copy()
+    ghost.fill((255, 255, 255, GameSettings.ghost_alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return ghost
+
+for state in ORIENTATIONS:
+    assets.register_derived_image(f"player/{state}_ghost", f"player/{state}", make_ghost_variant)
+
+def is_newer_sequence(sequence: int, other: int) -> bool:
+    """ Compares sequence numbers that wrap around at SEQUENCE_MODULO. """
+    return sequence != other and (sequence - other) % SEQUENCE_MODULO < SEQUENCE_MODULO // 2
+
+def parse_address(address: str) -> tuple:
+    """ RETURNS: (host, port) from HOST:PORT. """
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+class GhostPacket():
+    """ Decoded contents of one packet. """
+    def __init__(self, race: int, round_number: int, sequence: int, ack: int, tick: int, flags: int,
+                 y: int = 0, baseline: int = None, first_input_tick: int = 0, input_runs: list = None):
+        self.race = race
+        self.round_number = round_number
+        self.sequence = sequence
+        self.ack = ack
+        self.tick = tick
+        self.flags = flags
+        self.y = y
+        self.baseline = baseline
+        self.first_input_tick = first_input_tick
+        self.input_runs = input_runs if input_runs is not None else []
+
+    @property
+    def orientation(self) -> str:
+        return ORIENTATIONS[self.flags & ORIENTATION_MASK]
+
+    def to_bytes(self) -> bytes:
+        data = bytearray(HEADER.pack(
+            GHOST_MAGIC, GHOST_VERSION, self.race, self.round_number, self.sequence, self.ack))
+        data += SNAPSHOT.pack(self.tick, self.flags)
+        if self.flags & FULL_POSITION:
+            data += FULL_Y.pack(self.y)
+        else:
+            data += DELTA_Y.pack(self.baseline, self.y)
+        write_varint(data, self.first_input_tick)
+        data.append(len(self.input_runs))
+        for bits, count in self.input_runs:
+            data.append(bits)
+            write_varint(data, count)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """ RETURNS: The packet, or None if data is not a ghost packet of this version. """
+        if len(data) < HEADER.size + SNAPSHOT.size:
+            return None
+        magic, version, race, round_number, sequence, ack = HEADER.unpack_from(data)
+        if magic != GHOST_MAGIC or version != GHOST_VERSION:
+            return None
+        tick, flags = SNAPSHOT.unpack_from(data, HEADER.size)
+        position = HEADER.size + SNAPSHOT.size
+
+        try:
+            baseline = None
+            if flags & FULL_POSITION:
+                y, = FULL_Y.unpack_from(data, position)
+                position += FULL_Y.size
+            else:
+                baseline, y = DELTA_Y.unpack_from(data, position)
+                position += DELTA_Y.size
+
+            first_input_tick, position = read_varint(data, position)
+            run_count = data[position]
+            position += 1
+            runs = []
+            for _ in range(run_count):
+                bits = data[position]
+                count, position = read_varint(data, position + 1)
+                runs.append((bits, count))
+        except (struct.error, IndexError, ReplayError):
+            return None
+        return cls(race, round_number, sequence, ack, tick, flags, y, baseline, first_input_tick, runs)
+
+class GhostInputLog():
+    """ Input source wrapper that logs the key bits of every poll, one poll per simulation tick. """
+    def __init__(self, input_source, log: bytearray):
+        self.input_source = input_source
+        self.log = log
+
+    def __call__(self):
+        keys = self.input_source()
+        self.log.append(encode_keys(keys))
+        return keys
+
+class GhostClient():
+    """
+    One racer's connection. Call start_round before each raced game, update once per
+    rendered frame, and finish_round after the game ends.
+    """
+    def __init__(self, relay_address: tuple, seed: int, send_rate: int = None):
+        self.relay_address = relay_address
+        self.seed = seed
+        self.race = seed & 0xFFFFFFFF
+        send_rate = send_rate or GameSettings.ghost_send_rate
+        self.send_interval = max(1, round(GameSettings.render_fps / send_rate))
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+        self.socket.bind(("", 0))
+
+        self.round_number = 0
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self.packets_received = 0
+        self.packets_dropped = 0
+        self.game = None
+        self._reset_round_state()
+
+    def _reset_round_state(self):
+        self.frames = 0
+        self.sequence = 0
+        self.sent = {}
+        self.acked_sequence = None
+        self.acked_input_tick = 0
+        self.ended_sends = 0
+        self.local_inputs = bytearray()
+
+        self.peer_sequence = None
+        self.peer_snapshots = {}
+        self.peer_tick = 0
+        self.peer_ended = False
+        self.peer_replay = None
+        self.input_ack_pending = False
+        self.ghost = PlayerSnapshot()
+        self.ghost_visible = False
+
+    def start_round(self, game: Game):
+        """ Races game, which must be seeded with this client's seed and not have ticked yet. """
+        self.round_number = (self.round_number + 1) % 256
+        self._reset_round_state()
+        self.game = game
+        self.peer_replay = Replay(game.seed, game.player.y)
+        game.input_source = GhostInputLog(game.input_source, self.local_inputs)
+        game.ghost = self
+
+    def finish_round(self):
+        """ Sends the final snapshot its remaining times and restores the game's own input source. """
+        while self.ended_sends < 3:
+            self.ended_sends += 1
+            self.send(True)
+        game = self.game
+        if isinstance(game.input_source, GhostInputLog):
+            game.input_source = game.input_source.input_source
+        game.ghost = None
+
+    def update(self, ended: bool = False):
+        """ Receives everything waiting on the socket, then sends a snapshot when one is due. """
+        self.receive()
+        self.frames += 1
+        if ended:
+            #finish_round repeats the final snapshot, so one lost packet cannot leave the ghost hanging.
+            #Until then it keeps going out while either side is missing an acknowledgement of input
+            if self.ended_sends == 0 or (self.frames % self.send_interval == 0 and (
+                    self.acked_input_tick < len(self.local_inputs) or self.input_ack_pending)):
+                self.ended_sends = max(self.ended_sends, 1)
+                self.send(True)
+        elif self.frames % self.send_interval == 0:
+            self.send(False)
+
+    def send(self, ended: bool = False):
+        player = self.game.player
+        flags = ORIENTATIONS.index(player.orientation)
+        if ended:
+            flags |= ENDED
+        ack = 0
+        if self.peer_sequence is not None:
+            flags |= HAS_ACK
+            ack = self.peer_sequence
+
+        y = int(player.y)
+        baseline = self.sent.get(self.acked_sequence) if self.acked_sequence is not None else None
+        if baseline is not None and -128 <= y - baseline[0] <= 127:
+            packet_y = y - baseline[0]
+            baseline_sequence = self.acked_sequence
+        else:
+            flags |= FULL_POSITION
+            packet_y = y
+            baseline_sequence = None
+
+        first_tick = self.acked_input_tick
+        last_tick = min(len(self.local_inputs), first_tick + MAX_INPUT_TICKS)
+        runs = get_runs(self.local_inputs[first_tick:last_tick])
+
+        self.input_ack_pending = False
+        packet = GhostPacket(self.race, self.round_number, self.sequence, ack, len(self.local_inputs), flags,
+                             packet_y, baseline_sequence, first_tick, runs)
+        self.sent[self.sequence] = (y, last_tick)
+        self.sent.pop((self.sequence - HISTORY) % SEQUENCE_MODULO, None)
+        self.sequence = (self.sequence + 1) % SEQUENCE_MODULO
+
+        data = packet.to_bytes()
+        try:
+            self.socket.sendto(data, self.relay_address)
+        except OSError:
+            #A full send buffer or an unreachable relay. The next packet resends the same input
+            self.packets_dropped += 1
+            return
+        self.bytes_sent += len(data)
+        self.packets_sent += 1
+
+    def receive(self):
+        while True:
+            try:
+                data, _ = self.socket.recvfrom(MAX_PACKET_SIZE)
+            except BlockingIOError:
+                return
+            except OSError:
+                #Linux reports an unreachable relay on the next receive
+                self.packets_dropped += 1
+                continue
+            packet = GhostPacket.from_bytes(data)
+            if packet is None or packet.race != self.race or packet.round_number != self.round_number:
+                self.packets_dropped += 1
+                continue
+            self.packets_received += 1
+            self.apply(packet)
+
+    def apply(self, packet: GhostPacket):
+        if packet.flags & HAS_ACK and (self.acked_sequence is None
+                                       or is_newer_sequence(packet.ack, self.acked_sequence)):
+            sent = self.sent.get(packet.ack)
+            if sent is not None:
+                self.acked_sequence = packet.ack
+                self.acked_input_tick = max(self.acked_input_tick, sent[1])
+
+        self.receive_inputs(packet)
+
+        if self.peer_sequence is not None and not is_newer_sequence(packet.sequence, self.peer_sequence):
+            return
+        if packet.flags & FULL_POSITION:
+            y = packet.y
+        else:
+            baseline = self.peer_snapshots.get(packet.baseline)
+            if baseline is None:
+                return
+            y = baseline + packet.y
+
+        self.peer_sequence = packet.sequence
+        self.peer_snapshots[packet.sequence] = y
+        self.peer_snapshots.pop((packet.sequence - HISTORY) % SEQUENCE_MODULO, None)
+        self.peer_tick = packet.tick
+        self.peer_ended = self.peer_ended or bool(packet.flags & ENDED)
+
+        ghost = self.ghost
+        ghost.image = assets.image(f"player/{packet.orientation}_ghost")
+        ghost.x = self.game.player.x
+        ghost.y = y
+        ghost.previous_y = y
+        self.ghost_visible = not self.peer_ended
+
+    def receive_inputs(self, packet: GhostPacket):
+        """ Appends the ticks of input the peer replay does not have yet. """
+        have = self.peer_replay.tick_count
+        tick = packet.first_input_tick
+        if tick > have:
+            return
+        for bits, count in packet.input_runs:
+            end = tick + count
+            for _ in range(end - max(tick, have)):
+                self.peer_replay.append(bits)
+                self.input_ack_pending = True
+            have = max(have, end)
+            tick = end
+
+    def get_stats(self) -> dict:
+        return {
+            "bytes_sent": self.bytes_sent,
+            "packets_sent": self.packets_sent,
+            "packets_received": self.packets_received,
+            "packets_dropped": self.packets_dropped,
+            "peer_ticks_received": self.peer_replay.tick_count if self.peer_replay else 0}
+
+    def close(self):
+        self.socket.close()
+
+def get_runs(log: bytes) -> list:
+    """ RETURNS: log run-length encoded as (bits, count) pairs. """
+    runs = []
+    for bits in log:
+        if runs and runs[-1][0] == bits:
+            runs[-1][1] += 1
+        else:
+            runs.append([bits, 1])
+    return runs
@@ -0,0 +1,75 @@
+"""
+Runs full games without a window, frame cap or keyboard. Useful for CI boxes with no display.
+
+Usage: python -m side_scroller.headless --games 100
+"""
+import argparse
+import time
+from side_scroller.game import Game
+from side_scroller.inputs import RandomInput
+from side_scroller.profiler import FrameProfiler
+from side_scroller.side_scroller import main_game_loop
+
+class ThroughputReport():
+    """ Summary of a batch of headless games. """
+    def __init__(self, games: int, seconds: float, scores: list):
+        self.games = games
+        self.seconds = seconds
+        self.scores = scores
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def mean_score(self) -> float:
+        return sum(self.scores) / len(self.scores) if self.scores else 0
+
+    def __str__(self):
+        return (f"{self.games} games in {self.seconds:.3f}s "
+                f"({self.games_per_second:.1f} games/s, mean score {self.mean_score:.1f})")
+
+def run_headless_game(input_source=None, render: bool = False, profiler=None, render_scale: float = None,
+                      pipelined: bool = None) -> float:
+    """
+    Plays a single game to the first collision as fast as the CPU allows.
+
+    RETURNS: The final score.
+    """
+    game = Game(headless=True, render=render, input_source=input_source, profiler=profiler,
+                render_scale=render_scale)
+    main_game_loop(game, pipelined)
+    return game.player.score.score
+
+def measure_throughput(games: int, input_source_factory=RandomInput, render: bool = False,
+                       profiler=None, render_scale: float = None, pipelined: bool = None) -> ThroughputReport:
+    """
+    Plays the given number of headless games back to back.
+    input_source_factory is called with the game index to build each game's input source.
+    """
+    scores = []
+    start = time.perf_counter()
+    for index in range(games):
+        scores.append(run_headless_game(
+            input_source_factory(index), render, profiler, render_scale, pipelined))
+    return ThroughputReport(games, time.perf_counter() - start, scores)
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure headless simulation throughput.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--render", action="store_true", help="Draw to an off-screen surface.")
+    parser.add_argument("--profile", metavar="PATH", help="Write per-phase frame timings here as JSON.")
+    parser.add_argument("--render-scale", type=float, metavar="SCALE",
+                        help="Internal resolution relative to the window when rendering.")
+    parser.add_argument("--pipelined", action="store_true", default=None,
+                        help="Simulate on a worker thread while drawing.")
+    args = parser.parse_args()
+
+    profiler = FrameProfiler() if args.profile else None
+    print(measure_throughput(args.games, render=args.render, profiler=profiler,
+                             render_scale=args.render_scale, pipelined=args.pipelined))
+    if profiler:
+        profiler.dump(args.profile)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import random
+import pygame
+
+class PressedKeys:
+    """
+    Stand-in for the sequence returned by pygame.key.get_pressed. Indexing with a
+    pygame key constant returns whether that key is held.
+    """
+    def __init__(self, pressed: tuple = ()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+NO_KEYS = PressedKeys()
+UP_KEYS = PressedKeys((pygame.K_UP,))
+DOWN_KEYS = PressedKeys((pygame.K_DOWN,))
+
+def idle_input() -> PressedKeys:
+    """ Input source that never presses anything. """
+    return NO_KEYS
+
+class RandomInput:
+    """
+    Input source that picks up, down or no key at random and holds the choice
+    for hold_ticks polls. Seeded so runs can be repeated.
+    """
+    choices = (NO_KEYS, UP_KEYS, DOWN_KEYS)
+
+    def __init__(self, seed: int = None, hold_ticks: int = 10):
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.remaining = 0
+        self.current = NO_KEYS
+
+    def __call__(self) -> PressedKeys:
+        if self.remaining <= 0:
+            self.current = self.rng.choice(self.choices)
+            self.remaining = self.hold_ticks
+        self.remaining -= 1
+        return self.current
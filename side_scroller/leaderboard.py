@@ -0,0 +1,187 @@
+"""
+Persistent top runs.
+
+The leaderboard lives in memory and is written to disk behind the game's back: saving
+queues a snapshot for a background writer thread, which replaces the file atomically
+(temp file, fsync, os.replace), so a crash mid-write leaves the previous file intact.
+"""
+import atexit
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+
+LEADERBOARD_VERSION = 1
+
+#Reading the umask means setting it, so do it once while only the importing thread runs
+_umask = os.umask(0)
+os.umask(_umask)
+NEW_FILE_MODE = 0o666 & ~_umask
+
+class LeaderboardEntry():
+    """ A single finished run. """
+    def __init__(self, score: float, level: int = 1, timestamp: float = None):
+        self.score = score
+        self.level = level
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def to_dict(self) -> dict:
+        return {"score": self.score, "level": self.level, "timestamp": self.timestamp}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["score"], data.get("level", 1), data.get("timestamp", 0))
+
+class BackgroundWriter():
+    """
+    Writes files on a daemon thread. Only the newest pending contents of each path are
+    written, so saving faster than the disk keeps up never builds a backlog.
+    """
+    def __init__(self):
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.writing = False
+        self.thread = None
+        self.last_error = None
+
+    def submit(self, path: str, contents: str):
+        with self.condition:
+            self.pending[path] = contents
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+                self.thread.start()
+                atexit.register(self.flush)
+            self.condition.notify_all()
+
+    def flush(self, timeout: float = 5) -> bool:
+        """ Waits for every submitted write to finish. RETURNS: False on timeout. """
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.writing, timeout)
+
+    def _run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending)
+                path, contents = self.pending.popitem()
+                self.writing = True
+            try:
+                write_atomic(path, contents)
+            except OSError as e:
+                print(e)
+                self.last_error = e
+            with self.condition:
+                self.writing = False
+                self.condition.notify_all()
+
+def write_atomic(path: str, contents: str):
+    """
+    Replaces path with contents so readers only ever see the old or the new file.
+    The file keeps its permissions, or gets the umask's defaults when it is new.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(descriptor, "w") as temp_file:
+            temp_file.write(contents)
+            temp_file.flush()
+            #mkstemp creates the file 0600, which os.replace would carry over to path
+            os.chmod(temp_file.fileno(), get_file_mode(path))
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def get_file_mode(path: str) -> int:
+    """ RETURNS: path's permission bits, or those open() would give a new file. """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return NEW_FILE_MODE
+
+writer = BackgroundWriter()
+
+class Leaderboard():
+    """ The best size runs, highest score first. The best score is read from memory. """
+    def __init__(self, path: str = None, size: int = 10, legacy_path: str = None, writer: BackgroundWriter = writer):
+        """
+        path: Leaderboard JSON file. Without one, the leaderboard is only kept in memory.
+        legacy_path: Single high score file of older versions, imported when path does not exist.
+        """
+        self.path = path
+        self.size = size
+        self.writer = writer
+        self.entries = []
+        self.load(legacy_path)
+
+    @property
+    def best(self) -> float:
+        return self.entries[0].score if self.entries else 0
+
+    def qualifies(self, score: float) -> bool:
+        return len(self.entries) < self.size or score > self.entries[-1].score
+
+    def submit(self, score: float, level: int = 1, save: bool = True) -> bool:
+        """
+        Adds a run if it makes the leaderboard, and queues a save when save is True.
+
+        RETURNS: True if the run is the new best.
+        """
+        if not self.qualifies(score):
+            return False
+        is_best = score > self.best or not self.entries
+
+        position = len(self.entries)
+        while position > 0 and self.entries[position - 1].score < score:
+            position -= 1
+        self.entries.insert(position, LeaderboardEntry(score, level))
+        del self.entries[self.size:]
+
+        if save:
+            self.save()
+        return is_best
+
+    def merge(self, entries: list):
+        """ Adds entries from another source without saving. """
+        self.entries = sorted(self.entries + entries, key=lambda entry: entry.score, reverse=True)[:self.size]
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "version": LEADERBOARD_VERSION,
+            "entries": [entry.to_dict() for entry in self.entries]})
+
+    def save(self):
+        if self.path is not None:
+            self.writer.submit(self.path, self.to_json())
+
+    def load(self, legacy_path: str = None):
+        if self.path is not None and os.path.exists(self.path):
+            self.merge(read_leaderboard_file(self.path))
+        elif legacy_path is not None:
+            self.merge(read_leaderboard_file(legacy_path))
+
+def read_leaderboard_file(path: str) -> list:
+    """
+    Reads a leaderboard, or a single high score file of older versions.
+
+    RETURNS: The entries found. Missing, empty or unreadable files have none.
+    """
+    try:
+        with open(path) as leaderboard_file:
+            data = json.load(leaderboard_file)
+    except (OSError, ValueError) as e:
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            print(e)
+        return []
+
+    if not isinstance(data, dict):
+        return []
+    if "entries" in data:
+        return [LeaderboardEntry.from_dict(entry) for entry in data["entries"]]
+    if data.get("score") is not None:
+        return [LeaderboardEntry(data["score"], timestamp=0)]
+    return []
@@ -2,15 +2,17 @@ import pygame
 from side_scroller.settings import GameSettings, Fonts
 from side_scroller.constants import WHITE
 from side_scroller.player import Player
-from side_scroller.score import Score
+from side_scroller.text import render_text
+from side_scroller.scenes import Scene, wait_for_event, is_return_key_press
 
 class LossScreen():
 
     def __init__(self, player: Player):
-        self.loss_text = Fonts.loss_font.render("Game Over", True, WHITE)
-        self.retry_text = Fonts.retry_font.render("Press Enter to try again.", True, WHITE)
+        self.loss_text = render_text(Fonts.loss_font, "Game Over", WHITE)
+        self.retry_text = render_text(Fonts.retry_font, "Press Enter to try again.", WHITE)
+        #Scores differ from game to game, so only the fixed labels go through the text cache
         self.high_score_text = Fonts.high_score_font.render(
-            f"High Score: {int(Score.high_score.get('score'))}",
+            f"High Score: {int(player.score.get_high_score())}",
             True,
             WHITE)
 
@@ -38,3 +40,11 @@ class LossScreen():
                         center=(int(GameSettings.width/2),
                                 int(GameSettings.height/2 + self.score_text.get_height()))))
         pygame.display.update()
+
+class LossScene(Scene):
+    """ Shows the loss screen until return is pressed. """
+    def __init__(self, player: Player, screen: pygame.surface):
+        LossScreen(player).display(screen)
+
+    def update(self):
+        return None if is_return_key_press(wait_for_event()) else self
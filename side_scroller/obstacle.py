@@ -1,48 +1,315 @@
-import random
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from side_scroller.game import Game
+import numpy as np
 import pygame
-from side_scroller.game import Game
 from side_scroller.settings import GameSettings
 from side_scroller.constants import OBSTACLE_PATH
+from side_scroller.assets import assets, ImageAssetList, MaskAssetList
+from side_scroller.broadphase import SpatialGrid
 
-class Obstacle(pygame.sprite.Sprite):
-    images = [
-        pygame.image.load(f"{OBSTACLE_PATH}obstacle.png"),
-        pygame.image.load(f"{OBSTACLE_PATH}obstacle2.png"),
-        pygame.image.load(f"{OBSTACLE_PATH}obstacle3.png")]
+OBSTACLE_IMAGE_FILES = ["obstacle.png", "obstacle2.png", "obstacle3.png"]
+for image_file in OBSTACLE_IMAGE_FILES:
+    assets.register_image(f"obstacles/{image_file}", f"{OBSTACLE_PATH}{image_file}")
 
-    def __init__(self, x, y):
-        self.image = Obstacle.images[random.randrange(0, len(Obstacle.images))]
+class Obstacle():
+    """
+    Sprite-compatible obstacle: has the image and rect pygame.sprite.spritecollide and
+    Surface.blits need. Uses __slots__ since ObstaclePool keeps many of them alive.
+    """
+    __slots__ = ("image_index", "image", "width", "height", "speed", "y_bottom_barrier",
+                 "x", "y", "rect")
+    images = ImageAssetList([f"obstacles/{image_file}" for image_file in OBSTACLE_IMAGE_FILES])
+    masks = MaskAssetList([f"obstacles/{image_file}" for image_file in OBSTACLE_IMAGE_FILES])
+
+    def __init__(self, x, y, image_index: int, speed: int):
+        """ image_index, speed: Drawn from the game's seeded rng by SpawnScheduler. """
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, image_index, speed)
+
+    def reset(self, x, y, image_index: int, speed: int):
+        """ Reinitializes the obstacle in place, reusing its rect. """
+        self.image_index = image_index
+        self.image = Obstacle.images[image_index]
         self.width = self.image.get_width()
         self.height = self.image.get_height()
-        self.speed = random.randint(1, 2)
+        self.speed = speed
 
         self.y_bottom_barrier = GameSettings.height - self.height
-        self.x = x + self.width
-        if y > self.y_bottom_barrier:
-            self.y = self.y_bottom_barrier
+        self.x, self.y = get_spawn_position(x, y, self.width, self.height)
+        self.rect.update(self.x, self.y, self.width, self.height)
+
+    def move_to(self, x: int, y: int):
+        self.x = x
+        self.y = y
+        self.rect.topleft = (x, y)
+
+def get_spawn_position(x: int, y: int, width: int, height: int) -> tuple:
+    """ Obstacles start one width past x and never hang below the bottom of the screen. """
+    return x + width, min(y, GameSettings.height - height)
+
+class ObstaclePool():
+    """
+    Free list of Obstacle objects. Expired obstacles are released back to the pool and
+    handed out again instead of being left for the garbage collector.
+    """
+    def __init__(self):
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water_mark = 0
+
+    def acquire(self, image_index: int, speed: int) -> Obstacle:
+        if self.free:
+            self.hits += 1
+            obstacle = self.free.pop()
+            obstacle.reset(0, 0, image_index, speed)
         else:
-            self.y = y
-        self.rect = pygame.Rect(x + self.width, self.y, self.width, self.height)
+            self.misses += 1
+            obstacle = Obstacle(0, 0, image_index, speed)
+        self.track(obstacle)
+        return obstacle
+
+    def track(self, obstacle: Obstacle):
+        """ Counts an obstacle created outside the pool as in use. It joins the pool on release. """
+        self.in_use += 1
+        if self.in_use > self.high_water_mark:
+            self.high_water_mark = self.in_use
+
+    def release(self, obstacle: Obstacle):
+        self.in_use -= 1
+        self.free.append(obstacle)
+
+    def get_stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water_mark": self.high_water_mark}
+
+class ObstacleStore():
+    """
+    Struct-of-arrays obstacle container. Positions, sizes, speeds and image indices
+    live in NumPy arrays indexed by slot so a frame's movement, culling and blit lists
+    are computed in batched operations. Expired slots are recycled through a free list.
+
+    Iterating the store yields Obstacle sprites kept in sync with the arrays, so it
+    can be passed anywhere pygame.sprite.spritecollide expects a group. Those sprites
+    come from an ObstaclePool and return to it when their slot expires. A SpatialGrid
+    follows the obstacles so rect queries only look at nearby slots.
+    """
+    def __init__(self, capacity: int = 64):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.previous_x = np.zeros(capacity, dtype=np.int32)
+        self.x_remainder = np.zeros(capacity) #Fraction of a pixel moved but not yet applied to x
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.width = np.zeros(capacity, dtype=np.int32)
+        self.height = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.image_index = np.zeros(capacity, dtype=np.int32)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.views = [None] * capacity
+        self.pool = ObstaclePool()
+        self.count = 0
+        self.grid = SpatialGrid(GameSettings.broadphase_cell_size, capacity)
+
+        self.images = None
+        self.images_version = None
+        self.masks = None
+        self.masks_version = None
+        self.image_widths = np.array([image.get_width() for image in Obstacle.images], dtype=np.int32)
+        self.image_heights = np.array([image.get_height() for image in Obstacle.images], dtype=np.int32)
+
+        self._slots = None
+        self._sprites = None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    @property
+    def capacity(self) -> int:
+        return len(self.active)
+
+    def clear(self):
+        self.active[:] = False
+        self.free_slots = list(range(self.capacity - 1, -1, -1))
+        for slot, view in enumerate(self.views):
+            if view is not None:
+                self.pool.release(view)
+                self.views[slot] = None
+        self.count = 0
+        self.grid.clear()
+        self._invalidate()
+
+    def add(self, x: int, y: int, image_index: int, speed: int) -> int:
+        """
+        Spawns an obstacle with the same placement rules as Obstacle.
+
+        RETURNS: The slot the obstacle was stored in.
+        """
+        width = int(self.image_widths[image_index])
+        height = int(self.image_heights[image_index])
+        x, y = get_spawn_position(x, y, width, height)
+        return self._insert(x, y, width, height, speed, image_index, None)
+
+    def append(self, obstacle: Obstacle) -> int:
+        """
+        Stores an existing Obstacle, which becomes the sprite view of its slot and
+        joins the pool once the slot expires.
+        """
+        self.pool.track(obstacle)
+        return self._insert(obstacle.x, obstacle.y, obstacle.width, obstacle.height,
+                            obstacle.speed, obstacle.image_index, obstacle)
+
+    def _insert(self, x, y, width, height, speed, image_index, view) -> int:
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+        self.x[slot] = x
+        self.previous_x[slot] = x
+        self.x_remainder[slot] = 0
+        self.y[slot] = y
+        self.width[slot] = width
+        self.height[slot] = height
+        self.speed[slot] = speed
+        self.image_index[slot] = image_index
+        self.active[slot] = True
+        self.views[slot] = view
+        self.count += 1
+        self.grid.insert(slot, x, y, width, height)
+        self._invalidate()
+        return slot
+
+    def _grow(self):
+        old_capacity = self.capacity
+        new_capacity = old_capacity * 2
+        for name in ("x", "previous_x", "x_remainder", "y", "width", "height", "speed", "image_index", "active"):
+            array = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=array.dtype)
+            grown[:old_capacity] = array
+            setattr(self, name, grown)
+        self.views.extend([None] * old_capacity)
+        self.grid.grow(new_capacity)
+        self.free_slots = list(range(new_capacity - 1, old_capacity - 1, -1)) + self.free_slots
+
+    def _invalidate(self):
+        self._slots = None
+        self._sprites = None
+
+    def active_slots(self) -> np.ndarray:
+        if self._slots is None:
+            self._slots = np.flatnonzero(self.active)
+        return self._slots
+
+    def advance(self, base_shift: int, speed_scale: float = 1):
+        """
+        Moves every obstacle left by base_shift plus its own speed, times speed_scale.
+        Fractions of a pixel carry over to the next advance.
+        """
+        slots = self.active_slots()
+        self.previous_x[slots] = self.x[slots]
+        distance = (base_shift + self.speed[slots]) * speed_scale + self.x_remainder[slots]
+        steps = distance.astype(np.int32)
+        self.x_remainder[slots] = distance - steps
+        self.x[slots] -= steps
+        self.grid.update_columns(slots, self.x[slots], self.width[slots])
+        self._sprites = None
+
+    def cull(self) -> int:
+        """
+        Frees every obstacle that has fully left the screen.
+
+        RETURNS: Number of obstacles removed.
+        """
+        slots = self.active_slots()
+        expired = slots[self.x[slots] < -self.width[slots]]
+        if len(expired) == 0:
+            return 0
+        self.active[expired] = False
+        for slot in expired.tolist():
+            self.grid.remove(slot)
+            view = self.views[slot]
+            if view is not None:
+                self.pool.release(view)
+                self.views[slot] = None
+            self.free_slots.append(slot)
+        self.count -= len(expired)
+        self._invalidate()
+        return len(expired)
+
+    def get_images(self) -> np.ndarray:
+        """ RETURNS: Obstacle images as an object array, refreshed when the assets are converted. """
+        if self.images_version != assets.version:
+            self.images = np.empty(len(OBSTACLE_IMAGE_FILES), dtype=object)
+            self.images[:] = Obstacle.images
+            self.images_version = assets.version
+        return self.images
+
+    def get_masks(self) -> list:
+        """ RETURNS: Obstacle collision masks by image index, refreshed when the assets are converted. """
+        if self.masks_version != assets.version:
+            self.masks = Obstacle.masks
+            self.masks_version = assets.version
+        return self.masks
+
+    def blit_list(self, alpha: float = 1) -> list:
+        """
+        alpha: Fraction of the last move to draw, for interpolating between simulation ticks.
+
+        RETURNS: (image, (x, y)) pairs for every obstacle, ready for Surface.blits.
+        """
+        slots = self.active_slots()
+        images = self.get_images()[self.image_index[slots]]
+        xs = self.x[slots]
+        if alpha != 1:
+            previous_xs = self.previous_x[slots]
+            xs = np.rint(previous_xs + (xs - previous_xs) * alpha).astype(np.int32)
+        return list(zip(images, zip(xs.tolist(), self.y[slots].tolist())))
+
+    def sprites(self) -> list:
+        """ RETURNS: Obstacle sprites with rects matching the current arrays. """
+        if self._sprites is None:
+            slots = self.active_slots().tolist()
+            self._sprites = [self._view(slot, x, y) for slot, x, y
+                             in zip(slots, self.x[slots].tolist(), self.y[slots].tolist())]
+        return self._sprites
+
+    def _view(self, slot: int, x: int, y: int) -> Obstacle:
+        view = self.views[slot]
+        if view is None:
+            view = self.pool.acquire(int(self.image_index[slot]), int(self.speed[slot]))
+            self.views[slot] = view
+        view.move_to(x, y)
+        return view
+
+    def query_slots(self, rect: pygame.Rect) -> list:
+        """ RETURNS: Slots of obstacles overlapping rect, found through the grid. """
+        return [slot for slot in sorted(self.grid.query(rect))
+                if rect.colliderect((self.x[slot], self.y[slot], self.width[slot], self.height[slot]))]
+
+    def query(self, rect: pygame.Rect) -> list:
+        """ RETURNS: Obstacle sprites overlapping rect. """
+        return [self._view(slot, int(self.x[slot]), int(self.y[slot])) for slot in self.query_slots(rect)]
 
 def move_obstacles(game: Game):
-    """ Move obstacles and refresh background for past obstacle positions. """
-    #Clear current obstacle locations to refresh background
-    for obstacle in game.obstacles:
-        game.screen.blit(
-            GameSettings.background.image,
-            (obstacle.rect.x + int(obstacle.width/2), obstacle.rect.y),
-            (obstacle.rect.x + int(obstacle.width/2), obstacle.rect.y, int(obstacle.width/2), obstacle.height))
-
-    #Blit obstacles at new position
-    removed_obstacles = []
-    for obstacle in game.obstacles:
-        x_shift = int(game.player.game_settings.obstacle_speed + game.player.score.level + obstacle.speed)
-        obstacle.x -= x_shift
-        obstacle.rect.move_ip(-(x_shift), 0)
-        if obstacle.x < -obstacle.width:
-            removed_obstacles.append(obstacle)
-        else:
-            game.screen.blit(obstacle.image, (obstacle.x, obstacle.y))
-    
-    for obstacle in removed_obstacles:
-        game.obstacles.remove(obstacle)
+    """ Move obstacles one simulation tick and drop the ones that left the screen. """
+    obstacles = game.obstacles
+    game_settings = game.player.game_settings
+    obstacles.advance(int(game_settings.obstacle_speed + game.player.score.level), game_settings.speed_scale)
+    obstacles.cull()
+
+def draw_obstacles(game: Game, alpha: float = 1, obstacles=None):
+    """
+    Queue obstacles between their last two simulated positions. Off-screen ones are culled.
+    obstacles: Draw this snapshot of the obstacles instead of the live store.
+    """
+    obstacles = game.obstacles if obstacles is None else obstacles
+    game.render_queue.extend(obstacles.blit_list(alpha), track=True)
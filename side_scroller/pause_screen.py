@@ -3,12 +3,14 @@ from side_scroller.settings import GameSettings, Fonts
 from side_scroller.constants import WHITE, BLACK, TINT_ALPHA_PAUSE
 from side_scroller.player import Player
 from side_scroller.score import Score
+from side_scroller.text import render_text
+from side_scroller.scenes import Scene, wait_for_event, is_return_key_press
 
 class PauseScreen():
 
     def __init__(self):
-        self.pause_text1 = Fonts.pause_font.render("Paused", True, WHITE)
-        self.pause_text2 = Fonts.pause_font.render("Press Enter to continue", True, WHITE)
+        self.pause_text1 = render_text(Fonts.pause_font, "Paused", WHITE)
+        self.pause_text2 = render_text(Fonts.pause_font, "Press Enter to continue", WHITE)
 
         self.previous_screen = None
 
@@ -36,3 +38,20 @@ class PauseScreen():
 
     def undisplay(self, screen: pygame.surface):
         screen.blit(self.previous_screen, (0, 0))
+
+class PauseScene(Scene):
+    """ Shows the pause screen over the game until return is pressed, then resumes resume_scene. """
+    def __init__(self, game, resume_scene: Scene):
+        self.game = game
+        self.resume_scene = resume_scene
+        self.pause_screen = PauseScreen()
+        self.pause_screen.display(game.window)
+
+    def update(self):
+        if not is_return_key_press(wait_for_event()):
+            return self
+
+        self.pause_screen.undisplay(self.game.window)
+        self.game.compositor.invalidate_all()
+        self.game.simulation_clock.reset()
+        return self.resume_scene
@@ -0,0 +1,157 @@
+"""
+Pipelined simulation: a worker thread simulates the ticks due this frame while the main
+thread draws the state the worker finished last frame, so a frame costs about the longer
+of simulating and drawing instead of both. The screen runs one frame behind the simulation.
+
+The two sides never share mutable state. The worker ends each job by copying what drawing
+needs into one of two StateSnapshot buffers, and the main thread only draws from the buffer
+it was handed. The worker always fills the other buffer, which the main thread finished
+drawing before starting the job.
+"""
+from __future__ import annotations
+import queue
+import threading
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from side_scroller.game import Game
+import numpy as np
+
+class PlayerSnapshot():
+    """ Copy of what drawing the player needs, with Player's drawing interface. """
+    __slots__ = ("image", "x", "y", "previous_y")
+
+    def __init__(self):
+        self.image = None
+        self.x = 0
+        self.y = 0
+        self.previous_y = 0
+
+    def fill(self, player):
+        self.image = player.get_display_image()
+        self.x = player.x
+        self.y = player.y
+        self.previous_y = player.previous_y
+
+    def get_display_image(self):
+        return self.image
+
+    def get_interpolated_y(self, alpha: float) -> int:
+        return round(self.previous_y + (self.y - self.previous_y) * alpha)
+
+class ObstacleSnapshot():
+    """ Copy of the active obstacles' images and positions, with ObstacleStore's blit_list. """
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity: int):
+        self.images = np.empty(capacity, dtype=object)
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.previous_x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+
+    def fill(self, store):
+        slots = store.active_slots()
+        count = len(slots)
+        if count > len(self.x):
+            self.allocate(max(count, len(self.x) * 2))
+        self.count = count
+        np.take(store.get_images(), store.image_index[slots], out=self.images[:count])
+        np.take(store.x, slots, out=self.x[:count])
+        np.take(store.previous_x, slots, out=self.previous_x[:count])
+        np.take(store.y, slots, out=self.y[:count])
+
+    def blit_list(self, alpha: float = 1) -> list:
+        xs = self.x[:self.count]
+        if alpha != 1:
+            previous_xs = self.previous_x[:self.count]
+            xs = np.rint(previous_xs + (xs - previous_xs) * alpha).astype(np.int32)
+        return list(zip(self.images[:self.count], zip(xs.tolist(), self.y[:self.count].tolist())))
+
+    def __len__(self):
+        return self.count
+
+class StateSnapshot():
+    """ Everything render_frame draws, copied at the end of a simulation job. """
+    def __init__(self):
+        self.player = PlayerSnapshot()
+        self.obstacles = ObstacleSnapshot()
+        self.score = 0
+        self.alpha = 1
+        self.end_state = False
+        self.pause_requested = False
+
+    def fill(self, game: Game, alpha: float = 1, end_state: bool = False):
+        self.player.fill(game.player)
+        self.obstacles.fill(game.obstacles)
+        self.score = int(game.player.score.score)
+        self.alpha = alpha
+        self.end_state = end_state
+        self.pause_requested = game.pause_requested
+
+class SimulationPipeline():
+    """ Runs simulation jobs on a worker thread and hands their results over in double-buffered snapshots. """
+    def __init__(self, game: Game, simulate_tick):
+        """ simulate_tick: Called with game and the tick's key state once per tick. RETURNS True when the game ended. """
+        self.game = game
+        self.simulate_tick = simulate_tick
+        self.buffers = [StateSnapshot(), StateSnapshot()]
+        self.back = 0
+        self.pending = False
+
+        self.jobs = queue.Queue(maxsize=1)
+        self.results = queue.Queue(maxsize=1)
+        self.worker = threading.Thread(target=self._run_jobs, name="simulation", daemon=True)
+        self.worker.start()
+
+    def start(self, keys: list, alpha: float = 1):
+        """
+        Simulates a tick per key state in keys on the worker, stopping early on collision.
+        keys: Polled on the main thread, since pygame only reads the keyboard there. A pause
+            is only acted on after the job, as every tick's keys were read together.
+        """
+        if self.pending:
+            raise RuntimeError("The previous simulation job has not been finished.")
+        self.jobs.put((keys, alpha, self.buffers[self.back]))
+        self.pending = True
+
+    def finish(self) -> StateSnapshot:
+        """
+        Waits for the running job. Without one, snapshots the game as it is.
+
+        RETURNS: The state the job ended on. It stays untouched until the job started after the next finish.
+        """
+        snapshot = self.buffers[self.back]
+        if self.pending:
+            result = self.results.get()
+            self.pending = False
+            if isinstance(result, BaseException):
+                raise result
+        else:
+            snapshot.fill(self.game)
+        self.back ^= 1
+        return snapshot
+
+    def close(self):
+        if self.pending:
+            self.results.get()
+            self.pending = False
+        self.jobs.put(None)
+        self.worker.join()
+
+    def _run_jobs(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            keys, alpha, snapshot = job
+            try:
+                end_state = False
+                for tick_keys in keys:
+                    end_state = self.simulate_tick(self.game, tick_keys)
+                    if end_state:
+                        break
+                snapshot.fill(self.game, 1 if end_state else alpha, end_state)
+                self.results.put(snapshot)
+            except BaseException as error:
+                self.results.put(error)
@@ -2,11 +2,12 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from side_scroller.game import Game
+    from side_scroller.obstacle import ObstacleStore
 import pygame
 from side_scroller.score import Score
 from side_scroller.settings import GameSettings
 from side_scroller.constants import PLAYER_PATH
+from side_scroller.assets import assets, ImageAsset, LazyValue, make_flash_variant
 
 DIRECTIONS = {
     0: 'neutral',
@@ -34,18 +35,24 @@ class Hitbox(pygame.sprite.Sprite):
         self.rect = rect
         self.orientation = orientation
 
+for state in DIRECTIONS.values():
+    assets.register_image(f"player/{state}", f"{PLAYER_PATH}{state}_state.png")
+    assets.register_derived_image(f"player/{state}_white", f"player/{state}", make_flash_variant)
+
 class Player(pygame.sprite.Sprite):
-    up = pygame.image.load(f"{PLAYER_PATH}up_state.png")
-    neutral = pygame.image.load(f"{PLAYER_PATH}neutral_state.png")
-    down = pygame.image.load(f"{PLAYER_PATH}down_state.png")
+    up = ImageAsset("player/up")
+    neutral = ImageAsset("player/neutral")
+    down = ImageAsset("player/down")
 
-    up_white = pygame.image.load(f"{PLAYER_PATH}up_state_white.png")
-    neutral_white = pygame.image.load(f"{PLAYER_PATH}neutral_state_white.png")
-    down_white = pygame.image.load(f"{PLAYER_PATH}down_state_white.png")
+    up_white = ImageAsset("player/up_white")
+    neutral_white = ImageAsset("player/neutral_white")
+    down_white = ImageAsset("player/down_white")
 
-    width = max(up.get_width(), neutral.get_width(), down.get_width())
-    height = max(up.get_height(), neutral.get_height(), down.get_height())
-    y_bottom_barrier = GameSettings.height - height
+    width = LazyValue(
+        lambda: max(assets.image(f"player/{state}").get_width() for state in DIRECTIONS.values()))
+    height = LazyValue(
+        lambda: max(assets.image(f"player/{state}").get_height() for state in DIRECTIONS.values()))
+    y_bottom_barrier = LazyValue(lambda: GameSettings.height - Player.height)
 
     def __init__(self, x: int = 0, y: int = 0):
         self.x = x
@@ -70,7 +77,13 @@ class Player(pygame.sprite.Sprite):
             Hitbox(pygame.Rect(x, y, round(Player.width/2), Player.height),
                    DIRECTIONS.get(2)))
 
+        self.hitboxes_by_orientation = {direction: [] for direction in DIRECTIONS.values()}
+        for hitbox in self.hitboxes:
+            self.hitboxes_by_orientation[hitbox.orientation].append(hitbox)
+
         self.orientation = DIRECTIONS.get(0)
+        self.display_state = DIRECTIONS.get(0)
+        self.previous_y = y
         self.current_speed = 1
         self.level_speed_boost = 0
         self.speed_counter = SpeedCounter(1)
@@ -97,7 +110,7 @@ class Player(pygame.sprite.Sprite):
         self.level_speed_boost = 0
         self.progress_to_move = 0
 
-    def increase_speed_counter(self, direction: int, fps_over_min: float):
+    def increase_speed_counter(self, direction: int):
         """
             Wrapper for increasing speed counter. If the direction has changed, we'll create a new
             counter and start the count over.
@@ -108,7 +121,7 @@ class Player(pygame.sprite.Sprite):
         if self.current_speed == GameSettings.maxSpeed:
             return
         self.speed_counter.count += 1
-        if (self.speed_counter.count / int(fps_over_min)) % GameSettings.speed_increment_count == 0:
+        if self.speed_counter.count % GameSettings.speed_increment_count == 0:
             self.current_speed += 1
 
     def increase_y_axis(self, val: int, respect_game_barriers: bool = True):
@@ -136,48 +149,87 @@ class Player(pygame.sprite.Sprite):
             hitbox.rect.move_ip(0, -y_adjust)
 
     def adjust_high_scores(self):
-        self.score.set_high_score(self.score.score, True)
+        self.score.record_run()
 
-    def can_move(self, movement: int, direction: str):
+    def get_move_distance(self, speed_scale: float, direction: str) -> int:
         """
-        Checks if player has made enough progress to move a pixel
-        and updates progress_to_move accordingly
-        RETURNS: True if player can move
+        Adds this tick's movement, speed plus boost scaled by the level's speed_scale, to
+        progress_to_move. The fraction of a pixel left over carries to the next tick.
+        direction: Orientation before this tick. The player does not move on the tick it turns.
+        RETURNS: Whole pixels to move this tick
         """
         if direction != self.orientation:
-            self.progress_to_move = movement
-            return False
-        self.progress_to_move += movement
-        if self.progress_to_move < 1:
+            self.progress_to_move = 0
+            return 0
+        self.progress_to_move += (self.current_speed + int(self.level_speed_boost)) * speed_scale
+        distance = int(self.progress_to_move)
+        self.progress_to_move -= distance
+        return distance
+
+    def is_colliding_with_obstacles(self, obstacles: ObstacleStore) -> bool:
+        """
+        Rect broadphase through the obstacle grid, then a pixel mask overlap test for
+        each obstacle the player's rect touches.
+        """
+        if not GameSettings.pixel_perfect_collision:
+            return self.is_hitbox_colliding_with_obstacles(obstacles)
+        slots = obstacles.query_slots(self.rect)
+        if not slots:
             return False
-        self.progress_to_move -= 1
-        return True
+        mask = self.get_mask()
+        obstacle_masks = obstacles.get_masks()
+        for slot in slots:
+            offset = (int(obstacles.x[slot]) - self.x, int(obstacles.y[slot]) - self.y)
+            if mask.overlap(obstacle_masks[obstacles.image_index[slot]], offset):
+                return True
+        return False
 
-    def is_colliding_with_obstacles(self, obstacles: list) -> bool:
-        for hitbox in self.hitboxes:
-            if hitbox.orientation == self.orientation:
-                if len(pygame.sprite.spritecollide(hitbox, obstacles, False)) > 0:
-                    return True
+    def is_hitbox_colliding_with_obstacles(self, obstacles: ObstacleStore) -> bool:
+        nearby = obstacles.query(self.rect)
+        if not nearby:
+            return False
+        for hitbox in self.hitboxes_by_orientation[self.orientation]:
+            if len(pygame.sprite.spritecollide(hitbox, nearby, False)) > 0:
+                return True
         return False
 
-    def prepare_new_game(self):
+    def get_mask(self) -> pygame.mask.Mask:
+        """ RETURNS: Collision mask of the image the player is drawn with. """
+        return assets.mask(f"player/{self.display_state}")
+
+    def prepare_new_game(self, rng: random.Random = random):
         self.reset_speed()
         self.speed_counter.reset_all()
         self.score.reset_score()
         self.game_settings.set_defaults()
         self.orientation = DIRECTIONS.get(0)
-        self.set_random_start_position_y()
+        self.display_state = DIRECTIONS.get(0)
+        self.set_random_start_position_y(rng)
+        self.save_previous_position()
 
-    def set_random_start_position_y(self):
-        #BUG: doesn't move hitboxes
-        quarter_window = GameSettings.height / 4
-        move_range = random.randrange(-quarter_window, quarter_window)
-        
-        destination_y = (quarter_window * 2 + move_range)
+    def save_previous_position(self):
+        """ Remembers the position before a simulation tick so drawing can interpolate. """
+        self.previous_y = self.y
+
+    def get_interpolated_y(self, alpha: float) -> int:
+        return round(self.previous_y + (self.y - self.previous_y) * alpha)
+
+    def get_display_image(self) -> pygame.Surface:
+        return getattr(self, self.display_state)
+
+    def set_random_start_position_y(self, rng: random.Random = random):
+        quarter_window = GameSettings.height // 4
+        move_range = rng.randrange(-quarter_window, quarter_window)
+
+        self.move_to_y(quarter_window * 2 + move_range)
+
+    def move_to_y(self, destination_y: int):
+        """ Moves the player and its hitboxes to destination_y. """
         if destination_y > self.y:
             self.increase_y_axis(destination_y - self.y)
         else:
             self.decrease_y_axis(self.y - destination_y)
+        self.save_previous_position()
 
     def is_moving_down(self):
         return self.get_direction() == DIRECTIONS.get(2)
@@ -188,25 +240,6 @@ class Player(pygame.sprite.Sprite):
     def is_above_bottom_barrier(self):
         return self.rect.bottom < GameSettings.height
 
-    def blink_white(self, game: Game):
-        direction = self.orientation
-        count = 0
-        image = f"{direction}_white"
-        
-        for _ in range(1, GameSettings.death_white_duration):
-            count += 1
-
-            game.screen.blit(
-                getattr(self, image),
-                (game.player.x, game.player.y)
-            )
-
-            pygame.display.update()
-            game.tick_game_fps_clock()
-
-            if count % GameSettings.death_white_frequency == 0:
-                image = Player._get_inverse_image(image)
-    
     @classmethod
     def _get_inverse_image(cls, current_image: str):
         search_val = "_white"
@@ -0,0 +1,129 @@
+"""
+Per-phase frame timing.
+
+A FrameProfiler stores the time every phase of the last few hundred frames took, in a
+fixed-size ring buffer, and summarizes them as p50/p95/p99 milliseconds. Games that are not
+being profiled use NULL_PROFILER, whose methods do nothing.
+"""
+import json
+import time
+import numpy as np
+from side_scroller.constants import BLACK
+from side_scroller.settings import Fonts
+
+#Phases of one frame in the order main_game_loop runs them
+#"sync" is waiting on the simulation thread, which only pipelined games do
+PHASES = ("events", "sync", "input", "adjustments", "move", "collision", "render", "display", "wait")
+EVENTS, SYNC, INPUT, ADJUSTMENTS, MOVE, COLLISION, RENDER, DISPLAY, WAIT = range(len(PHASES))
+
+PERCENTILES = (50, 95, 99)
+
+class FrameProfiler():
+    """
+    Times frame phases with perf_counter_ns. Each mark charges the time since the previous
+    mark to a phase, so phases that run once per simulation tick add up over the frame.
+    """
+    enabled = True
+
+    def __init__(self, capacity: int = 600, overlay_refresh_frames: int = 30):
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(PHASES)), dtype=np.int64)
+        self.obstacle_counts = np.zeros(capacity, dtype=np.int32)
+        self.frames = 0
+        self.row = self.samples[0]
+        self.last_time = time.perf_counter_ns()
+
+        self.show_overlay = False
+        self.overlay_refresh_frames = overlay_refresh_frames
+        self.overlay_text = []
+
+    def begin_frame(self):
+        self.row = self.samples[self.frames % self.capacity]
+        self.row.fill(0)
+        self.last_time = time.perf_counter_ns()
+
+    def mark(self, phase: int):
+        """ Charges the time since the previous mark to phase. """
+        now = time.perf_counter_ns()
+        self.row[phase] += now - self.last_time
+        self.last_time = now
+
+    def end_frame(self, obstacle_count: int):
+        self.obstacle_counts[self.frames % self.capacity] = obstacle_count
+        self.frames += 1
+
+    def recorded_samples(self) -> tuple:
+        """ RETURNS: Phase times in nanoseconds and obstacle counts of the frames still buffered. """
+        stored = min(self.frames, self.capacity)
+        return self.samples[:stored], self.obstacle_counts[:stored]
+
+    def summary(self) -> dict:
+        """ RETURNS: p50/p95/p99 milliseconds per phase and for whole frames, plus obstacle counts. """
+        samples, obstacle_counts = self.recorded_samples()
+        summary = {"frames": self.frames, "buffered_frames": len(samples), "phases_ms": {}}
+        if not len(samples):
+            return summary
+
+        for index, phase in enumerate(PHASES):
+            summary["phases_ms"][phase] = get_percentiles(samples[:, index] / 1e6)
+        summary["frame_ms"] = get_percentiles(samples.sum(axis=1) / 1e6)
+        summary["obstacles"] = get_percentiles(obstacle_counts)
+        return summary
+
+    def dump(self, path: str):
+        """ Writes the summary as JSON. """
+        with open(path, "w") as summary_file:
+            json.dump(self.summary(), summary_file, indent=2)
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self.overlay_text = []
+
+    def draw_overlay(self, game):
+        """ Draws the p95 time of each phase over the top right of the screen. """
+        if not self.show_overlay:
+            return
+        if not self.overlay_text or self.frames % self.overlay_refresh_frames == 0:
+            #The timings change with every refresh, so the lines are rendered here rather than cached
+            self.overlay_text = [Fonts.profiler_font.render(line, True, BLACK)
+                                 for line in format_overlay_lines(self.summary())]
+
+        right = game.screen_rect.right - 5
+        y = 5
+        for text in self.overlay_text:
+            game.render_queue.submit(text, text.get_rect(topright=(right, y)), track=True)
+            y += text.get_height()
+
+class NullProfiler():
+    """ Profiler stand-in with no cost beyond the method calls. """
+    enabled = False
+    show_overlay = False
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, phase: int):
+        pass
+
+    def end_frame(self, obstacle_count: int):
+        pass
+
+    def toggle_overlay(self):
+        pass
+
+    def draw_overlay(self, game):
+        pass
+
+NULL_PROFILER = NullProfiler()
+
+def get_percentiles(values: np.ndarray) -> dict:
+    return {f"p{percentile}": float(value)
+            for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+
+def format_overlay_lines(summary: dict) -> list:
+    if "frame_ms" not in summary:
+        return ["profiling..."]
+    lines = [f"{phase:<12}{times['p95']:6.2f} ms" for phase, times in summary["phases_ms"].items()]
+    lines.append(f"{'frame p95':<12}{summary['frame_ms']['p95']:6.2f} ms")
+    lines.append(f"{'obstacles':<12}{summary['obstacles']['p95']:6.0f}")
+    return lines
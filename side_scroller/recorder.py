@@ -0,0 +1,202 @@
+"""
+Gameplay recording without stalling the game loop.
+
+Each displayed frame, FrameRecorder copies only the regions the compositor marked as
+drawn into a buffer from a fixed pool. A worker thread compresses the buffers with zlib
+and appends them to the recording. When every buffer is still waiting on the worker, the
+frame is dropped and counted instead of waiting. Its regions are kept and captured along
+with the next frame that gets a buffer, so playback never shows a torn screen. Only once
+the kept regions pile up past max_pending_rects or full_frame_ratio of the screen does the
+next frame capture the whole screen.
+
+File layout (little-endian):
+    4s  magic b"SSRV"
+    B   format version
+    H H width, height
+    then per frame:
+    I   frame number
+    H   region count
+    4H  x, y, width, height of each region
+    I   compressed size, followed by the zlib-compressed RGB pixels of every region in order
+
+Usage: python -m side_scroller.recorder RECORDING OUTPUT_DIRECTORY
+    Writes every frame of a recording as a PNG.
+"""
+import argparse
+import os
+import queue
+import struct
+import threading
+import zlib
+import numpy as np
+import pygame
+from side_scroller.compositor import merge_rects
+
+RECORDING_MAGIC = b"SSRV"
+RECORDING_VERSION = 1
+HEADER = struct.Struct("<4sBHH")
+FRAME_HEADER = struct.Struct("<IH")
+REGION = struct.Struct("<4H")
+COMPRESSED_SIZE = struct.Struct("<I")
+
+class RecordingError(Exception):
+    pass
+
+class FrameRecorder():
+    """ Captures damaged screen regions into pooled buffers and writes them from a worker thread. """
+    def __init__(self, path: str, size: tuple, buffer_count: int = 8, compression_level: int = 1,
+                 max_pending_rects: int = 64, full_frame_ratio: float = 0.5):
+        """
+        max_pending_rects, full_frame_ratio: Capture the whole screen instead of separate
+            regions when there are more than this many, or they cover this fraction of it.
+        """
+        self.size = size
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.compression_level = compression_level
+        self.max_pending_rects = max_pending_rects
+        self.full_frame_area = full_frame_ratio * size[0] * size[1]
+
+        self.free_buffers = queue.Queue()
+        for _ in range(buffer_count):
+            self.free_buffers.put(np.empty(size[0] * size[1] * 3, dtype=np.uint8))
+        self.filled_buffers = queue.Queue()
+
+        self.frames = 0
+        self.captured_frames = 0
+        self.dropped_frames = 0
+        #Regions drawn since the last captured frame. The first frame has nothing to build on
+        self.pending_rects = [self.screen_rect]
+
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, size[0], size[1]))
+        self.worker = threading.Thread(target=self._write_frames, name="frame-recorder", daemon=True)
+        self.worker.start()
+
+    def capture(self, screen: pygame.Surface, rects: list = None):
+        """
+        Queues the regions of screen drawn this frame. rects of None means the whole screen.
+        Never blocks: the frame is dropped when no buffer is free, and its regions are
+        captured with the next frame instead.
+        """
+        self.frames += 1
+        rects = self.get_capture_rects([self.screen_rect] if rects is None else rects)
+        if not rects:
+            return
+
+        try:
+            buffer = self.free_buffers.get_nowait()
+        except queue.Empty:
+            self.dropped_frames += 1
+            self.pending_rects = rects
+            return
+
+        regions = []
+        offset = 0
+        pixels = pygame.surfarray.pixels3d(screen)
+        for x, y, width, height in rects:
+            size = width * height * 3
+            buffer[offset:offset + size].reshape(width, height, 3)[:] = pixels[x:x + width, y:y + height]
+            regions.append((x, y, width, height))
+            offset += size
+        #Unlock the screen before anything else draws to it
+        del pixels
+
+        self.pending_rects = []
+        self.captured_frames += 1
+        self.filled_buffers.put((self.frames, regions, buffer, offset))
+
+    def get_capture_rects(self, rects: list) -> list:
+        """
+        RETURNS: The regions still pending plus rects, clipped to the screen and merged where
+        they overlap. Just the whole screen once they are too many or too large, which also
+        keeps them within a buffer.
+        """
+        clipped = [rect.clip(self.screen_rect) for rect in self.pending_rects + list(rects)]
+        merged = merge_rects([rect for rect in clipped if rect.width and rect.height])
+        if len(merged) > self.max_pending_rects \
+                or sum(rect.width * rect.height for rect in merged) >= self.full_frame_area:
+            return [self.screen_rect]
+        return merged
+
+    def _write_frames(self):
+        while True:
+            item = self.filled_buffers.get()
+            if item is None:
+                return
+            frame, regions, buffer, size = item
+            compressed = zlib.compress(buffer[:size], self.compression_level)
+            self.free_buffers.put(buffer)
+
+            record = bytearray(FRAME_HEADER.pack(frame, len(regions)))
+            for region in regions:
+                record += REGION.pack(*region)
+            record += COMPRESSED_SIZE.pack(len(compressed))
+            self.file.write(record)
+            self.file.write(compressed)
+
+    def close(self):
+        """ Writes every queued frame and closes the recording. """
+        if self.file.closed:
+            return
+        self.filled_buffers.put(None)
+        self.worker.join()
+        self.file.close()
+
+    def get_stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "captured_frames": self.captured_frames,
+            "dropped_frames": self.dropped_frames}
+
+def iter_frames(path: str):
+    """
+    Replays a recording's regions onto a canvas.
+
+    RETURNS: A generator of (frame number, RGB array shaped (width, height, 3)). The array
+    is reused between frames.
+    """
+    with open(path, "rb") as recording:
+        header = recording.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise RecordingError("Recording is truncated.")
+        magic, version, width, height = HEADER.unpack(header)
+        if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+            raise RecordingError("Not a recording, or an unsupported version.")
+
+        canvas = np.zeros((width, height, 3), dtype=np.uint8)
+        while True:
+            frame_header = recording.read(FRAME_HEADER.size)
+            if not frame_header:
+                return
+            frame, region_count = FRAME_HEADER.unpack(frame_header)
+            regions = [REGION.unpack(recording.read(REGION.size)) for _ in range(region_count)]
+            compressed_size, = COMPRESSED_SIZE.unpack(recording.read(COMPRESSED_SIZE.size))
+            pixels = np.frombuffer(zlib.decompress(recording.read(compressed_size)), dtype=np.uint8)
+
+            offset = 0
+            for x, y, region_width, region_height in regions:
+                size = region_width * region_height * 3
+                canvas[x:x + region_width, y:y + region_height] = (
+                    pixels[offset:offset + size].reshape(region_width, region_height, 3))
+                offset += size
+            yield frame, canvas
+
+def export_frames(path: str, directory: str) -> int:
+    """ Saves every recorded frame as a PNG. RETURNS: Number of frames written. """
+    os.makedirs(directory, exist_ok=True)
+    count = 0
+    for frame, canvas in iter_frames(path):
+        pygame.image.save(pygame.surfarray.make_surface(canvas), os.path.join(directory, f"frame_{frame:06d}.png"))
+        count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a gameplay recording as PNG frames.")
+    parser.add_argument("recording")
+    parser.add_argument("output_directory")
+    args = parser.parse_args()
+
+    print(f"{export_frames(args.recording, args.output_directory)} frames written")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Stand-in server for ghost racing. Forwards every ghost packet to the other clients racing
+the same course, and forgets clients that stopped sending.
+
+Usage: python -m side_scroller.relay --port 47800
+"""
+import argparse
+import select
+import socket
+import time
+from side_scroller.settings import GameSettings
+from side_scroller.ghost import HEADER, GHOST_MAGIC, MAX_PACKET_SIZE
+
+class Relay():
+    """ UDP forwarder between the clients of each race. """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, client_timeout: float = 10):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind((host, port))
+        self.address = self.socket.getsockname()
+        self.client_timeout = client_timeout
+        self.races = {}
+        self.packets_forwarded = 0
+
+    def handle(self, data: bytes, sender: tuple, now: float):
+        """ Registers sender with the packet's race and forwards the packet to the rest of it. """
+        if len(data) < HEADER.size or data[:2] != GHOST_MAGIC:
+            return
+        race = HEADER.unpack_from(data)[2]
+        clients = self.races.setdefault(race, {})
+        clients[sender] = now
+        for address, last_seen in list(clients.items()):
+            if now - last_seen > self.client_timeout:
+                del clients[address]
+            elif address != sender:
+                try:
+                    self.socket.sendto(data, address)
+                    self.packets_forwarded += 1
+                except OSError:
+                    pass
+
+    def serve(self, should_stop=None, poll_seconds: float = 0.2):
+        """ Forwards packets until should_stop returns True, or forever without it. """
+        while should_stop is None or not should_stop():
+            readable, _, _ = select.select([self.socket], [], [], poll_seconds)
+            if not readable:
+                continue
+            try:
+                data, sender = self.socket.recvfrom(MAX_PACKET_SIZE)
+            except OSError:
+                continue
+            self.handle(data, sender, time.monotonic())
+
+    def close(self):
+        self.socket.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Relay ghost racing packets between players.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=GameSettings.ghost_relay_port)
+    args = parser.parse_args()
+
+    relay = Relay(args.host, args.port)
+    print(f"Relaying on {relay.address[0]}:{relay.address[1]}")
+    try:
+        relay.serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        relay.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import pygame
+
+class RenderQueue():
+    """
+    Draw commands collected over a frame and drawn together with one Surface.blits call,
+    in the order they were submitted. Commands entirely outside the screen are culled on
+    submit, since obstacles spawn past the right edge and are drawn before they scroll in.
+    """
+    def __init__(self, screen_rect: pygame.Rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.commands = []
+        self.tracked = []
+
+        self.submitted = 0
+        self.culled = 0
+        self.flushes = 0
+
+    def submit(self, source: pygame.Surface, dest, area=None, track: bool = False) -> bool:
+        """
+        dest, area: As for Surface.blit, in window coordinates.
+        track: Return this command's drawn region from flush.
+
+        RETURNS: False when the command was culled.
+        """
+        self.submitted += 1
+        width, height = source.get_size() if area is None else pygame.Rect(area).size
+        if not self.screen_rect.colliderect((dest[0], dest[1], width, height)):
+            self.culled += 1
+            return False
+        self.commands.append((source, dest) if area is None else (source, dest, area))
+        self.tracked.append(track)
+        return True
+
+    def extend(self, blit_sequence: list, track: bool = False):
+        """ Submits every (source, dest) or (source, dest, area) in blit_sequence. """
+        for blit in blit_sequence:
+            self.submit(*blit, track=track)
+
+    def flush(self, game) -> list:
+        """
+        Draws the queued commands with a single Game.blits call and empties the queue.
+
+        RETURNS: The drawn regions of the tracked commands.
+        """
+        if not self.commands:
+            return []
+        rects = game.blits(self.commands)
+        tracked_rects = [rect for rect, track in zip(rects, self.tracked) if track]
+        self.clear()
+        self.flushes += 1
+        return tracked_rects
+
+    def clear(self):
+        """ Drops the queued commands without drawing them. """
+        self.commands = []
+        self.tracked = []
+
+    def __len__(self):
+        return len(self.commands)
+
+    def get_stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "culled": self.culled,
+            "drawn": self.submitted - self.culled - len(self.commands),
+            "flushes": self.flushes}
@@ -0,0 +1,64 @@
+import math
+import weakref
+import pygame
+
+class RenderScaler():
+    """
+    Maps drawing in window coordinates onto an internal render target scale times the
+    window's size. Sources are resized once and cached per surface, so drawing at a lower
+    scale fills and blits fewer pixels every frame. The game keeps simulating and drawing
+    in window coordinates.
+    """
+    def __init__(self, scale: float):
+        self.scale = scale
+        self.scaled_surfaces = weakref.WeakKeyDictionary()
+
+    def scale_size(self, size: tuple) -> tuple:
+        """ RETURNS: The internal size covering size, never below one pixel. """
+        return (max(1, math.ceil(size[0] * self.scale)), max(1, math.ceil(size[1] * self.scale)))
+
+    def scale_rect(self, rect) -> pygame.Rect:
+        """ RETURNS: The internal rect covering every pixel of rect. """
+        rect = pygame.Rect(rect)
+        left = math.floor(rect.x * self.scale)
+        top = math.floor(rect.y * self.scale)
+        return pygame.Rect(left, top,
+                           math.ceil(rect.right * self.scale) - left,
+                           math.ceil(rect.bottom * self.scale) - top)
+
+    def scale_point(self, point) -> tuple:
+        return (math.floor(point[0] * self.scale), math.floor(point[1] * self.scale))
+
+    def surface(self, source: pygame.Surface) -> pygame.Surface:
+        """ RETURNS: source resized to the internal scale. Resized once per source. """
+        scaled = self.scaled_surfaces.get(source)
+        if scaled is None:
+            size = self.scale_size(source.get_size())
+            if source.get_bitsize() >= 24:
+                scaled = pygame.transform.smoothscale(source, size)
+            else:
+                scaled = pygame.transform.scale(source, size)
+            self.scaled_surfaces[source] = scaled
+        return scaled
+
+    def map_blit(self, source: pygame.Surface, dest, area=None) -> tuple:
+        """ RETURNS: The internal source, dest and area for a blit given in window coordinates. """
+        if area is not None:
+            area = self.scale_rect(area)
+        return self.surface(source), self.scale_point(dest), area
+
+    def present(self, render_target: pygame.Surface, window: pygame.Surface, rects: list = None) -> list:
+        """
+        Scales the whole render target onto the window in a single pass.
+
+        rects: Internal regions drawn this frame, or None when everything was.
+        RETURNS: The window regions to push to the display, or None for the whole window.
+        """
+        pygame.transform.scale(render_target, window.get_size(), window)
+        if rects is None:
+            return None
+        inverse = 1 / self.scale
+        window_rect = window.get_rect()
+        return [pygame.Rect(math.floor(rect.x * inverse), math.floor(rect.y * inverse),
+                            math.ceil(rect.width * inverse) + 1, math.ceil(rect.height * inverse) + 1)
+                .clip(window_rect) for rect in rects]
@@ -0,0 +1,175 @@
+"""
+Compact input-log recording and deterministic replay.
+
+A replay stores the game's seed, the player's start position and the keys held on every
+simulation tick, run-length encoded. Since every random choice comes from the seeded
+Game.rng and the simulation advances in fixed ticks, re-simulating those inputs headlessly
+reproduces the run exactly.
+
+File layout (little-endian):
+    4s  magic b"SSRP"
+    B   format version
+    Q   seed
+    d   player start y
+    I   number of simulation ticks
+    d   final score
+    then (B key bits, varint run length) pairs until the end of the file.
+
+side_scroller.replay_runner re-simulates and verifies saved replays.
+"""
+import struct
+import pygame
+from side_scroller.game import Game
+from side_scroller.inputs import PressedKeys
+
+REPLAY_MAGIC = b"SSRP"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sBQdId")
+
+KEY_BITS = (
+    (pygame.K_UP, 1),
+    (pygame.K_DOWN, 2),
+    (pygame.K_ESCAPE, 4))
+
+DECODED_KEYS = [PressedKeys(key for key, bit in KEY_BITS if bits & bit) for bits in range(8)]
+
+def encode_keys(keys) -> int:
+    """ RETURNS: The up/down/escape state of a key sequence packed into bits. """
+    bits = 0
+    for key, bit in KEY_BITS:
+        if keys[key]:
+            bits |= bit
+    return bits
+
+def decode_keys(bits: int) -> PressedKeys:
+    return DECODED_KEYS[bits]
+
+class ReplayError(Exception):
+    pass
+
+class Replay():
+    """ Seed, start position and run-length encoded per-tick input of one run. """
+    def __init__(self, seed: int, start_y: float, final_score: float = 0, runs: list = None):
+        self.seed = seed
+        self.start_y = start_y
+        self.final_score = final_score
+        self.runs = runs if runs is not None else []
+
+    @property
+    def tick_count(self) -> int:
+        return sum(count for _, count in self.runs)
+
+    def append(self, bits: int):
+        if self.runs and self.runs[-1][0] == bits:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+
+    def truncate(self, tick_count: int):
+        """ Drops the input of every tick after tick_count. """
+        excess = self.tick_count - tick_count
+        while excess > 0:
+            run = self.runs[-1]
+            if run[1] > excess:
+                run[1] -= excess
+                break
+            excess -= run[1]
+            self.runs.pop()
+
+    def iter_bits(self):
+        for bits, count in self.runs:
+            for _ in range(count):
+                yield bits
+
+    def to_bytes(self) -> bytes:
+        data = bytearray(HEADER.pack(
+            REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.start_y, self.tick_count, self.final_score))
+        for bits, count in self.runs:
+            data.append(bits)
+            write_varint(data, count)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        if len(data) < HEADER.size:
+            raise ReplayError("Replay is truncated.")
+        magic, version, seed, start_y, tick_count, final_score = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ReplayError("Not a replay file, or an unsupported version.")
+
+        runs = []
+        position = HEADER.size
+        while position < len(data):
+            bits = data[position]
+            count, position = read_varint(data, position + 1)
+            runs.append([bits, count])
+
+        replay = cls(seed, start_y, final_score, runs)
+        if replay.tick_count != tick_count:
+            raise ReplayError("Replay input does not match its tick count.")
+        return replay
+
+    def save(self, path: str):
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+def write_varint(data: bytearray, value: int):
+    while value >= 0x80:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+
+def read_varint(data: bytes, position: int) -> tuple:
+    """ RETURNS: The decoded value and the position after it. """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ReplayError("Replay is truncated.")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+class InputRecorder():
+    """ Input source wrapper that logs every poll into a Replay. """
+    def __init__(self, input_source, replay: Replay):
+        self.input_source = input_source
+        self.replay = replay
+
+    def __call__(self):
+        keys = self.input_source()
+        self.replay.append(encode_keys(keys))
+        return keys
+
+class ReplayInput():
+    """ Input source that plays back a Replay's key states one poll at a time. """
+    def __init__(self, replay: Replay):
+        self.bits = replay.iter_bits()
+        self.polls = 0
+
+    def __call__(self) -> PressedKeys:
+        self.polls += 1
+        return decode_keys(next(self.bits, 0))
+
+def start_recording(game: Game) -> Replay:
+    """ Records the game's input from now on. Call before the game's first tick. """
+    replay = Replay(game.seed, game.player.y)
+    source = game.input_source
+    if isinstance(source, InputRecorder):
+        source = source.input_source
+    game.input_source = InputRecorder(source, replay)
+    return replay
+
+def finish_recording(game: Game, replay: Replay) -> Replay:
+    #A pipelined frame polls all its ticks' keys up front, so the ones after a collision were never simulated
+    replay.truncate(game.spawn_scheduler.tick)
+    replay.final_score = game.player.score.score
+    return replay
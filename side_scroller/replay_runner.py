@@ -0,0 +1,39 @@
+"""
+Re-simulates recorded replays headlessly at full CPU speed and checks their scores.
+
+Usage: python -m side_scroller.replay_runner FILE [FILE ...]
+"""
+import argparse
+from side_scroller.game import Game
+from side_scroller.replay import Replay, ReplayInput
+from side_scroller.side_scroller import main_game_loop
+
+def run_replay(replay: Replay) -> Game:
+    """ Re-simulates a replay without rendering. RETURNS: The finished game. """
+    game = Game(headless=True, render=False, input_source=ReplayInput(replay), seed=replay.seed)
+    game.player.move_to_y(replay.start_y)
+    main_game_loop(game)
+    return game
+
+def is_replay_match(replay: Replay, game: Game) -> bool:
+    """ RETURNS: True if the replayed game ended on the recorded tick with the recorded score. """
+    return (game.input_source.polls == replay.tick_count
+            and game.player.score.score == replay.final_score)
+
+def verify_replay(replay: Replay) -> bool:
+    return is_replay_match(replay, run_replay(replay))
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-simulate replays and check their scores.")
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args()
+
+    for path in args.paths:
+        replay = Replay.load(path)
+        game = run_replay(replay)
+        print(f"{path}: {replay.tick_count} ticks, recorded score {replay.final_score:.2f}, "
+              f"replayed score {game.player.score.score:.2f} "
+              f"{'OK' if is_replay_match(replay, game) else 'MISMATCH'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import sys
+import pygame
+from side_scroller.settings import GameSettings
+
+class Scene():
+    """
+    One screen of the game. run_scenes calls update once per frame, and update returns
+    the scene for the next frame: itself to stay, another scene to switch, None when done.
+    Scenes never loop on their own, so every screen shares the same quit handling.
+    """
+    def update(self):
+        return None
+
+def run_scenes(scene: Scene):
+    """ Runs scenes until one finishes without naming a next scene. """
+    while scene is not None:
+        scene = scene.update()
+
+def wait_for_event(timeout: int = None) -> pygame.event.Event:
+    """
+    Sleeps until an event arrives or timeout milliseconds pass, so idle screens use no CPU.
+    Quits the game on window close.
+
+    RETURNS: The event, or a NOEVENT event on timeout.
+    """
+    if timeout is None:
+        timeout = GameSettings.idle_event_timeout
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.QUIT:
+        quit_game()
+    return event
+
+def is_return_key_press(event: pygame.event.Event) -> bool:
+    return event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN
+
+def if_necessary_quit_game():
+    """ Drains pending events, quitting on window close. """
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            quit_game()
+
+def quit_game():
+    pygame.display.quit()
+    pygame.quit()
+    sys.exit()
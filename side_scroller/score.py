@@ -1,20 +1,26 @@
-import json
-import os.path
 from side_scroller.constants import SCORE_PATH
+from side_scroller.leaderboard import Leaderboard, read_leaderboard_file
 
 class Score:
     """ Tracks score. Intance tracks a given play's score/level. """
-    high_score = {}
+    leaderboard = None
 
-    def __init__(self):
+    def __init__(self, leaderboard: Leaderboard = None):
+        """ leaderboard: Where runs and high scores go. Defaults to the saved leaderboard every score shares. """
         self.score = 0
         self.level = 1
-        self.countToObstacleTick = 0
-        self.countToLevelTick = 0
-        self.countToFrequencyTick = 0
+        if leaderboard is not None:
+            self.leaderboard = leaderboard
+
+    def get_leaderboard(self) -> Leaderboard:
+        """ Loads the saved leaderboard the first time any score needs it. """
+        if self.leaderboard is None:
+            Score.leaderboard = Leaderboard(
+                f"{SCORE_PATH}leaderboard.json", legacy_path=f"{SCORE_PATH}highscore.txt")
+        return self.leaderboard
 
     def get_high_score(self):
-        return self.high_score.get('score', 0)
+        return self.get_leaderboard().best
 
     def reset_score(self):
         """ Reset score and update HIGHSCORE if needed. """
@@ -25,51 +31,28 @@ class Score:
         self.score = 0
         self.level = 1
 
-        self.countToObstacleTick = 0
-        self.countToLevelTick = 0
-        self.countToFrequencyTick = 0
-
     def set_high_score(self, score: int, save: bool = False):
         """
-        Updates high_score if passed in score is higher.
+        Updates high_score if passed in score is higher. Saving happens in the background.
 
         RETURNS: True if score is higher than previous highscore. Otherwise, False.
         """
-        updated = False
         if score > self.get_high_score():
-            self.high_score.update({'score': score})
-            updated = True
-        if updated is True and save is True:
-            try:
-                json.dump(self.high_score, open('score/highscore.txt', 'w'))
-            except:
-                raise Exception("Failed to save highscore to file.")
-        return updated
+            return self.get_leaderboard().submit(score, self.level, save)
+        return False
 
-    def load_high_score(self, score_path: str):
+    def record_run(self) -> bool:
         """
-        Attempts to load highscore from file.
+        Adds this run to the leaderboard and saves it in the background.
 
-        RETURNS: highscore info as dictionary. If it's not already within game, retrieves
-        from file in same directory.
+        RETURNS: True if the run set a new highscore.
         """
-        # score_path = os.path.join(os.path.dirname(os.getcwd()), SCORE_PATH, 'highscore.txt')
-        score_path = score_path + 'highscore.txt'
+        return self.get_leaderboard().submit(self.score, self.level)
 
-        try:
-            if os.path.exists(score_path):
-                score_file = open(score_path)
-            else:
-                score_file = open(score_path, "w")
-
-            high_score = json.load(score_file)
-            self.set_high_score(high_score.get('score'))
-            score_file.close()
-        except Exception as e:
-            print(e)
-            if score_file:
-                score_file.close()
-            self.high_score = {}
+    def load_high_score(self, score_path: str):
+        """ Merges the leaderboard or highscore file in score_path into the current leaderboard. """
+        for file_name in ("leaderboard.json", "highscore.txt"):
+            self.get_leaderboard().merge(read_leaderboard_file(score_path + file_name))
 
     def increase_score(self, adjustment: int):
         self.score += adjustment
@@ -1,26 +1,36 @@
 import pygame
-from side_scroller.score import Score
-from side_scroller.constants import IMAGE_PATH, SCORE_PATH
+from side_scroller.constants import IMAGE_PATH
+from side_scroller.assets import assets, FontAsset
 
 class Background(pygame.sprite.Sprite):
-    """ The game's background image information. """
+    """ The game's background image information. The image loads on first use. """
     def __init__(self, image_file: str):
         pygame.sprite.Sprite.__init__(self)
-        self.image = pygame.image.load(f"{IMAGE_PATH}{image_file}")
-        self.rect = self.image.get_rect()
-        self.rect.left = 0
-        self.rect.top = 0
+        self.asset_name = image_file
+        assets.register_image(image_file, f"{IMAGE_PATH}{image_file}")
+        self._rect = None
 
-class Fonts():
+    @property
+    def image(self) -> pygame.Surface:
+        return assets.image(self.asset_name)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        if self._rect is None:
+            self._rect = self.image.get_rect()
+            self._rect.left = 0
+            self._rect.top = 0
+        return self._rect
 
-    pygame.font.init()
-    hud_font = pygame.font.SysFont("Ariel", 20)
+class Fonts():
+    hud_font = FontAsset("Ariel", 20)
 
-    loss_font = pygame.font.SysFont("Ariel", 100)
-    retry_font = pygame.font.SysFont("Ariel", 30)
-    high_score_font = pygame.font.SysFont("Ariel", 50)
-    score_font = pygame.font.SysFont("Ariel", 50)
-    pause_font = pygame.font.SysFont("Ariel", 50)
+    loss_font = FontAsset("Ariel", 100)
+    retry_font = FontAsset("Ariel", 30)
+    high_score_font = FontAsset("Ariel", 50)
+    score_font = FontAsset("Ariel", 50)
+    pause_font = FontAsset("Ariel", 50)
+    profiler_font = FontAsset("Ariel", 16)
 
 class GameSettings:
     """
@@ -31,30 +41,50 @@ class GameSettings:
     width = 800
     background = Background("background.jpg")
     lossScreen = Background("loss_screen.png")
-    allTimeScore = Score()
-    allTimeScore.load_high_score("score/")
 
     #region Movement
     hoverLimit = 20
     maxSpeed = 3
     minSpeed = 2
     speed_increment_count = 10
-    minFps = 60
-    maxFps = 150
+    minFps = 60 #Simulation ticks per second. Fixed: levels move things further each tick instead of adding ticks
+    maxFps = 150 #Top pace levels reach, as the tick rate that would match it. Movement tops out at maxFps / minFps times level 1's
+    render_fps = 60 #Frames drawn per second, independent of the simulation tick rate
     #endregion
 
     #region Obstacles
     obstacle_frequency = 40 #Increase for fewer obstacles from beginning
     obstacle_tick_adjustment = 40 #Amount obstacle frequency adjusts per level
     obstacle_tick_speed_adjustments = 0.5 #Amount speed increases per level after hitting maxFps
+    min_obstacle_frequency = 10 #Floor for obstacle frequency increases. At 0 an obstacle would spawn every tick
+    broadphase_cell_size = 64 #Collision grid cell size in pixels. Roughly one obstacle wide works best
+    spawn_lookahead_ticks = 600 #How far ahead obstacle spawns and level increases are scheduled
+    pixel_perfect_collision = True #Collide on opaque image pixels. False uses the player's hitbox rects
     #endregion
 
     #region Tick adjustments
-    fpsTick = 2
+    fpsTick = 2 #Pace added per level until maxFps, in ticks per second
     levelTick = 100
     frequencyTick = 800 #Increase for lower obstacle increase per level
     #endregion
 
+    #region Rendering
+    full_update_area_ratio = 0.5 #Push the whole screen once this fraction of it was drawn in a frame
+    max_dirty_rects = 64 #Push the whole screen when a frame has more separate regions than this
+    pipelined_simulation = False #Simulate the next frame on a worker thread while drawing the last one
+    render_scale = 1.0 #Internal resolution relative to the window. Below 1 draws fewer pixels, above 1 supersamples
+    #endregion
+
+    #region Ghost racing
+    ghost_send_rate = 30 #Ghost packets sent per second. Input for every tick rides along, so catching up on ticks does not add packets
+    ghost_alpha = 110 #Opacity of the other racer's ghost, out of 255
+    ghost_relay_port = 47800
+    #endregion
+
+    #region Screens
+    idle_event_timeout = 500 #Milliseconds pause and loss screens sleep waiting for input
+    #endregion
+
     #region Player death animation
     death_white_frequency = 10 #Adjust frequency of white blink. Lower for quicker blinks
     death_white_duration = 40 #How long player blinks white on death
@@ -74,8 +104,7 @@ class GameSettings:
         """ Sets gamesetting defaults. """
         self.obstacle_frequency = GameSettings.obstacle_frequency
         self.obstacle_speed = 0
-        self.game_fps = self.minFps
-        self.fps_over_min = 1
+        self.speed_scale = 1
 
         self.death_fall_speed = GameSettings.death_starting_fall_speed
 
@@ -1,59 +1,229 @@
-import sys
+import atexit
 import os
-import random
 import pygame
 from side_scroller.game import Game
-from side_scroller.obstacle import Obstacle, move_obstacles
+from side_scroller.obstacle import move_obstacles, draw_obstacles
+from side_scroller.spawner import SPAWN_OBSTACLE, INCREASE_LEVEL
 from side_scroller.settings import GameSettings
-from side_scroller.loss_screen import LossScreen
-from side_scroller.pause_screen import PauseScreen
-from side_scroller.death_animation import display_player_death_animation
+from side_scroller.loss_screen import LossScene
+from side_scroller.pause_screen import PauseScene
+from side_scroller.death_animation import DeathAnimationScene
+from side_scroller.scenes import Scene, run_scenes, quit_game
+from side_scroller.replay import start_recording, finish_recording
+from side_scroller import profiler as phase
+from side_scroller.profiler import FrameProfiler, NULL_PROFILER
+from side_scroller.pipeline import SimulationPipeline, StateSnapshot
+from side_scroller.recorder import FrameRecorder
+from side_scroller.ghost import GhostClient
 from side_scroller.states import (up_key_state, neutral_key_state, down_key_state,
                                   should_player_move_up, should_player_move_down,
                                   should_pause_game)
 
-def change_to_file_directory():
-    absolute_path = os.path.abspath(__file__)
-    directory_name = os.path.dirname(absolute_path)
-    os.chdir(directory_name)
-
-def start_game():
+def start_game(replay_directory: str = None, profile_path: str = None, record_path: str = None,
+               render_scale: float = None, pipelined: bool = None, race_address: tuple = None,
+               race_seed: int = 0):
+    """
+    replay_directory: When given, each run's replay is saved there.
+    profile_path: When given, frame phases are timed (F3 shows them) and a JSON summary
+        is written there when the game exits.
+    record_path: When given, everything shown on screen is recorded there.
+    render_scale: Internal resolution relative to the window. Defaults to GameSettings.render_scale.
+    pipelined: Simulate on a worker thread while drawing. Defaults to GameSettings.pipelined_simulation.
+    race_address: (host, port) of a ghost racing relay. Every game then races the course
+        of race_seed against whoever joined the relay with the same seed.
+    """
     continue_playing = True
 
-    current_game = Game()
+    profiler = None
+    if profile_path:
+        profiler = FrameProfiler()
+        atexit.register(profiler.dump, profile_path)
+
+    ghost_client = None
+    game_seed = None
+    if race_address:
+        ghost_client = GhostClient(race_address, race_seed)
+        atexit.register(ghost_client.close)
+        game_seed = race_seed
+
+    current_game = Game(seed=game_seed, profiler=profiler, render_scale=render_scale)
+    if record_path:
+        current_game.frame_recorder = FrameRecorder(record_path, current_game.screen.get_size())
+        atexit.register(current_game.frame_recorder.close)
     while continue_playing is True:
-        main_game_loop(current_game)
+        replay = start_recording(current_game) if replay_directory else None
+        if ghost_client:
+            ghost_client.start_round(current_game)
+        main_game_loop(current_game, pipelined)
+        if ghost_client:
+            ghost_client.finish_round()
+        if replay:
+            os.makedirs(replay_directory, exist_ok=True)
+            finish_recording(current_game, replay).save(
+                os.path.join(replay_directory, f"replay_{replay.seed}.ssr"))
 
         current_game.update_high_score()
         continue_playing = display_loss_screen(current_game)
 
-        current_game.prepare_new_game()
+        current_game.prepare_new_game(game_seed)
+
+def main_game_loop(current_game: Game, pipelined: bool = None):
+    """
+    Plays until the player collides with an obstacle, then shows the death animation.
+    pipelined: Simulate on a worker thread while drawing. Defaults to GameSettings.pipelined_simulation.
+    """
+    if pipelined is None:
+        pipelined = GameSettings.pipelined_simulation
+    current_game.simulation_clock.reset()
+    if not pipelined:
+        run_scenes(PlayingScene(current_game))
+        return
+
+    #Worker ticks are not profiled: marks from two threads would charge each other's time
+    pipeline = SimulationPipeline(current_game, lambda game, keys: simulate_tick(game, keys, NULL_PROFILER))
+    try:
+        run_scenes(PlayingScene(current_game, pipeline))
+    finally:
+        pipeline.close()
+
+class PlayingScene(Scene):
+    """ Runs a frame of the game per update. Moves on to pausing or the death animation. """
+    def __init__(self, game: Game, pipeline: SimulationPipeline = None):
+        self.game = game
+        self.pipeline = pipeline
+
+    def update(self):
+        if self.pipeline is None:
+            end_state = run_frame(self.game)
+            pause_requested = self.game.pause_requested
+        else:
+            #The worker may still be simulating, so go by the state that was drawn
+            snapshot = run_pipelined_frame(self.game, self.pipeline)
+            end_state = snapshot.end_state
+            pause_requested = snapshot.pause_requested
+
+        if end_state:
+            return None if self.game.headless else DeathAnimationScene(self.game)
+        if pause_requested:
+            self.game.pause_requested = False
+            return PauseScene(self.game, self)
+        return self
+
+def run_frame(current_game: Game) -> bool:
+    """
+    Runs the simulation ticks that are due, then draws one frame.
+
+    RETURNS: True if the player collided with an obstacle.
+    """
+    profiler = current_game.profiler
+    profiler.begin_frame()
+    if not current_game.headless:
+        handle_frame_events(current_game)
+    profiler.mark(phase.EVENTS)
 
-def main_game_loop(current_game: Game):
     end_state = False
+    clock = current_game.simulation_clock
+    for _ in range(clock.begin_frame(GameSettings.minFps)):
+        end_state = simulate_tick(current_game)
+        if end_state or current_game.pause_requested:
+            break
+    if current_game.ghost is not None:
+        current_game.ghost.update(end_state)
 
-    while not end_state:
-        current_game.set_per_loop_adjustment()
-        current_game.player.score.increase_score(current_game.per_loop_adjustment)
+    if current_game.render:
+        #The death animation starts from the simulated position, so draw that on the last frame
+        render_frame(current_game, 1 if end_state else clock.alpha)
+    profiler.mark(phase.RENDER)
+    current_game.update_display()
+    profiler.mark(phase.DISPLAY)
+    current_game.wait_for_next_frame()
+    profiler.mark(phase.WAIT)
+    profiler.end_frame(len(current_game.obstacles))
+    return end_state
 
-        current_game.refresh_player_location_background()
-        current_game.update_score_hud()
+def run_pipelined_frame(current_game: Game, pipeline: SimulationPipeline) -> StateSnapshot:
+    """
+    run_frame counterpart that simulates on pipeline's worker thread. Reads the keys of the
+    ticks that are due and starts simulating them, then draws the state the previous job
+    ended on while they run.
+    No job is started once that state ended the game or asked for a pause.
+
+    RETURNS: The snapshot that was drawn.
+    """
+    profiler = current_game.profiler
+    profiler.begin_frame()
+    if not current_game.headless:
+        handle_frame_events(current_game)
+    profiler.mark(phase.EVENTS)
 
-        current_game.neutral_count = respond_to_key_press(current_game)
+    snapshot = pipeline.finish()
+    profiler.mark(phase.SYNC)
+    if current_game.ghost is not None:
+        #The worker is idle until the next start, so the ghost client can read the game
+        current_game.ghost.update(snapshot.end_state)
+    if not snapshot.end_state and not snapshot.pause_requested:
+        clock = current_game.simulation_clock
+        keys = [current_game.get_pressed_keys() for _ in range(clock.begin_frame(GameSettings.minFps))]
+        pipeline.start(keys, clock.alpha)
 
-        if_necessary_quit_game()
+    if current_game.render:
+        render_frame(current_game, snapshot.alpha, snapshot)
+    profiler.mark(phase.RENDER)
+    current_game.update_display()
+    profiler.mark(phase.DISPLAY)
+    current_game.wait_for_next_frame()
+    profiler.mark(phase.WAIT)
+    profiler.end_frame(len(snapshot.obstacles))
+    return snapshot
 
-        tick_adjustments(current_game)
-        move_obstacles(current_game)
-        pygame.display.update()
+def simulate_tick(current_game: Game, keys=None, profiler=None) -> bool:
+    """
+    Advances the game by one fixed simulation tick without drawing anything.
+    keys: The tick's key state. Polled from the game's input source when not given.
+    profiler: Times the tick's phases. Defaults to the game's profiler.
 
-        end_state = current_game.player.is_colliding_with_obstacles(current_game.obstacles)
-        current_game.tick_game_fps_clock()
-    
-    display_player_death_animation(current_game)
+    RETURNS: True if the player collided with an obstacle.
+    """
+    if profiler is None:
+        profiler = current_game.profiler
+    current_game.player.score.increase_score(1)
+    current_game.player.save_previous_position()
 
-def respond_to_key_press(game: Game):
-    keys = pygame.key.get_pressed()
+    current_game.neutral_count = respond_to_key_press(current_game, keys)
+    profiler.mark(phase.INPUT)
+
+    tick_adjustments(current_game)
+    profiler.mark(phase.ADJUSTMENTS)
+    move_obstacles(current_game)
+    profiler.mark(phase.MOVE)
+
+    is_colliding = current_game.player.is_colliding_with_obstacles(current_game.obstacles)
+    profiler.mark(phase.COLLISION)
+    return is_colliding
+
+def render_frame(current_game: Game, alpha: float = 1, snapshot: StateSnapshot = None):
+    """
+    Draws the current state, alpha of the way from the previous simulation tick.
+    snapshot: Draw this copy of the state instead of the live game.
+    """
+    current_game.erase_drawn_sprites()
+    ghost = current_game.ghost
+    if ghost is not None and ghost.ghost_visible:
+        current_game.draw_player(1, ghost.ghost)
+    if snapshot is None:
+        current_game.update_score_hud()
+        current_game.draw_player(alpha)
+        draw_obstacles(current_game, alpha)
+    else:
+        current_game.update_score_hud(snapshot.score)
+        current_game.draw_player(alpha, snapshot.player)
+        draw_obstacles(current_game, alpha, snapshot.obstacles)
+    current_game.profiler.draw_overlay(current_game)
+    current_game.flush_render_queue()
+
+def respond_to_key_press(game: Game, keys=None):
+    if keys is None:
+        keys = game.get_pressed_keys()
     neutral_count = None
 
     if should_player_move_up(keys):
@@ -63,76 +233,44 @@ def respond_to_key_press(game: Game):
     else:
         neutral_count = neutral_key_state(game)
 
-    if should_pause_game(keys):
-        pause_screen = PauseScreen()
-        pause_screen.display(game.screen)
-        wait_for_return_key_press()
-        pause_screen.undisplay(game.screen)
+    if should_pause_game(keys) and not game.headless:
+        game.pause_requested = True
 
     return neutral_count
 
 def tick_adjustments(game: Game):
-    game.increase_count_to_obstacle_tick()
-    game.increase_count_to_level_tick()
-
-    if_necessary_add_obstacles(game)
-    if if_necessary_increase_level(game):
-        increase_obstacle_speed(game)
-    if_necessary_increase_obstacle_frequency(game)
-
-def if_necessary_add_obstacles(game: Game):
-    if game.player.score.countToObstacleTick > game.player.game_settings.obstacle_frequency:
-        game.obstacles.append(Obstacle(random.randrange(GameSettings.width, GameSettings.width + 50),
-                                  random.randrange(0, GameSettings.height)))
-        game.player.score.countToObstacleTick -= game.player.game_settings.obstacle_frequency
-
-def if_necessary_increase_level(game: Game) -> bool:
-    if game.player.score.countToLevelTick > GameSettings.levelTick:
-        game.player.score.level += 1
-        game.player.score.countToLevelTick -= GameSettings.levelTick
-        return True
-    return False
-
-def increase_obstacle_speed(game: Game):
-    if game.game_fps < GameSettings.maxFps:
-        game.game_fps += GameSettings.fpsTick
-        game.fps_over_min = game.game_fps / GameSettings.minFps
-    else:
-        game.player.game_settings.obstacle_speed += GameSettings.obstacle_tick_speed_adjustments
-        game.player.adjust_level_speed_boost(GameSettings.obstacle_tick_speed_adjustments / 2)
-
-def if_necessary_increase_obstacle_frequency(game: Game):
-    if game.player.score.countToFrequencyTick > GameSettings.frequencyTick:
-        game.player.score.countToFrequencyTick -= GameSettings.frequencyTick
-        if game.player.game_settings.obstacle_frequency > GameSettings.obstacle_tick_adjustment:
-            game.player.game_settings.obstacle_frequency -= GameSettings.obstacle_tick_adjustment
-        else:
-            new_frequency = int(game.player.game_settings.obstacle_frequency/2)
-            game.player.game_settings.obstacle_frequency = new_frequency
+    """ Applies the spawns and level increases scheduled for this tick. """
+    for event in game.spawn_scheduler.advance():
+        if event.kind == SPAWN_OBSTACLE:
+            game.obstacles.add(event.x, event.y, event.image_index, event.speed)
+        elif event.kind == INCREASE_LEVEL:
+            increase_level(game)
+
+def increase_level(game: Game):
+    """ Moves to the next level and applies its row of the difficulty table. """
+    score = game.player.score
+    previous = game.difficulty.get(score.level)
+    score.level += 1
+    difficulty = game.difficulty.get(score.level)
+
+    game.player.game_settings.speed_scale = difficulty.speed_scale
+    game.player.game_settings.obstacle_speed = difficulty.obstacle_speed
+    game.player.game_settings.obstacle_frequency = difficulty.spawn_interval
+    #The player loses its boost whenever it changes direction, so only add this level's share
+    game.player.adjust_level_speed_boost(difficulty.level_speed_boost - previous.level_speed_boost)
 
 def display_loss_screen(game: Game):
-    loss_screen = LossScreen(game.player)
-    loss_screen.display(game.screen)
-    return wait_for_return_key_press()
-
-def wait_for_return_key_press():
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                quit_game()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                return True
-
-def if_necessary_quit_game():
+    """ RETURNS: True once the player asks to play again. Closing the window quits. """
+    run_scenes(LossScene(game.player, game.window))
+    return True
+
+def handle_frame_events(game: Game):
+    """ Quits on window close and toggles the profiler overlay on F3. """
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             quit_game()
-
-def quit_game():
-    pygame.display.quit()
-    pygame.quit()
-    sys.exit()
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            game.profiler.toggle_overlay()
 
 if __name__ == "__main__":
-    change_to_file_directory()
     start_game()
@@ -0,0 +1,105 @@
+import heapq
+from side_scroller.settings import GameSettings
+from side_scroller.obstacle import Obstacle
+from side_scroller.difficulty import DifficultyTable, get_difficulty_table
+
+SPAWN_OBSTACLE = 0
+INCREASE_LEVEL = 1
+
+class SpawnEvent():
+    """ Something scheduled to happen on a simulation tick. """
+    __slots__ = ("tick", "kind", "x", "y", "image_index", "speed")
+
+    def __init__(self, tick: int, kind: int, x: int = 0, y: int = 0, image_index: int = 0, speed: int = 0):
+        self.tick = tick
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.image_index = image_index
+        self.speed = speed
+
+class SpawnScheduler():
+    """
+    Timeline of obstacle spawns and level increases, generated ahead of time.
+
+    Neither depends on the player's input: both follow from the tick count and the
+    difficulty table, since the level sets the spawn interval. The scheduler runs the same
+    counters as the game used to check every tick, but ahead of the game, pushing the
+    ticks they fire on into a heap.
+    Spawn positions come from the game's seeded rng in spawn order, so a seed still gives
+    the same run. Each tick only pops the events that are due.
+    """
+    def __init__(self, rng, difficulty: DifficultyTable = None, lookahead: int = None):
+        """
+        difficulty: Defaults to the table for the current settings.
+        lookahead: Ticks of events to keep generated past the current tick.
+        """
+        self.rng = rng
+        self.difficulty = difficulty or get_difficulty_table()
+        self.lookahead = GameSettings.spawn_lookahead_ticks if lookahead is None else lookahead
+        self.tick = 0
+        self.events = []
+        self.sequence = 0
+
+        #State of the timeline at the last generated tick
+        self.generated_tick = 0
+        self.count_to_obstacle_tick = 0
+        self.count_to_level_tick = 0
+        self.level = 1
+        self.obstacle_frequency = self.difficulty.get(1).spawn_interval
+
+    def generate_until(self, tick: int):
+        """ Extends the timeline through tick. """
+        image_count = len(Obstacle.images)
+        while self.generated_tick < tick:
+            self.generated_tick += 1
+            self.count_to_obstacle_tick += 1
+            self.count_to_level_tick += 1
+
+            if self.count_to_obstacle_tick > self.obstacle_frequency:
+                rng = self.rng
+                x = rng.randrange(GameSettings.width, GameSettings.width + 50)
+                y = rng.randrange(0, GameSettings.height)
+                image_index = rng.randrange(0, image_count)
+                self._push(SpawnEvent(self.generated_tick, SPAWN_OBSTACLE, x, y, image_index, rng.randint(1, 2)))
+                self.count_to_obstacle_tick -= self.obstacle_frequency
+
+            if self.count_to_level_tick > GameSettings.levelTick:
+                self._push(SpawnEvent(self.generated_tick, INCREASE_LEVEL))
+                self.count_to_level_tick -= GameSettings.levelTick
+                self.level += 1
+                self.obstacle_frequency = self.difficulty.get(self.level).spawn_interval
+
+    def _push(self, event: SpawnEvent):
+        heapq.heappush(self.events, (event.tick, self.sequence, event))
+        self.sequence += 1
+
+    def advance(self) -> list:
+        """
+        Moves to the next tick.
+
+        RETURNS: The events due on it, in the order they were scheduled.
+        """
+        self.tick += 1
+        self.generate_until(self.tick + self.lookahead)
+        due = []
+        while self.events and self.events[0][0] <= self.tick:
+            due.append(heapq.heappop(self.events)[2])
+        return due
+
+    def upcoming(self, ticks: int = None, kind: int = None) -> list:
+        """
+        ticks: How far ahead to look. Defaults to the whole lookahead.
+        kind: Only return events of this kind.
+
+        RETURNS: Scheduled events within ticks of the current tick, soonest first.
+        """
+        last_tick = self.tick + (self.lookahead if ticks is None else ticks)
+        self.generate_until(last_tick)
+        return [event for _, _, event in sorted(self.events)
+                if event.tick <= last_tick and (kind is None or event.kind == kind)]
+
+    def ticks_until(self, kind: int) -> int:
+        """ RETURNS: Ticks until the next event of kind, or None if none is scheduled in the lookahead. """
+        events = self.upcoming(kind=kind)
+        return events[0].tick - self.tick if events else None
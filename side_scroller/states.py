@@ -15,11 +15,9 @@ def up_key_state(game: Game):
     previous_orientation = player.orientation
     player.orientation = DIRECTIONS.get(1)
     if player.y != 0:
-        if player.can_move(player.get_current_speed() / game.fps_over_min, previous_orientation):
-            player.decrease_y_axis(
-                player.get_current_speed() + int(player.get_level_speed_boost()))
-        player.increase_speed_counter(1, game.fps_over_min)
-    game.screen.blit(player.up, (player.x, player.y))
+        player.decrease_y_axis(player.get_move_distance(player.game_settings.speed_scale, previous_orientation))
+        player.increase_speed_counter(1)
+    player.display_state = DIRECTIONS.get(1)
     return 0
 
 def should_player_move_down(keys: list, game: Game) -> bool:
@@ -31,14 +29,13 @@ def down_key_state(game: Game):
     previous_orientation = player.orientation
     player.orientation = DIRECTIONS.get(2)
     if player.y < Player.y_bottom_barrier:
-        if player.can_move(player.get_current_speed() / game.fps_over_min, previous_orientation):
-            player.increase_y_axis(player.get_current_speed() + int(player.get_level_speed_boost()))
-        game.screen.blit(player.down, (player.x, player.y))
+        player.increase_y_axis(player.get_move_distance(player.game_settings.speed_scale, previous_orientation))
+        player.display_state = DIRECTIONS.get(2)
     else:
-        game.screen.blit(player.neutral, (player.x, player.y))
-    if game.neutral_count <= (GameSettings.hoverLimit * game.fps_over_min):
+        player.display_state = DIRECTIONS.get(0)
+    if game.neutral_count <= GameSettings.hoverLimit:
         game.neutral_count = 0
-    player.increase_speed_counter(2, game.fps_over_min)
+    player.increase_speed_counter(2)
     return game.neutral_count
 
 def neutral_key_state(game: Game):
@@ -49,15 +46,14 @@ def neutral_key_state(game: Game):
     if player.is_moving_up():
         player.reset_speed()
         player.orientation = DIRECTIONS.get(0)
-        game.screen.blit(player.neutral, (player.x, player.y))
+        player.display_state = DIRECTIONS.get(0)
 
     elif player.is_moving_down() and player.is_above_bottom_barrier(): #Player can and is moving down
-        if player.can_move(player.get_current_speed(), previous_orientation):
-            player.increase_y_axis(player.get_current_speed() + int(player.get_level_speed_boost()))
+        player.increase_y_axis(player.get_move_distance(player.game_settings.speed_scale, previous_orientation))
         player.orientation = DIRECTIONS.get(2)
-        game.screen.blit(player.down, (player.x, player.y))
+        player.display_state = DIRECTIONS.get(2)
 
     else: #Player is hovering
-        game.screen.blit(player.neutral, (player.x, player.y))
+        player.display_state = DIRECTIONS.get(0)
 
-    return game.neutral_count + game.fps_over_min
+    return game.neutral_count + 1
@@ -0,0 +1,181 @@
+"""
+Batch simulator for tuning the difficulty curve.
+
+Plays many seeded headless games for every combination of a grid of GameSettings values,
+spread over a process pool, and summarizes survival time, level reached and where the
+player died. Each combination's row is printed as soon as its last game finishes.
+
+Usage:
+    python -m side_scroller.sweep --games 200 --param obstacle_frequency=20,40,60 --param levelTick=100,200
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from side_scroller.game import Game
+from side_scroller.inputs import PressedKeys, RandomInput, idle_input, UP_KEYS, DOWN_KEYS
+from side_scroller.settings import GameSettings
+from side_scroller.side_scroller import main_game_loop
+
+TUNABLE_SETTINGS = (
+    "obstacle_frequency", "obstacle_tick_adjustment", "min_obstacle_frequency", "levelTick", "frequencyTick",
+    "fpsTick", "hoverLimit")
+
+class ZigzagInput():
+    """ Input source that holds up, then down, for hold_ticks polls each. """
+    def __init__(self, seed: int = None, hold_ticks: int = 30):
+        self.hold_ticks = hold_ticks
+        self.polls = 0
+
+    def __call__(self) -> PressedKeys:
+        self.polls += 1
+        return UP_KEYS if (self.polls // self.hold_ticks) % 2 == 0 else DOWN_KEYS
+
+POLICIES = {
+    "random": RandomInput,
+    "idle": lambda seed: idle_input,
+    "zigzag": ZigzagInput}
+
+@contextlib.contextmanager
+def override_settings(settings: dict):
+    """ Temporarily replaces GameSettings class attributes. """
+    previous = {name: getattr(GameSettings, name) for name in settings}
+    for name, value in settings.items():
+        setattr(GameSettings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(GameSettings, name, value)
+
+def simulate_game(task: tuple) -> tuple:
+    """
+    Plays one headless game. task is (combination index, settings, seed, policy name).
+
+    RETURNS: (combination index, survival seconds, level reached, death y).
+    """
+    index, settings, seed, policy = task
+    with override_settings(settings):
+        game = Game(headless=True, render=False, input_source=POLICIES[policy](seed), seed=seed)
+        main_game_loop(game)
+    #Each tick adds 1 to the score and lasts 1 / minFps seconds
+    survival_seconds = game.player.score.score / GameSettings.minFps
+    return index, survival_seconds, game.player.score.level, game.player.y
+
+class SweepResult():
+    """ Aggregated games of one settings combination. """
+    def __init__(self, settings: dict):
+        self.settings = settings
+        self.survival_seconds = []
+        self.levels = []
+        self.death_ys = []
+
+    def add(self, survival_seconds: float, level: int, death_y: float):
+        self.survival_seconds.append(survival_seconds)
+        self.levels.append(level)
+        self.death_ys.append(death_y)
+
+    @property
+    def games(self) -> int:
+        return len(self.levels)
+
+    def summary(self) -> dict:
+        thirds = [0, 0, 0]
+        for death_y in self.death_ys:
+            thirds[min(max(int(death_y * 3 // GameSettings.height), 0), 2)] += 1
+        return {
+            **self.settings,
+            "games": self.games,
+            "survival_mean_s": statistics.fmean(self.survival_seconds),
+            "survival_p50_s": statistics.median(self.survival_seconds),
+            "survival_p90_s": get_quantile(self.survival_seconds, 0.9),
+            "level_mean": statistics.fmean(self.levels),
+            "level_max": max(self.levels),
+            "death_y_mean": statistics.fmean(self.death_ys),
+            "death_top_pct": 100 * thirds[0] / self.games,
+            "death_middle_pct": 100 * thirds[1] / self.games,
+            "death_bottom_pct": 100 * thirds[2] / self.games}
+
+def get_quantile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+def parse_param(text: str) -> tuple:
+    """ Parses "name=1,2,3". RETURNS: (name, [values]). """
+    name, _, values = text.partition("=")
+    if name not in TUNABLE_SETTINGS:
+        raise argparse.ArgumentTypeError(f"{name} is not one of {', '.join(TUNABLE_SETTINGS)}")
+    try:
+        return name, [float(value) if "." in value else int(value) for value in values.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Values for {name} must be numbers")
+
+def expand_grid(params: list) -> list:
+    """ RETURNS: A settings dict for every combination of the (name, values) params. """
+    names = [name for name, _ in params]
+    return [dict(zip(names, values)) for values in itertools.product(*(values for _, values in params))]
+
+def run_sweep(grid: list, games: int, policy: str = "random", processes: int = None,
+              on_result=None, first_seed: int = 0) -> list:
+    """
+    Plays games seeded games for each settings combination in grid over a process pool.
+    on_result is called with each SweepResult as soon as its combination completes.
+    Every combination uses the same seeds, so differences come from the settings alone.
+
+    RETURNS: The SweepResults in grid order.
+    """
+    results = [SweepResult(settings) for settings in grid]
+    tasks = [(index, settings, first_seed + seed, policy)
+             for index, settings in enumerate(grid) for seed in range(games)]
+    processes = processes or os.cpu_count()
+    chunksize = max(1, len(tasks) // (processes * 8))
+
+    with multiprocessing.Pool(processes) as pool:
+        for index, survival_seconds, level, death_y in pool.imap_unordered(simulate_game, tasks, chunksize):
+            result = results[index]
+            result.add(survival_seconds, level, death_y)
+            if result.games == games and on_result:
+                on_result(result)
+    return results
+
+def format_row(summary: dict, names: list) -> str:
+    settings = "".join(f"{summary[name]:>{max(len(name), 6) + 2}}" for name in names)
+    return (f"{settings}{summary['games']:>7}{summary['survival_mean_s']:>10.1f}"
+            f"{summary['survival_p50_s']:>10.1f}{summary['survival_p90_s']:>10.1f}"
+            f"{summary['level_mean']:>9.2f}{summary['level_max']:>7}"
+            f"{summary['death_top_pct']:>7.0f}%{summary['death_middle_pct']:>7.0f}%{summary['death_bottom_pct']:>7.0f}%")
+
+def format_header(names: list) -> str:
+    settings = "".join(f"{name:>{max(len(name), 6) + 2}}" for name in names)
+    return (f"{settings}{'games':>7}{'mean s':>10}{'p50 s':>10}{'p90 s':>10}"
+            f"{'level':>9}{'max':>7}{'top':>8}{'middle':>8}{'bottom':>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep GameSettings over many seeded headless games.")
+    parser.add_argument("--param", type=parse_param, action="append", default=[], metavar="NAME=V1,V2",
+                        help=f"Values to sweep. One of: {', '.join(TUNABLE_SETTINGS)}.")
+    parser.add_argument("--games", type=int, default=100, help="Games per combination.")
+    parser.add_argument("--policy", choices=list(POLICIES), default="random")
+    parser.add_argument("--processes", type=int, help="Defaults to every core.")
+    parser.add_argument("--output", help="Write every combination's summary to this JSON file.")
+    args = parser.parse_args()
+
+    names = [name for name, _ in args.param]
+    print(format_header(names))
+    results = run_sweep(expand_grid(args.param), args.games, args.policy, args.processes,
+                        on_result=lambda result: print(format_row(result.summary(), names), flush=True))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump([result.summary() for result in results], output_file, indent=2)
+
+if __name__ == "__main__":
+    main()
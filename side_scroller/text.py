@@ -0,0 +1,36 @@
+import functools
+import pygame
+
+@functools.lru_cache(maxsize=64)
+def render_text(font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+    """ Antialiased font.render, cached for fixed labels. Render text that changes directly, or it evicts them. """
+    return font.render(text, True, color)
+
+class DigitAtlas():
+    """
+    Pre-rendered glyphs for a fixed prefix and the characters of an integer. Numbers are
+    drawn by blitting cached glyphs side by side instead of rendering new text.
+    """
+    characters = "0123456789-"
+
+    def __init__(self, font: pygame.font.Font, color: tuple, prefix: str = ""):
+        self.prefix = render_text(font, prefix, color) if prefix else None
+        self.glyphs = {character: font.render(character, True, color) for character in self.characters}
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+
+    def layout(self, value: int, topleft: tuple = (0, 0)) -> tuple:
+        """ RETURNS: The blits that draw the prefix and value, and the rect they cover. """
+        x, y = topleft
+        blits = []
+        if self.prefix is not None:
+            blits.append((self.prefix, (x, y)))
+            x += self.prefix.get_width()
+        for character in str(value):
+            glyph = self.glyphs[character]
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return blits, pygame.Rect(topleft[0], y, x - topleft[0], self.height)
+
+@functools.lru_cache(maxsize=16)
+def get_digit_atlas(font: pygame.font.Font, color: tuple, prefix: str = "") -> DigitAtlas:
+    return DigitAtlas(font, color, prefix)
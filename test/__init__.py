@@ -0,0 +1,24 @@
+"""
+Tests never touch the saved leaderboard. Importing the test package points Score at an
+empty one in a temporary directory, and isolate_leaderboard gives a single test its own.
+"""
+import atexit
+import os
+import tempfile
+from side_scroller.leaderboard import Leaderboard, BackgroundWriter
+from side_scroller.score import Score
+
+def isolate_leaderboard(test_case):
+    """ Points Score at an empty leaderboard in a temporary directory until test_case finishes. """
+    directory = tempfile.TemporaryDirectory()
+    writer = BackgroundWriter()
+    test_case.addCleanup(directory.cleanup)
+    test_case.addCleanup(setattr, Score, "leaderboard", Score.leaderboard)
+    test_case.addCleanup(writer.flush)
+    Score.leaderboard = Leaderboard(os.path.join(directory.name, "leaderboard.json"), writer=writer)
+
+_directory = tempfile.TemporaryDirectory()
+_writer = BackgroundWriter()
+atexit.register(_directory.cleanup)
+atexit.register(_writer.flush)
+Score.leaderboard = Leaderboard(os.path.join(_directory.name, "leaderboard.json"), writer=_writer)
@@ -0,0 +1,96 @@
+import os
+import unittest
+import pygame
+from side_scroller.assets import AssetManager, ImageAsset, make_flash_variant
+from side_scroller.constants import PLAYER_PATH
+from side_scroller.player import Player
+
+class AssetTests(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = AssetManager()
+        self.manager.register_image("up", f"{PLAYER_PATH}up_state.png")
+
+    def test_image_only_loads_once(self):
+        first = self.manager.image("up")
+        self.manager.register_image("up", f"{PLAYER_PATH}up_state.png")
+        self.assertIs(self.manager.image("up"), first)
+
+    def test_flash_variant_is_white_and_keeps_transparency(self):
+        image = self.manager.image("up")
+        flash = make_flash_variant(image)
+
+        for x in range(image.get_width()):
+            for y in range(image.get_height()):
+                self.assertEqual(flash.get_at((x, y)).a, image.get_at((x, y)).a)
+                if image.get_at((x, y)).a:
+                    self.assertEqual(tuple(flash.get_at((x, y)))[:3], (255, 255, 255))
+
+    def test_report_includes_derived_images(self):
+        self.manager.register_derived_image("up_white", "up", make_flash_variant)
+        self.manager.image("up_white")
+        names = [row[0] for row in self.manager.report()]
+
+        self.assertEqual(names, ["up", "up_white"])
+        self.assertTrue(all(row[2] > 0 for row in self.manager.report()))
+
+    def test_convert_rebuilds_derived_images(self):
+        self.manager.register_derived_image("up_white", "up", make_flash_variant)
+        self.manager.image("up_white")
+        pygame.display.init()
+        pygame.display.set_mode((10, 10))
+
+        self.manager.convert()
+        self.assertTrue(self.manager.converted)
+        self.assertEqual(self.manager.version, 1)
+        self.assertEqual(
+            self.manager.image("up_white").get_size(), self.manager.image("up").get_size())
+        pygame.display.quit()
+
+    def test_player_images_resolve_through_assets(self):
+        self.assertIsInstance(Player.up, pygame.Surface)
+        self.assertIsInstance(Player().down_white, pygame.Surface)
+
+class LazyRegistryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = AssetManager()
+
+    def test_registered_image_loads_on_first_use(self):
+        self.manager.register_image("down", f"{PLAYER_PATH}down_state.png")
+        self.assertNotIn("down", self.manager.images)
+
+        self.manager.image("down")
+        self.assertIn("down", self.manager.images)
+
+    def test_derived_image_loads_its_base(self):
+        self.manager.register_image("down", f"{PLAYER_PATH}down_state.png")
+        self.manager.register_derived_image("down_white", "down", make_flash_variant)
+
+        self.manager.image("down_white")
+        self.assertIn("down", self.manager.images)
+
+    def test_font_survives_font_module_restart(self):
+        first = self.manager.font("Ariel", 20)
+        pygame.font.quit()
+
+        second = self.manager.font("Ariel", 20)
+        self.assertIsNot(first, second)
+        self.assertIsInstance(second.render("1", True, (0, 0, 0)), pygame.Surface)
+
+    def test_paths_do_not_depend_on_working_directory(self):
+        self.assertTrue(os.path.isabs(PLAYER_PATH))
+
+class MaskTests(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = AssetManager()
+        self.manager.register_image("up", f"{PLAYER_PATH}up_state.png")
+
+    def test_mask_is_built_once_from_alpha(self):
+        mask = self.manager.mask("up")
+        image = self.manager.image("up")
+
+        self.assertIs(self.manager.mask("up"), mask)
+        self.assertEqual(mask.get_size(), image.get_size())
+        self.assertLess(mask.count(), image.get_width() * image.get_height())
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+import pygame
+from side_scroller.assets import AssetManager
+from side_scroller.atlas import get_atlas_sprites, build_atlas, pack_shelves
+from side_scroller.constants import ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH
+
+def get_pixels(surface: pygame.Surface) -> tuple:
+    return pygame.surfarray.array3d(surface), pygame.surfarray.array_alpha(surface)
+
+class AtlasTests(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = AssetManager()
+        self.manager.register_atlas("atlas", ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH)
+
+    def test_packed_rects_do_not_overlap(self):
+        sizes = [(30, 10), (10, 40), (25, 25), (5, 5), (40, 8)]
+        positions, sheet_size = pack_shelves(sizes)
+        rects = [pygame.Rect(position, size) for position, size in zip(positions, sizes)]
+        sheet = pygame.Rect((0, 0), sheet_size)
+
+        for index, rect in enumerate(rects):
+            self.assertTrue(sheet.contains(rect))
+            self.assertEqual(rect.collidelist(rects[index + 1:]), -1)
+
+    def test_sprites_are_views_of_one_surface(self):
+        atlas = self.manager.image("atlas")
+        for name in ["player/up", "player/up_white", "obstacles/obstacle.png"]:
+            self.assertIs(self.manager.image(name).get_parent(), atlas)
+
+    def test_saved_atlas_matches_source_files(self):
+        """ Fails when a sprite changed without rerunning python -m side_scroller.atlas. """
+        for name, image in get_atlas_sprites():
+            expected_rgb, expected_alpha = get_pixels(image)
+            rgb, alpha = get_pixels(self.manager.image(name))
+
+            np.testing.assert_array_equal(alpha, expected_alpha, err_msg=name)
+            opaque = expected_alpha > 0
+            np.testing.assert_array_equal(rgb[opaque], expected_rgb[opaque], err_msg=name)
+
+    def test_built_atlas_indexes_every_sprite(self):
+        sprites = get_atlas_sprites()
+        atlas, index = build_atlas(sprites)
+
+        self.assertEqual(set(index), {name for name, _ in sprites})
+        for name, image in sprites:
+            self.assertEqual(atlas.subsurface(pygame.Rect(index[name])).get_size(), image.get_size())
+
+    def test_views_are_not_counted_twice_in_report(self):
+        self.manager.image("player/up")
+        sizes = {name: size for name, _, size in self.manager.report()}
+
+        self.assertEqual(sizes["player/up"], 0)
+        self.assertGreater(sizes["atlas"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
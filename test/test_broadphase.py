@@ -0,0 +1,60 @@
+import random
+import unittest
+import pygame
+from side_scroller.broadphase import SpatialGrid
+from side_scroller.obstacle import ObstacleStore
+from side_scroller.player import Player, DIRECTIONS
+
+class SpatialGridTests(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = SpatialGrid(cell_size=10, capacity=4)
+
+    def test_query_finds_nearby_slots_only(self):
+        self.grid.insert(0, 0, 0, 5, 5)
+        self.grid.insert(1, 100, 100, 5, 5)
+
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 10, 10)), {0})
+
+    def test_large_slot_is_in_every_cell_it_touches(self):
+        self.grid.insert(0, 5, 5, 30, 10)
+        self.assertEqual(self.grid.query(pygame.Rect(32, 12, 1, 1)), {0})
+
+    def test_remove(self):
+        self.grid.insert(0, 0, 0, 5, 5)
+        self.grid.remove(0)
+
+        self.assertEqual(self.grid.query(pygame.Rect(0, 0, 10, 10)), set())
+        self.assertFalse(any(self.grid.cells.values()))
+
+class StoreQueryTests(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.store = ObstacleStore()
+        for _ in range(300):
+            self.store.add(random.randrange(-100, 900), random.randrange(0, 600), random.randrange(0, 3), 1)
+
+    def brute_force(self, rect: pygame.Rect) -> list:
+        return sorted(slot for slot in self.store.active_slots().tolist()
+                      if rect.colliderect(pygame.Rect(
+                          int(self.store.x[slot]), int(self.store.y[slot]),
+                          int(self.store.width[slot]), int(self.store.height[slot]))))
+
+    def test_query_matches_brute_force_after_moves(self):
+        for _ in range(20):
+            self.store.advance(7)
+            self.store.cull()
+            for rect in (pygame.Rect(0, 0, 58, 600), pygame.Rect(0, 300, 58, 54), pygame.Rect(200, 50, 300, 20)):
+                self.assertEqual(self.store.query_slots(rect), self.brute_force(rect))
+
+    def test_player_collision_matches_full_scan(self):
+        player = Player(0, 0)
+        for y in range(0, Player.y_bottom_barrier, 25):
+            player.increase_y_axis(y - player.y)
+            for orientation in DIRECTIONS.values():
+                player.orientation = orientation
+                expected = any(
+                    pygame.sprite.spritecollide(hitbox, self.store, False)
+                    for hitbox in player.hitboxes if hitbox.orientation == orientation)
+                self.assertEqual(player.is_colliding_with_obstacles(self.store), expected)
@@ -0,0 +1,69 @@
+import unittest
+from side_scroller.clock import SimulationClock
+from side_scroller.game import Game
+from side_scroller.inputs import idle_input
+import side_scroller.side_scroller as side_scroller
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+class SimulationClockTests(unittest.TestCase):
+
+    def setUp(self):
+        self.time = FakeTime()
+        self.clock = SimulationClock(60, time_source=self.time)
+
+    def test_first_frame_runs_one_tick(self):
+        self.assertEqual(self.clock.begin_frame(60), 1)
+
+    def test_ticks_follow_tick_rate_not_frame_rate(self):
+        self.clock.begin_frame(150)
+        ticks = 0
+        for _ in range(60):
+            self.time.now += 1 / 60
+            ticks += self.clock.begin_frame(150)
+        self.assertAlmostEqual(ticks, 150, delta=1)
+
+    def test_alpha_is_leftover_fraction_of_tick(self):
+        self.clock.begin_frame(100)
+        self.time.now += 0.025
+        self.assertEqual(self.clock.begin_frame(100), 2)
+        self.assertAlmostEqual(self.clock.alpha, 0.5)
+
+    def test_long_stall_is_dropped(self):
+        self.clock.begin_frame(60)
+        self.time.now += 10
+        self.assertEqual(self.clock.begin_frame(60), self.clock.max_ticks_per_frame)
+        self.assertEqual(self.clock.accumulator, 0)
+
+    def test_non_realtime_clock_runs_one_tick_per_frame(self):
+        clock = SimulationClock(60, realtime=False, time_source=self.time)
+        self.time.now += 10
+        self.assertEqual(clock.begin_frame(60), 1)
+
+class RenderFrameTests(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True, input_source=idle_input)
+
+    def test_simulate_tick_does_not_draw(self):
+        side_scroller.simulate_tick(self.game)
+        self.assertEqual(self.game.drawn_rects, [])
+
+    def test_render_frame_tracks_drawn_sprites(self):
+        self.game.obstacles.add(300, 300, 0, 1)
+        side_scroller.render_frame(self.game)
+        self.assertEqual(len(self.game.drawn_rects), 2)
+
+        side_scroller.render_frame(self.game)
+        self.assertEqual(len(self.game.drawn_rects), 2)
+
+    def test_render_frame_interpolates_player(self):
+        self.game.player.previous_y = 100
+        self.game.player.y = 110
+        side_scroller.render_frame(self.game, 0.5)
+        self.assertEqual(self.game.drawn_rects[0].y, 105)
@@ -0,0 +1,46 @@
+import unittest
+import pygame
+from side_scroller.compositor import FrameCompositor, merge_rects
+
+class CompositorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.compositor = FrameCompositor(pygame.Rect(0, 0, 800, 600))
+        self.compositor.clear()
+
+    def test_first_frame_is_full_update(self):
+        compositor = FrameCompositor(pygame.Rect(0, 0, 800, 600))
+        self.assertIsNone(compositor.get_update_rects())
+
+    def test_overlapping_rects_are_merged(self):
+        self.compositor.add(pygame.Rect(0, 0, 20, 20))
+        self.compositor.add(pygame.Rect(10, 10, 20, 20))
+        self.compositor.add(pygame.Rect(100, 100, 5, 5))
+
+        self.assertEqual(
+            sorted(map(tuple, self.compositor.get_update_rects())),
+            [(0, 0, 30, 30), (100, 100, 5, 5)])
+
+    def test_rects_are_clipped_to_screen(self):
+        self.compositor.add(pygame.Rect(-10, -10, 20, 20))
+        self.compositor.add(pygame.Rect(900, 0, 20, 20))
+
+        self.assertEqual(self.compositor.get_update_rects(), [pygame.Rect(0, 0, 10, 10)])
+
+    def test_large_damage_falls_back_to_full_update(self):
+        self.compositor.add(pygame.Rect(0, 0, 800, 400))
+        self.assertIsNone(self.compositor.get_update_rects())
+
+    def test_too_many_rects_falls_back_to_full_update(self):
+        for i in range(self.compositor.max_rects + 1):
+            self.compositor.add(pygame.Rect(i * 10, 0, 5, 5))
+        self.assertIsNone(self.compositor.get_update_rects())
+
+    def test_clear_starts_new_frame(self):
+        self.compositor.add(pygame.Rect(0, 0, 5, 5))
+        self.compositor.clear()
+        self.assertEqual(self.compositor.get_update_rects(), [])
+
+    def test_merge_rects_chain(self):
+        rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 0, 10, 10), pygame.Rect(5, 0, 20, 10)]
+        self.assertEqual(merge_rects(rects), [pygame.Rect(0, 0, 30, 10)])
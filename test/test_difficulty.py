@@ -0,0 +1,72 @@
+import csv
+import os
+import tempfile
+import unittest
+import numpy as np
+from side_scroller.settings import GameSettings
+from side_scroller.difficulty import DifficultyTable, get_difficulty_table, get_next_spawn_interval
+from side_scroller.sweep import override_settings
+
+class DifficultyTableTests(unittest.TestCase):
+
+    def setUp(self):
+        self.table = DifficultyTable()
+
+    def test_first_level_uses_starting_settings(self):
+        level = self.table.get(1)
+        self.assertEqual(level.speed_scale, 1)
+        self.assertEqual(level.obstacle_speed, 0)
+        self.assertEqual(level.spawn_interval, GameSettings.obstacle_frequency)
+        self.assertEqual(level.level_speed_boost, 0)
+
+    def test_speed_scale_rises_to_max_before_obstacles_speed_up(self):
+        max_scale = GameSettings.maxFps / GameSettings.minFps
+        levels = [self.table.get(level) for level in range(1, len(self.table) + 1)]
+        for earlier, later in zip(levels, levels[1:]):
+            if earlier.speed_scale < max_scale:
+                self.assertAlmostEqual(later.speed_scale, earlier.speed_scale + GameSettings.fpsTick / GameSettings.minFps)
+                self.assertEqual(later.obstacle_speed, earlier.obstacle_speed)
+            else:
+                self.assertEqual(later.obstacle_speed, earlier.obstacle_speed + GameSettings.obstacle_tick_speed_adjustments)
+
+    def test_levels_past_table_extrapolate(self):
+        last = self.table.get(len(self.table))
+        later = self.table.get(len(self.table) + 10)
+
+        self.assertEqual(later.speed_scale, last.speed_scale)
+        self.assertEqual(later.spawn_interval, last.spawn_interval)
+        self.assertEqual(later.obstacle_speed, last.obstacle_speed + 10 * GameSettings.obstacle_tick_speed_adjustments)
+
+    def test_lookup_matches_get(self):
+        levels = np.array([1, 5, len(self.table), len(self.table) + 7])
+        for column in ("speed_scale", "obstacle_speed", "spawn_interval", "level_speed_boost"):
+            np.testing.assert_array_equal(
+                self.table.lookup(column, levels), [getattr(self.table.get(level), column) for level in levels])
+
+    def test_spawn_interval_halving_stops_at_floor(self):
+        with override_settings({"obstacle_frequency": 7, "obstacle_tick_adjustment": 40, "min_obstacle_frequency": 2}):
+            self.assertEqual(get_next_spawn_interval(7), 3)
+            self.assertEqual(get_next_spawn_interval(3), 2)
+            self.assertEqual(get_next_spawn_interval(2), 2)
+
+            intervals = DifficultyTable().columns["spawn_interval"]
+        self.assertEqual(intervals.min(), 2)
+
+    def test_table_is_rebuilt_only_when_settings_change(self):
+        table = get_difficulty_table()
+        self.assertIs(get_difficulty_table(), table)
+        with override_settings({"fpsTick": GameSettings.fpsTick + 1}):
+            self.assertIsNot(get_difficulty_table(), table)
+
+    def test_export_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "difficulty.csv")
+            self.table.export(path, levels=len(self.table) + 5)
+            with open(path) as export_file:
+                rows = list(csv.DictReader(export_file))
+
+        self.assertEqual(len(rows), len(self.table) + 5)
+        self.assertEqual(float(rows[0]["spawn_interval"]), GameSettings.obstacle_frequency)
+
+if __name__ == "__main__":
+    unittest.main()
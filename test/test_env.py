@@ -0,0 +1,101 @@
+import unittest
+import numpy as np
+from side_scroller.env import SideScrollerEnv, VectorSideScrollerEnv, UP, NEUTRAL
+from side_scroller.score import Score
+from side_scroller.settings import GameSettings
+from side_scroller.sweep import override_settings
+
+class SideScrollerEnvTests(unittest.TestCase):
+
+    def test_reset_and_step(self):
+        env = SideScrollerEnv(nearest_obstacles=3, seed=1)
+        observation = env.reset()
+        self.assertEqual(observation.shape, (env.observation_size,))
+        self.assertEqual(observation[0], env.game.player.y / GameSettings.height)
+        self.assertEqual(list(observation[4:]), [1, 0, 0, 0] * 3)
+
+        observation, reward, done, info = env.step(UP)
+        self.assertEqual(list(observation[1:4]), [0, 1, 0])
+        self.assertGreater(reward, 0)
+        self.assertFalse(done)
+        self.assertEqual(info["level"], 1)
+
+    def test_game_ends_on_collision(self):
+        env = SideScrollerEnv(seed=2)
+        env.reset()
+        done = False
+        for _ in range(100000):
+            _, _, done, _ = env.step(NEUTRAL)
+            if done:
+                break
+        self.assertTrue(done)
+
+    def test_reset_keeps_high_score_off_saved_leaderboard(self):
+        env = SideScrollerEnv(seed=2)
+        env.reset()
+        saved_best = Score().get_high_score()
+        for _ in range(10):
+            env.step(NEUTRAL)
+        env.reset()
+
+        score = env.game.player.score
+        self.assertEqual(score.score, 0)
+        self.assertEqual(score.get_high_score(), 10)
+        self.assertEqual(Score().get_high_score(), saved_best)
+
+class VectorSideScrollerEnvTests(unittest.TestCase):
+
+    def test_matches_single_game_without_obstacles(self):
+        actions = np.repeat(np.random.default_rng(0).integers(0, 3, 150), 12)
+        with override_settings({"obstacle_frequency": 10 ** 9}):
+            env = SideScrollerEnv(seed=3)
+            env.reset()
+            vector_env = VectorSideScrollerEnv(1, seed=3)
+            vector_env.reset()
+            vector_env.y[:] = env.game.player.y
+
+            for action in actions:
+                env.step(int(action))
+                vector_env.step([action])
+                player = env.game.player
+                self.assertEqual(
+                    (player.y, player.current_speed, player.score.level),
+                    (vector_env.y[0], vector_env.current_speed[0], vector_env.level[0]))
+                self.assertAlmostEqual(player.score.score, vector_env.score[0])
+
+    def test_collision_ends_and_resets_game(self):
+        vector_env = VectorSideScrollerEnv(2, seed=1)
+        vector_env.reset()
+        vector_env.obstacle_x[0, 0] = 10
+        vector_env.obstacle_y[0, 0] = vector_env.y[0]
+        vector_env.obstacle_width[0, 0] = 20
+        vector_env.obstacle_height[0, 0] = 20
+        vector_env.obstacle_active[0, 0] = True
+
+        observations, rewards, dones, info = vector_env.step([NEUTRAL, NEUTRAL])
+        self.assertEqual(list(dones), [True, False])
+        self.assertGreater(info["final_score"][0], 0)
+        self.assertTrue(np.isnan(info["final_score"][1]))
+        self.assertEqual(vector_env.score[0], 0)
+        self.assertFalse(vector_env.obstacle_active[0].any())
+
+    def test_obstacle_capacity_grows(self):
+        vector_env = VectorSideScrollerEnv(3, seed=1, obstacle_capacity=2)
+        vector_env.reset()
+        for _ in range(3):
+            vector_env.add_obstacles(np.arange(3))
+
+        self.assertEqual(vector_env.obstacle_active.sum(axis=1).tolist(), [3, 3, 3])
+        self.assertEqual(vector_env.get_observations().shape, (3, vector_env.observation_size))
+
+    def test_observations_list_nearest_obstacles_first(self):
+        vector_env = VectorSideScrollerEnv(1, nearest_obstacles=2, seed=1)
+        vector_env.reset()
+        for slot, x in enumerate((500, 100, 300)):
+            vector_env.obstacle_x[0, slot] = x
+            vector_env.obstacle_width[0, slot] = 10
+            vector_env.obstacle_active[0, slot] = True
+
+        observation = vector_env.get_observations()[0]
+        self.assertAlmostEqual(observation[4], 100 / GameSettings.width)
+        self.assertAlmostEqual(observation[8], 300 / GameSettings.width)
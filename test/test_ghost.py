@@ -0,0 +1,143 @@
+import threading
+import time
+import unittest
+from side_scroller.game import Game
+from side_scroller.inputs import RandomInput
+from side_scroller.ghost import (GhostClient, GhostPacket, is_newer_sequence, parse_address, get_runs,
+                                 FULL_POSITION, ENDED, HAS_ACK)
+from side_scroller.relay import Relay
+from side_scroller.replay_runner import run_replay
+from side_scroller.settings import GameSettings
+from side_scroller.side_scroller import run_frame, simulate_tick
+from test import isolate_leaderboard
+
+class GhostPacketTests(unittest.TestCase):
+
+    def test_full_position_round_trip(self):
+        packet = GhostPacket(race=7, round_number=1, sequence=5, ack=4, tick=300, flags=FULL_POSITION | HAS_ACK | 2,
+                             y=-40, first_input_tick=290, input_runs=[(1, 4), (0, 200)])
+        loaded = GhostPacket.from_bytes(packet.to_bytes())
+
+        self.assertEqual(
+            (loaded.race, loaded.round_number, loaded.sequence, loaded.ack, loaded.tick, loaded.flags,
+             loaded.y, loaded.baseline, loaded.first_input_tick, loaded.input_runs),
+            (7, 1, 5, 4, 300, FULL_POSITION | HAS_ACK | 2, -40, None, 290, [(1, 4), (0, 200)]))
+
+    def test_delta_position_is_smaller(self):
+        full = GhostPacket(7, 1, 5, 4, 300, FULL_POSITION, y=500)
+        delta = GhostPacket(7, 1, 5, 4, 300, ENDED, y=-3, baseline=2)
+        loaded = GhostPacket.from_bytes(delta.to_bytes())
+
+        self.assertEqual((loaded.y, loaded.baseline, loaded.flags), (-3, 2, ENDED))
+        self.assertLessEqual(len(delta.to_bytes()), len(full.to_bytes()) + 1)
+
+    def test_rejects_other_data(self):
+        self.assertIsNone(GhostPacket.from_bytes(b"not a ghost packet"))
+        data = GhostPacket(7, 1, 5, 4, 300, 0, y=1, baseline=2, input_runs=[(1, 300)]).to_bytes()
+        self.assertIsNone(GhostPacket.from_bytes(data[:-1]))
+
+    def test_sequence_comparison_wraps(self):
+        self.assertTrue(is_newer_sequence(1, 0))
+        self.assertTrue(is_newer_sequence(0, 65535))
+        self.assertFalse(is_newer_sequence(65535, 0))
+        self.assertFalse(is_newer_sequence(3, 3))
+
+    def test_runs(self):
+        self.assertEqual(get_runs(bytes([1, 1, 0, 2, 2, 2])), [[1, 2], [0, 1], [2, 3]])
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("example.com:47800"), ("example.com", 47800))
+        self.assertEqual(parse_address(":5"), ("127.0.0.1", 5))
+
+class GhostRaceTests(unittest.TestCase):
+
+    def setUp(self):
+        #Racers that start new games save their scores
+        isolate_leaderboard(self)
+        self.relay = Relay()
+        self.stopped = threading.Event()
+        self.relay_thread = threading.Thread(target=self.relay.serve, args=(self.stopped.is_set, 0.01), daemon=True)
+        self.relay_thread.start()
+        self.clients = []
+
+    def tearDown(self):
+        self.stopped.set()
+        self.relay_thread.join()
+        self.relay.close()
+        for client in self.clients:
+            client.close()
+
+    def start_racer(self, seed: int, input_seed: int) -> tuple:
+        game = Game(headless=True, render=False, input_source=RandomInput(input_seed), seed=seed)
+        client = GhostClient(self.relay.address, seed)
+        self.clients.append(client)
+        client.start_round(game)
+        return game, client
+
+    def wait_for_relay(self):
+        time.sleep(0.002)
+
+    def test_receive_without_data_does_not_block(self):
+        _, client = self.start_racer(seed=1, input_seed=1)
+        started = time.perf_counter()
+        client.receive()
+        self.assertLess(time.perf_counter() - started, 0.05)
+        self.assertEqual(client.packets_received, 0)
+
+    def test_peer_input_replays_their_run(self):
+        racers = [self.start_racer(seed=5, input_seed=1), self.start_racer(seed=5, input_seed=2)]
+        ended = [False, False]
+        for frame in range(100000):
+            for index, (game, client) in enumerate(racers):
+                if ended[index]:
+                    client.update(True)
+                else:
+                    ended[index] = run_frame(game)
+            if frame % 16 == 0:
+                self.wait_for_relay()
+            if all(ended) and all(client.acked_input_tick == len(client.local_inputs) for _, client in racers):
+                break
+        for _, client in racers:
+            client.finish_round()
+        self.wait_for_relay()
+        for _, client in racers:
+            client.receive()
+
+        for (game, client), (peer_game, peer_client) in zip(racers, reversed(racers)):
+            self.assertTrue(client.peer_ended)
+            self.assertFalse(client.ghost_visible)
+            self.assertEqual(client.peer_replay.tick_count, len(peer_client.local_inputs))
+            self.assertEqual(run_replay(client.peer_replay).player.score.score, peer_game.player.score.score)
+            self.assertIsNone(game.ghost)
+
+    def test_ghost_follows_peer_position(self):
+        (game, client), (peer_game, peer_client) = self.start_racer(3, 1), self.start_racer(3, 2)
+        for _ in range(40):
+            run_frame(game)
+            run_frame(peer_game)
+            self.wait_for_relay()
+        client.update()
+
+        self.assertTrue(client.ghost_visible)
+        self.assertEqual(client.ghost.y, peer_client.sent[client.peer_sequence][0])
+        self.assertGreater(client.acked_input_tick, 0)
+
+    def test_bandwidth_at_max_tick_rate(self):
+        (game, client), (peer_game, peer_client) = self.start_racer(9, 1), self.start_racer(9, 2)
+        ticks_per_frame = round(GameSettings.maxFps / GameSettings.render_fps) + 1
+        frames = 0
+        for _ in range(300):
+            for racing_game, racing_client in ((game, client), (peer_game, peer_client)):
+                for _ in range(ticks_per_frame):
+                    if simulate_tick(racing_game):
+                        racing_game.prepare_new_game(9)
+                racing_client.update()
+            frames += 1
+            self.wait_for_relay()
+
+        bytes_per_second = client.bytes_sent * GameSettings.render_fps / frames
+        self.assertLess(bytes_per_second, 3000)
+        self.assertEqual(client.packets_sent, frames // client.send_interval)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import pygame
+from side_scroller.game import Game, NullSurface
+from side_scroller.inputs import PressedKeys, RandomInput, idle_input
+from side_scroller.headless import run_headless_game, measure_throughput
+import side_scroller.side_scroller as side_scroller
+
+class HeadlessTests(unittest.TestCase):
+
+    def test_headless_game_does_not_open_window(self):
+        game = Game(headless=True)
+        self.assertNotEqual(game.screen, pygame.display.get_surface())
+        self.assertEqual(game.screen.get_size(), (800, 600))
+
+    def test_headless_game_without_render_uses_null_surface(self):
+        game = Game(headless=True, render=False)
+        self.assertIsInstance(game.screen, NullSurface)
+
+    def test_injected_input_source_is_used(self):
+        game = Game(headless=True, render=False, input_source=lambda: PressedKeys((pygame.K_UP,)))
+        game.player.y = 100
+        side_scroller.respond_to_key_press(game)
+        self.assertEqual(game.player.orientation, "up")
+
+    def test_run_headless_game_ends(self):
+        self.assertGreater(run_headless_game(idle_input), 0)
+
+    def test_random_input_is_repeatable(self):
+        first = RandomInput(5)
+        second = RandomInput(5)
+        for _ in range(100):
+            self.assertIs(first(), second())
+
+    def test_measure_throughput(self):
+        report = measure_throughput(3)
+        self.assertEqual(report.games, 3)
+        self.assertEqual(len(report.scores), 3)
+        self.assertGreater(report.games_per_second, 0)
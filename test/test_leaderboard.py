@@ -0,0 +1,83 @@
+import json
+import os
+import stat
+import tempfile
+import unittest
+from side_scroller.leaderboard import (Leaderboard, BackgroundWriter, read_leaderboard_file,
+                                       write_atomic, NEW_FILE_MODE)
+
+class LeaderboardTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "leaderboard.json")
+        self.writer = BackgroundWriter()
+        self.leaderboard = Leaderboard(self.path, size=3, writer=self.writer)
+
+    def tearDown(self):
+        self.writer.flush()
+        self.directory.cleanup()
+
+    def test_keeps_best_runs_in_order(self):
+        for score in (5, 50, 20, 1, 30):
+            self.leaderboard.submit(score, save=False)
+
+        self.assertEqual([entry.score for entry in self.leaderboard.entries], [50, 30, 20])
+        self.assertEqual(self.leaderboard.best, 50)
+
+    def test_submit_reports_new_best(self):
+        self.assertTrue(self.leaderboard.submit(10, save=False))
+        self.assertFalse(self.leaderboard.submit(5, save=False))
+        self.assertTrue(self.leaderboard.submit(15, save=False))
+
+    def test_saved_runs_reload(self):
+        self.leaderboard.submit(42.5, level=4)
+        self.assertTrue(self.writer.flush())
+
+        reloaded = Leaderboard(self.path, writer=self.writer)
+        self.assertEqual(reloaded.best, 42.5)
+        self.assertEqual(reloaded.entries[0].level, 4)
+
+    def test_leaderboard_without_path_is_not_saved(self):
+        leaderboard = Leaderboard(writer=self.writer)
+        leaderboard.submit(42.5)
+        self.assertTrue(self.writer.flush())
+
+        self.assertEqual(leaderboard.best, 42.5)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_imports_legacy_high_score(self):
+        legacy_path = os.path.join(self.directory.name, "highscore.txt")
+        with open(legacy_path, "w") as legacy_file:
+            json.dump({"score": 795.14}, legacy_file)
+
+        self.assertEqual(Leaderboard(self.path, legacy_path=legacy_path, writer=self.writer).best, 795.14)
+
+    def test_empty_and_corrupt_files_load_as_empty(self):
+        for contents in ("", "{not json"):
+            with open(self.path, "w") as leaderboard_file:
+                leaderboard_file.write(contents)
+            self.assertEqual(read_leaderboard_file(self.path), [])
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        write_atomic(self.path, "{}")
+        write_atomic(self.path, '{"entries": []}')
+
+        self.assertEqual(os.listdir(self.directory.name), ["leaderboard.json"])
+        with open(self.path) as leaderboard_file:
+            self.assertEqual(leaderboard_file.read(), '{"entries": []}')
+
+    def test_atomic_write_keeps_file_mode(self):
+        write_atomic(self.path, "{}")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), NEW_FILE_MODE)
+
+        os.chmod(self.path, 0o640)
+        write_atomic(self.path, '{"entries": []}')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_writer_writes_latest_contents(self):
+        for score in range(100):
+            self.leaderboard.submit(score)
+        self.writer.flush()
+
+        self.assertEqual([entry.score for entry in read_leaderboard_file(self.path)], [99, 98, 97])
@@ -1,13 +1,13 @@
 import unittest
 import pygame
-from side_scroller.obstacle import Obstacle, move_obstacles
+from side_scroller.obstacle import Obstacle, ObstaclePool, ObstacleStore, move_obstacles
 from side_scroller.game import Game
 
 class ObstacleTests(unittest.TestCase):
 
     def setUp(self):
         self.game = Game()
-        self.game.obstacles = list()
+        self.game.obstacles = ObstacleStore()
 
     def test_move_obstacles_all_on_screen(self):
         x_coordinates = [100, 200, 300]
@@ -34,4 +34,122 @@ class ObstacleTests(unittest.TestCase):
         self.assertEqual(len(self.game.obstacles), 2)
 
     def append_obstacle_at_coordinate(self, x: int, y: int):
-        self.game.obstacles.append(Obstacle(x, y))
+        self.game.obstacles.append(Obstacle(x, y, 0, 1))
+
+class ObstacleStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ObstacleStore(capacity=2)
+
+    def test_add_matches_obstacle_placement(self):
+        slot = self.store.add(100, 10000, image_index=0, speed=1)
+        obstacle = Obstacle(100, 10000, image_index=0, speed=1)
+
+        self.assertEqual(self.store.x[slot], obstacle.x)
+        self.assertEqual(self.store.y[slot], obstacle.y)
+
+    def test_store_grows_past_capacity(self):
+        for i in range(5):
+            self.store.add(i * 100, 0, 0, 1)
+        self.assertEqual(len(self.store), 5)
+        self.assertGreaterEqual(self.store.capacity, 5)
+
+    def test_advance_moves_by_base_shift_and_speed(self):
+        slot = self.store.add(100, 0, image_index=0, speed=2)
+        start_x = self.store.x[slot]
+
+        self.store.advance(3)
+        self.assertEqual(self.store.x[slot], start_x - 5)
+
+    def test_advance_scales_and_carries_fractions(self):
+        slot = self.store.add(100, 0, image_index=0, speed=1)
+        start_x = self.store.x[slot]
+
+        distances = []
+        for _ in range(4):
+            previous_x = self.store.x[slot]
+            self.store.advance(2, 1.25)
+            distances.append(int(previous_x - self.store.x[slot]))
+        self.assertEqual(distances, [3, 4, 4, 4])
+        self.assertEqual(self.store.x[slot], start_x - 15)
+
+    def test_cull_recycles_slots(self):
+        expired = self.store.add(-1000, 0, 0, 1)
+        self.store.add(500, 0, 0, 1)
+
+        self.assertEqual(self.store.cull(), 1)
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.add(500, 0, 0, 1), expired)
+
+    def test_sprites_follow_arrays(self):
+        self.store.append(Obstacle(300, 300, image_index=1, speed=1))
+        self.store.advance(4)
+
+        sprite = list(self.store)[0]
+        self.assertEqual(sprite.rect.x, self.store.x[0])
+
+    def test_spritecollide_accepts_store(self):
+        self.store.add(100, 100, 0, 1)
+        self.store.add(600, 100, 0, 1)
+        probe = pygame.sprite.Sprite()
+        probe.rect = pygame.Rect(150, 0, 100, 600)
+
+        self.assertEqual(len(pygame.sprite.spritecollide(probe, self.store, False)), 1)
+
+    def test_blit_list_covers_every_obstacle(self):
+        for i in range(3):
+            self.store.add(i * 100, i * 10, 0, 1)
+        blits = self.store.blit_list()
+
+        self.assertEqual(len(blits), 3)
+        self.assertEqual(blits[1][1], (int(self.store.x[1]), int(self.store.y[1])))
+
+class ObstaclePoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ObstaclePool()
+
+    def test_obstacle_has_no_instance_dict(self):
+        self.assertFalse(hasattr(Obstacle(0, 0, 0, 1), "__dict__"))
+
+    def test_released_obstacles_are_reused(self):
+        first = self.pool.acquire(0, 1)
+        rect = first.rect
+        self.pool.release(first)
+
+        second = self.pool.acquire(2, 2)
+        self.assertIs(second, first)
+        self.assertIs(second.rect, rect)
+        self.assertEqual(second.image_index, 2)
+        self.assertEqual(second.rect.size, (second.width, second.height))
+
+    def test_stats(self):
+        obstacles = [self.pool.acquire(0, 1) for _ in range(3)]
+        for obstacle in obstacles:
+            self.pool.release(obstacle)
+        self.pool.acquire(1, 1)
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["high_water_mark"], 3)
+        self.assertEqual(stats["in_use"], 1)
+
+    def test_appended_obstacles_count_toward_high_water_mark(self):
+        store = ObstacleStore()
+        for _ in range(3):
+            store.append(Obstacle(100, 0, 0, 1))
+
+        stats = store.pool.get_stats()
+        self.assertEqual(stats["in_use"], 3)
+        self.assertEqual(stats["high_water_mark"], 3)
+
+    def test_store_recycles_views_of_expired_obstacles(self):
+        store = ObstacleStore()
+        for _ in range(10):
+            store.add(-1000, 0, 0, 1)
+            list(store)
+            store.cull()
+
+        self.assertEqual(store.pool.get_stats()["misses"], 1)
+        self.assertEqual(store.pool.get_stats()["hits"], 9)
@@ -0,0 +1,90 @@
+import threading
+import unittest
+import pygame
+from side_scroller.game import Game
+from side_scroller.inputs import RandomInput, PressedKeys, idle_input
+from side_scroller.pipeline import SimulationPipeline, ObstacleSnapshot
+import side_scroller.side_scroller as side_scroller
+
+def play_game(seed: int, pipelined: bool) -> Game:
+    game = Game(headless=True, input_source=RandomInput(seed), seed=seed)
+    side_scroller.main_game_loop(game, pipelined)
+    return game
+
+class PipelineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True, input_source=idle_input, seed=3)
+        self.pipeline = SimulationPipeline(self.game, side_scroller.simulate_tick)
+
+    def tearDown(self):
+        self.pipeline.close()
+
+    def test_pipelined_game_matches_sequential_game(self):
+        for seed in range(3):
+            sequential = play_game(seed, False)
+            pipelined = play_game(seed, True)
+
+            self.assertEqual(pipelined.player.score.score, sequential.player.score.score)
+            self.assertEqual(pipelined.player.y, sequential.player.y)
+            self.assertEqual(len(pipelined.obstacles), len(sequential.obstacles))
+
+    def test_snapshot_is_not_changed_by_the_next_job(self):
+        snapshot = self.pipeline.finish()
+        y = snapshot.player.y
+        blits = snapshot.obstacles.blit_list()
+
+        self.game.player.y -= 50
+        self.pipeline.start([idle_input()] * 5)
+
+        self.assertEqual(snapshot.player.y, y)
+        self.assertIsNot(self.pipeline.finish(), snapshot)
+        self.assertEqual(snapshot.obstacles.blit_list(), blits)
+
+    def test_job_simulates_the_keys_it_was_given(self):
+        self.game.input_source = lambda: 1 / 0
+        y = self.game.player.y
+        self.pipeline.start([PressedKeys((pygame.K_UP,))] * 10)
+        self.pipeline.finish()
+
+        self.assertEqual(self.game.spawn_scheduler.tick, 10)
+        self.assertLess(self.game.player.y, y)
+
+    def test_pause_is_reported_after_the_job(self):
+        self.game.headless = False
+        self.pipeline.start([PressedKeys((pygame.K_ESCAPE,))] + [idle_input()] * 2)
+        snapshot = self.pipeline.finish()
+
+        self.assertTrue(snapshot.pause_requested)
+        self.assertEqual(self.game.spawn_scheduler.tick, 3)
+
+    def test_frame_polls_keys_on_the_main_thread(self):
+        polling_threads = set()
+        def input_source():
+            polling_threads.add(threading.current_thread())
+            return idle_input()
+        self.game.input_source = input_source
+        side_scroller.run_pipelined_frame(self.game, self.pipeline)
+        side_scroller.run_pipelined_frame(self.game, self.pipeline)
+        self.pipeline.finish()
+
+        self.assertEqual(polling_threads, {threading.main_thread()})
+        self.assertEqual(self.game.spawn_scheduler.tick, 2)
+
+    def test_worker_errors_are_raised_on_finish(self):
+        self.pipeline.simulate_tick = lambda game, keys: 1 / 0
+        self.pipeline.start([idle_input()])
+        with self.assertRaises(ZeroDivisionError):
+            self.pipeline.finish()
+
+    def test_obstacle_snapshot_grows(self):
+        snapshot = ObstacleSnapshot(capacity=1)
+        for x in range(3):
+            self.game.obstacles.add(100 * x + 100, 100, 0, 1)
+        snapshot.fill(self.game.obstacles)
+
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(len(snapshot.blit_list(0.5)), 3)
+
+if __name__ == "__main__":
+    unittest.main()
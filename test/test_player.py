@@ -2,10 +2,14 @@ import unittest
 import pygame
 from side_scroller.player import Player, Hitbox, SpeedCounter, DIRECTIONS
 from side_scroller.settings import GameSettings
+from side_scroller.obstacle import ObstacleStore
+from side_scroller.assets import assets
+from test import isolate_leaderboard
 
 class PlayerTests(unittest.TestCase):
 
     def setUp(self):
+        isolate_leaderboard(self)
         self.player = Player()
 
     def tearDown(self):
@@ -56,7 +60,7 @@ class PlayerTests(unittest.TestCase):
         self.player.speed_counter.count = starting_speed_count
         self.player.speed_counter.direction = starting_direction
 
-        self.player.increase_speed_counter(1, 1)
+        self.player.increase_speed_counter(1)
 
         self.assertEqual(self.player.speed_counter.direction, starting_direction)
 
@@ -65,7 +69,7 @@ class PlayerTests(unittest.TestCase):
         starting_direction = DIRECTIONS.get(1)
         self.player.speed_counter.count = starting_speed_count
         self.player.speed_counter.direction = starting_direction
-        self.player.increase_speed_counter(2, 1)
+        self.player.increase_speed_counter(2)
 
         self.assertNotEqual(self.player.speed_counter.direction, starting_direction)
 
@@ -73,9 +77,16 @@ class PlayerTests(unittest.TestCase):
         self.player.current_speed = GameSettings.maxSpeed
         self.player.speed_counter.direction = DIRECTIONS.get(1)
 
-        self.player.increase_speed_counter(1, 1)
+        self.player.increase_speed_counter(1)
         self.assertEqual(self.player.current_speed, GameSettings.maxSpeed)
 
+    def test_move_distance_carries_fractions(self):
+        self.player.current_speed = 2
+        self.player.orientation = DIRECTIONS.get(2)
+
+        self.assertEqual(self.player.get_move_distance(1.25, DIRECTIONS.get(1)), 0)
+        self.assertEqual([self.player.get_move_distance(1.25, DIRECTIONS.get(2)) for _ in range(4)], [2, 3, 2, 3])
+
     def test_increase_y_axis(self):
         previous_y = 0
         self.player.y = previous_y
@@ -123,8 +134,7 @@ class PlayerTests(unittest.TestCase):
         self.player.score.score = 200
         self.player.game_settings.obstacle_frequency = 10
         self.player.game_settings.obstacle_speed = 10
-        self.player.game_settings.game_fps = 60
-        self.player.game_settings.fps_over_min = 5
+        self.player.game_settings.speed_scale = 5
 
         self.player.prepare_new_game()
         self.assertEqual(self.player.current_speed, GameSettings.minSpeed)
@@ -134,5 +144,37 @@ class PlayerTests(unittest.TestCase):
             self.player.game_settings.obstacle_frequency,
             GameSettings.obstacle_frequency)
         self.assertEqual(self.player.game_settings.obstacle_speed, 0)
-        self.assertEqual(self.player.game_settings.game_fps, GameSettings.minFps)
-        self.assertEqual(self.player.game_settings.fps_over_min, 1)
+        self.assertEqual(self.player.game_settings.speed_scale, 1)
+
+class PixelCollisionTests(unittest.TestCase):
+
+    def setUp(self):
+        self.player = Player(0, 0)
+        self.player.move_to_y(100)
+        self.obstacles = ObstacleStore()
+
+    def tearDown(self):
+        GameSettings.pixel_perfect_collision = True
+
+    def add_obstacle(self, x: int, y: int):
+        self.obstacles.add(x - self.obstacles.image_widths[0], y, 0, 1)
+
+    def test_transparent_corners_do_not_collide(self):
+        #Bottom right pixel of the player and top left pixel of the obstacle are both transparent
+        self.add_obstacle(self.player.neutral.get_width() - 1, self.player.y + self.player.neutral.get_height() - 1)
+        self.assertFalse(self.player.is_colliding_with_obstacles(self.obstacles))
+
+        GameSettings.pixel_perfect_collision = False
+        self.assertTrue(self.player.is_colliding_with_obstacles(self.obstacles))
+
+    def test_overlapping_opaque_pixels_collide(self):
+        self.add_obstacle(10, self.player.y + 10)
+        self.assertTrue(self.player.is_colliding_with_obstacles(self.obstacles))
+
+    def test_distant_obstacles_do_not_collide(self):
+        self.add_obstacle(400, self.player.y)
+        self.assertFalse(self.player.is_colliding_with_obstacles(self.obstacles))
+
+    def test_mask_follows_display_state(self):
+        self.player.display_state = DIRECTIONS.get(1)
+        self.assertIs(self.player.get_mask(), assets.mask("player/up"))
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import unittest
+from side_scroller.game import Game
+from side_scroller.inputs import RandomInput
+from side_scroller.profiler import FrameProfiler, NULL_PROFILER, PHASES, INPUT, MOVE
+from side_scroller.side_scroller import main_game_loop
+from side_scroller.text import render_text
+
+class FrameProfilerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = FrameProfiler(capacity=4)
+
+    def test_marks_accumulate_per_phase(self):
+        self.profiler.begin_frame()
+        self.profiler.mark(INPUT)
+        self.profiler.mark(MOVE)
+        self.profiler.mark(INPUT)
+        self.profiler.end_frame(3)
+
+        samples, obstacle_counts = self.profiler.recorded_samples()
+        self.assertEqual(len(samples), 1)
+        self.assertGreater(samples[0][INPUT], 0)
+        self.assertEqual(list(obstacle_counts), [3])
+
+    def test_ring_buffer_keeps_latest_frames(self):
+        for count in range(10):
+            self.profiler.begin_frame()
+            self.profiler.end_frame(count)
+
+        samples, obstacle_counts = self.profiler.recorded_samples()
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(sorted(obstacle_counts), [6, 7, 8, 9])
+
+    def test_summary_has_percentiles_for_every_phase(self):
+        for count in range(3):
+            self.profiler.begin_frame()
+            self.profiler.mark(MOVE)
+            self.profiler.end_frame(count)
+        summary = self.profiler.summary()
+
+        self.assertEqual(list(summary["phases_ms"]), list(PHASES))
+        self.assertEqual(set(summary["frame_ms"]), {"p50", "p95", "p99"})
+        self.assertEqual(summary["obstacles"]["p50"], 1)
+
+    def test_empty_summary(self):
+        self.assertEqual(self.profiler.summary()["phases_ms"], {})
+
+    def test_game_is_profiled_and_dumped(self):
+        profiler = FrameProfiler()
+        game = Game(headless=True, input_source=RandomInput(1), seed=1, profiler=profiler)
+        profiler.toggle_overlay()
+        cached = render_text.cache_info().currsize
+        main_game_loop(game)
+        self.assertEqual(render_text.cache_info().currsize, cached)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.dump(path)
+            with open(path) as summary_file:
+                summary = json.load(summary_file)
+        self.assertGreater(summary["frames"], 0)
+        self.assertGreater(summary["phases_ms"]["render"]["p99"], 0)
+
+    def test_games_default_to_null_profiler(self):
+        self.assertIs(Game(headless=True, render=False).profiler, NULL_PROFILER)
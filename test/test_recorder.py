@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pygame
+from side_scroller.recorder import FrameRecorder, RecordingError, iter_frames
+
+class FrameRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.ssrv")
+        self.screen = pygame.Surface((64, 48), depth=32)
+        self.recorder = FrameRecorder(self.path, self.screen.get_size(), buffer_count=2)
+
+    def tearDown(self):
+        self.recorder.close()
+        self.directory.cleanup()
+
+    def get_frames(self) -> list:
+        self.recorder.close()
+        return [(frame, canvas.copy()) for frame, canvas in iter_frames(self.path)]
+
+    def test_damaged_regions_rebuild_the_screen(self):
+        self.screen.fill((10, 20, 30))
+        self.recorder.capture(self.screen, [])
+        self.screen.fill((200, 0, 0), pygame.Rect(5, 5, 10, 10))
+        self.recorder.capture(self.screen, [pygame.Rect(5, 5, 10, 10)])
+
+        frames = self.get_frames()
+        self.assertEqual([frame for frame, _ in frames], [1, 2])
+        self.assertTrue(np.array_equal(frames[-1][1], pygame.surfarray.array3d(self.screen)))
+
+    def test_frames_without_damage_are_skipped(self):
+        self.recorder.capture(self.screen)
+        self.recorder.capture(self.screen, [])
+        self.assertEqual([frame for frame, _ in self.get_frames()], [1])
+
+    def test_frames_are_dropped_instead_of_waiting(self):
+        self.recorder.capture(self.screen)
+        held = [self.recorder.free_buffers.get(), self.recorder.free_buffers.get()]
+        self.screen.fill((255, 0, 0), pygame.Rect(0, 0, 4, 4))
+        self.recorder.capture(self.screen, [pygame.Rect(0, 0, 4, 4)])
+        self.screen.fill((0, 0, 255), pygame.Rect(10, 10, 4, 4))
+        self.recorder.capture(self.screen, [pygame.Rect(10, 10, 4, 4)])
+        self.assertEqual(self.recorder.get_stats()["dropped_frames"], 2)
+        #The dropped frames' regions wait for the next capture rather than forcing a full frame
+        self.assertEqual(self.recorder.pending_rects, [pygame.Rect(0, 0, 4, 4), pygame.Rect(10, 10, 4, 4)])
+
+        for buffer in held:
+            self.recorder.free_buffers.put(buffer)
+        self.screen.fill((0, 255, 0), pygame.Rect(20, 20, 2, 2))
+        self.recorder.capture(self.screen, [pygame.Rect(20, 20, 2, 2)])
+
+        frames = self.get_frames()
+        self.assertEqual([frame for frame, _ in frames], [1, 4])
+        self.assertTrue(np.array_equal(frames[-1][1], pygame.surfarray.array3d(self.screen)))
+
+    def test_pending_regions_fall_back_to_a_full_frame(self):
+        recorder = FrameRecorder(os.path.join(self.directory.name, "small.ssrv"), self.screen.get_size(),
+                                 buffer_count=1, max_pending_rects=3)
+        recorder.capture(self.screen)
+        held = recorder.free_buffers.get()
+        for x in range(0, 40, 10):
+            recorder.capture(self.screen, [pygame.Rect(x, 0, 2, 2)])
+
+        self.assertEqual(recorder.pending_rects, [recorder.screen_rect])
+        recorder.free_buffers.put(held)
+        recorder.close()
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as other_file:
+            other_file.write(b"not a recording")
+        with self.assertRaises(RecordingError):
+            next(iter_frames(self.path))
@@ -0,0 +1,62 @@
+import unittest
+import pygame
+from side_scroller.game import Game
+from side_scroller.render_queue import RenderQueue
+from side_scroller.inputs import idle_input
+import side_scroller.side_scroller as side_scroller
+
+class RenderQueueTests(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True, input_source=idle_input)
+        self.queue = RenderQueue(pygame.Rect(0, 0, 800, 600))
+        self.source = pygame.Surface((20, 20))
+
+    def test_off_screen_commands_are_culled(self):
+        self.assertFalse(self.queue.submit(self.source, (800, 100)))
+        self.assertFalse(self.queue.submit(self.source, (-20, 100)))
+        self.assertTrue(self.queue.submit(self.source, (790, 100)))
+
+        self.assertEqual(len(self.queue), 1)
+        self.assertEqual(self.queue.get_stats()["culled"], 2)
+
+    def test_flush_draws_with_one_blits_call(self):
+        calls = []
+        original_blits = self.game.blits
+        def counting_blits(blit_sequence):
+            calls.append(len(blit_sequence))
+            return original_blits(blit_sequence)
+        self.game.blits = counting_blits
+
+        self.queue.extend([(self.source, (0, 0)), (self.source, (50, 50))])
+        self.queue.submit(self.source, (100, 100), pygame.Rect(0, 0, 5, 5))
+        self.queue.flush(self.game)
+
+        self.assertEqual(calls, [3])
+        self.assertEqual(len(self.queue), 0)
+        self.assertEqual(self.queue.flush(self.game), [])
+
+    def test_flush_returns_only_tracked_rects(self):
+        self.queue.submit(self.source, (0, 0))
+        self.queue.submit(self.source, (50, 60), track=True)
+
+        self.assertEqual(self.queue.flush(self.game), [pygame.Rect(50, 60, 20, 20)])
+
+    def test_stats_count_drawn_commands(self):
+        self.queue.submit(self.source, (0, 0))
+        self.queue.submit(self.source, (900, 0))
+        self.queue.flush(self.game)
+
+        self.assertEqual(self.queue.get_stats(),
+                         {"submitted": 2, "culled": 1, "drawn": 1, "flushes": 1})
+
+    def test_render_frame_culls_obstacles_waiting_off_screen(self):
+        self.game.obstacles.add(900, 300, 0, 1)
+        self.game.obstacles.add(300, 300, 0, 1)
+        side_scroller.render_frame(self.game)
+
+        self.assertEqual(self.game.render_queue.culled, 1)
+        self.assertEqual(len(self.game.drawn_rects), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import pygame
+from side_scroller.game import Game
+from side_scroller.render_scale import RenderScaler
+from side_scroller.settings import GameSettings
+
+class RenderScalerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.scaler = RenderScaler(0.5)
+
+    def test_scale_rect_covers_every_pixel(self):
+        self.assertEqual(self.scaler.scale_rect(pygame.Rect(3, 3, 4, 4)), pygame.Rect(1, 1, 3, 3))
+
+    def test_scale_size_is_at_least_one_pixel(self):
+        self.assertEqual(self.scaler.scale_size((1, 1)), (1, 1))
+        self.assertEqual(self.scaler.scale_size((800, 600)), (400, 300))
+
+    def test_surface_is_scaled_once(self):
+        source = pygame.Surface((40, 20))
+        scaled = self.scaler.surface(source)
+
+        self.assertEqual(scaled.get_size(), (20, 10))
+        self.assertIs(self.scaler.surface(source), scaled)
+
+    def test_present_fills_window(self):
+        render_target = pygame.Surface((400, 300))
+        render_target.fill((255, 0, 0))
+        window = pygame.Surface((800, 600))
+
+        rects = self.scaler.present(render_target, window, [pygame.Rect(10, 10, 5, 5)])
+
+        self.assertEqual(window.get_at((799, 599))[:3], (255, 0, 0))
+        self.assertTrue(rects[0].contains(pygame.Rect(20, 20, 10, 10)))
+
+class ScaledGameTests(unittest.TestCase):
+
+    def test_render_target_is_scaled(self):
+        game = Game(headless=True, render_scale=0.5)
+
+        self.assertEqual(game.screen.get_size(), (GameSettings.width // 2, GameSettings.height // 2))
+        self.assertEqual(game.window.get_size(), (GameSettings.width, GameSettings.height))
+
+    def test_blit_returns_window_rect(self):
+        game = Game(headless=True, render_scale=0.5)
+        source = pygame.Surface((20, 20))
+
+        self.assertEqual(game.blit(source, (100, 50)), pygame.Rect(100, 50, 20, 20))
+        self.assertEqual(game.blits([(source, (100, 50))]), [pygame.Rect(100, 50, 20, 20)])
+
+    def test_blit_draws_at_scaled_position(self):
+        game = Game(headless=True, render_scale=0.5)
+        source = pygame.Surface((20, 20))
+        source.fill((0, 255, 0))
+
+        game.blit(source, (100, 50))
+
+        self.assertEqual(game.screen.get_at((55, 30))[:3], (0, 255, 0))
+
+    def test_default_scale_draws_to_window(self):
+        game = Game(headless=True, render_scale=1)
+
+        self.assertIs(game.screen, game.window)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from side_scroller.game import Game
+from side_scroller.inputs import RandomInput, UP_KEYS, DOWN_KEYS, NO_KEYS
+from side_scroller.replay import (Replay, ReplayError, encode_keys, decode_keys,
+                                  write_varint, read_varint, start_recording, finish_recording)
+from side_scroller.replay_runner import run_replay, verify_replay
+from side_scroller.side_scroller import main_game_loop
+
+def record_game(seed: int) -> Replay:
+    game = Game(headless=True, render=False, input_source=RandomInput(seed), seed=seed)
+    replay = start_recording(game)
+    main_game_loop(game)
+    return finish_recording(game, replay)
+
+class ReplayFormatTests(unittest.TestCase):
+
+    def test_keys_round_trip(self):
+        for keys in (UP_KEYS, DOWN_KEYS, NO_KEYS):
+            self.assertEqual(decode_keys(encode_keys(keys)).pressed, keys.pressed)
+
+    def test_varint_round_trip(self):
+        for value in (0, 1, 127, 128, 300, 2 ** 32):
+            data = bytearray()
+            write_varint(data, value)
+            self.assertEqual(read_varint(data, 0), (value, len(data)))
+
+    def test_repeated_input_is_run_length_encoded(self):
+        replay = Replay(seed=1, start_y=10)
+        for bits in [1] * 500 + [0] * 3:
+            replay.append(bits)
+
+        self.assertEqual(replay.runs, [[1, 500], [0, 3]])
+        self.assertEqual(replay.tick_count, 503)
+
+    def test_truncate_drops_trailing_ticks(self):
+        replay = Replay(seed=1, start_y=10, runs=[[1, 5], [0, 2], [2, 3]])
+        replay.truncate(6)
+
+        self.assertEqual(replay.runs, [[1, 5], [0, 1]])
+        replay.truncate(10)
+        self.assertEqual(replay.tick_count, 6)
+
+    def test_bytes_round_trip(self):
+        replay = Replay(seed=42, start_y=123.5, final_score=9.25, runs=[[2, 7], [0, 1000]])
+        loaded = Replay.from_bytes(replay.to_bytes())
+
+        self.assertEqual(
+            (loaded.seed, loaded.start_y, loaded.final_score, loaded.runs),
+            (42, 123.5, 9.25, [[2, 7], [0, 1000]]))
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(b"not a replay file at all, honestly")
+
+    def test_rejects_truncated_input(self):
+        data = Replay(seed=1, start_y=0, runs=[[0, 1000]]).to_bytes()
+        with self.assertRaises(ReplayError):
+            Replay.from_bytes(data[:-1])
+
+class ReplayRunTests(unittest.TestCase):
+
+    def test_replay_reproduces_recorded_score(self):
+        replay = record_game(seed=7)
+        game = run_replay(replay)
+
+        self.assertGreater(replay.tick_count, 0)
+        self.assertEqual(game.player.score.score, replay.final_score)
+        self.assertTrue(verify_replay(replay))
+
+    def test_negative_seed_is_saved(self):
+        replay = record_game(seed=-1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.ssr")
+            replay.save(path)
+            self.assertTrue(verify_replay(Replay.load(path)))
+
+    def test_saved_replay_verifies(self):
+        replay = record_game(seed=11)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.ssr")
+            replay.save(path)
+            self.assertTrue(verify_replay(Replay.load(path)))
+
+    def test_tampered_replay_fails_verification(self):
+        replay = record_game(seed=3)
+        replay.final_score += 1
+        self.assertFalse(verify_replay(replay))
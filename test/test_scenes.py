@@ -0,0 +1,59 @@
+import unittest
+import pygame
+from side_scroller.game import Game
+from side_scroller.inputs import idle_input
+from side_scroller.scenes import Scene, run_scenes
+from side_scroller.loss_screen import LossScene
+from side_scroller.pause_screen import PauseScene
+from side_scroller.death_animation import DeathAnimationScene
+from side_scroller.settings import GameSettings
+
+class CountingScene(Scene):
+    def __init__(self, frames: int, log: list):
+        self.frames = frames
+        self.log = log
+
+    def update(self):
+        self.log.append(self.frames)
+        return CountingScene(self.frames - 1, self.log) if self.frames > 1 else None
+
+class ScenesTests(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        pygame.event.clear()
+        self.game = Game(headless=True, input_source=idle_input)
+
+    def post_return_key(self):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+
+    def test_run_scenes_follows_returned_scenes(self):
+        log = []
+        run_scenes(CountingScene(3, log))
+        self.assertEqual(log, [3, 2, 1])
+
+    def test_loss_scene_waits_for_return(self):
+        GameSettings.idle_event_timeout = 1
+        try:
+            scene = LossScene(self.game.player, self.game.screen)
+            self.assertIs(scene.update(), scene)
+            self.post_return_key()
+            self.assertIsNone(scene.update())
+        finally:
+            GameSettings.idle_event_timeout = 500
+
+    def test_pause_scene_resumes_game(self):
+        resume_scene = Scene()
+        scene = PauseScene(self.game, resume_scene)
+        self.post_return_key()
+        self.assertIs(scene.update(), resume_scene)
+
+    def test_death_animation_drops_player_off_screen(self):
+        scene = DeathAnimationScene(self.game)
+        frames = 0
+        while scene is not None:
+            scene = scene.update()
+            frames += 1
+
+        self.assertGreater(frames, GameSettings.death_white_duration + GameSettings.death_raise_duration - 2)
+        self.assertGreater(self.game.player.y, self.game.player.y_bottom_barrier)
@@ -1,10 +1,11 @@
 import unittest
 from side_scroller.score import Score
+from test import isolate_leaderboard
 
 class ScoreTests(unittest.TestCase):
 
     def setUp(self):
-        pass
+        isolate_leaderboard(self)
 
     def test_increase_score(self):
         score = Score()
@@ -31,15 +32,7 @@ class ScoreTests(unittest.TestCase):
         score.score = 5
         score.level = 3
 
-        score.countToObstacleTick = 4
-        score.countToLevelTick = 1
-        score.countToFrequencyTick = 3
-
         score.reset_score()
 
         self.assertEqual(score.score, 0)
         self.assertEqual(score.level, 1)
-
-        self.assertEqual(score.countToObstacleTick, 0)
-        self.assertEqual(score.countToLevelTick, 0)
-        self.assertEqual(score.countToFrequencyTick, 0)
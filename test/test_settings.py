@@ -33,8 +33,7 @@ class SettingsTest(unittest.TestCase):
 def change_game_settings_instance_variables(game_settings: GameSettings):
     game_settings.obstacle_frequency = 300
     game_settings.obstacle_speed = 5
-    game_settings.game_fps = 5676
-    game_settings.fps_over_min = 34
+    game_settings.speed_scale = 34
 
 def get_game_setting_attributes(game_settings: GameSettings):
     return [a for a in dir(game_settings)
@@ -3,18 +3,13 @@ import pygame
 from side_scroller.settings import GameSettings
 from side_scroller.game import Game
 import side_scroller.side_scroller as side_scroller
-
-def get_current_count_to_obstacle_tick(game: Game):
-    return game.player.score.countToObstacleTick
-
-def get_current_count_to_level_tick(game: Game):
-    return game.player.score.countToLevelTick
+from side_scroller.spawner import SPAWN_OBSTACLE, INCREASE_LEVEL
 
 def get_current_level(game: Game):
     return game.player.score.level
 
-def get_game_fps(game: Game):
-    return game.game_fps
+def get_speed_scale(game: Game):
+    return game.player.game_settings.speed_scale
 
 def get_obstacle_frequency(game: Game):
     return game.player.game_settings.obstacle_frequency
@@ -22,20 +17,9 @@ def get_obstacle_frequency(game: Game):
 def get_obstacle_speed(game: Game):
     return game.player.game_settings.obstacle_speed
 
-def set_count_to_obstacle_tick(game: Game, new_count: int):
-    game.player.score.countToObstacleTick = new_count
-
-def set_count_to_level_tick(game: Game, new_count: int):
-    game.player.score.countToLevelTick = new_count
-
-def set_count_to_frequency_tick(game: Game, new_count: int):
-    game.player.score.countToFrequencyTick = new_count
+def set_speed_scale(game: Game, speed_scale: float):
+    game.player.game_settings.speed_scale = speed_scale
 
-def set_game_fps(game: Game, new_fps: int):
-    game.game_fps = new_fps
-
-def set_obstacle_frequency(game: Game, new_frequency: int):
-    game.player.game_settings.obstacle_frequency = new_frequency
 
 class SideScrollerTest(unittest.TestCase):
 
@@ -45,93 +29,83 @@ class SideScrollerTest(unittest.TestCase):
     def tearDown(self):
         pass
 
-    def test_tick_adjustment_increases_counts(self):
-        initial_count_to_obstacle_tick = get_current_count_to_obstacle_tick(self.game)
-        initial_count_to_level_tick = get_current_count_to_level_tick(self.game)
+    def test_tick_adjustment_advances_schedule(self):
+        initial_tick = self.game.spawn_scheduler.tick
 
         side_scroller.tick_adjustments(self.game)
 
-        self.assertGreater(get_current_count_to_obstacle_tick(self.game), initial_count_to_obstacle_tick)
-        self.assertGreater(get_current_count_to_level_tick(self.game), initial_count_to_level_tick)
+        self.assertEqual(self.game.spawn_scheduler.tick, initial_tick + 1)
 
     def test_if_necessary_add_obstacle_when_not_necessary(self):
         original_obstacle_count = len(self.game.obstacles)
-        set_count_to_obstacle_tick(
-            self.game,
-            self.game.player.game_settings.obstacle_frequency - 1)
+        ticks_until_spawn = self.game.spawn_scheduler.ticks_until(SPAWN_OBSTACLE)
 
-        side_scroller.tick_adjustments(self.game)
+        for _ in range(ticks_until_spawn - 1):
+            side_scroller.tick_adjustments(self.game)
 
         self.assertEqual(len(self.game.obstacles), original_obstacle_count)
 
     def test_if_necessary_add_obstacle_when_necessary(self):
         original_obstacle_count = len(self.game.obstacles)
-        set_count_to_obstacle_tick(
-            self.game,
-            self.game.player.game_settings.obstacle_frequency + 1)
+        spawn = self.game.spawn_scheduler.upcoming(kind=SPAWN_OBSTACLE)[0]
 
-        side_scroller.tick_adjustments(self.game)
+        for _ in range(spawn.tick):
+            side_scroller.tick_adjustments(self.game)
 
         self.assertGreater(len(self.game.obstacles), original_obstacle_count)
+        self.assertEqual(self.game.obstacles.image_index[0], spawn.image_index)
 
     def test_if_necessary_increase_level_when_not_necessary(self):
         original_level = get_current_level(self.game)
-        set_count_to_level_tick(
-            self.game,
-            GameSettings.levelTick - 1)
 
-        side_scroller.tick_adjustments(self.game)
+        for _ in range(self.game.spawn_scheduler.ticks_until(INCREASE_LEVEL) - 1):
+            side_scroller.tick_adjustments(self.game)
 
         self.assertEqual(get_current_level(self.game), original_level)
 
     def test_if_necessary_increase_level_when_necessary(self):
         original_level = get_current_level(self.game)
-        set_count_to_level_tick(
-            self.game,
-            GameSettings.levelTick + 1)
 
-        side_scroller.tick_adjustments(self.game)
+        for _ in range(self.game.spawn_scheduler.ticks_until(INCREASE_LEVEL)):
+            side_scroller.tick_adjustments(self.game)
 
         self.assertGreater(get_current_level(self.game), original_level)
 
-    def test_increase_obstacle_speed_before_max_fps(self):
-        original_fps = get_game_fps(self.game)
+    def test_increase_level_before_max_fps(self):
+        original_speed_scale = get_speed_scale(self.game)
         original_obstacle_speed = get_obstacle_speed(self.game)
 
-        side_scroller.increase_obstacle_speed(self.game)
+        side_scroller.increase_level(self.game)
 
-        self.assertGreater(get_game_fps(self.game), original_fps)
+        self.assertEqual(get_current_level(self.game), 2)
+        self.assertGreater(get_speed_scale(self.game), original_speed_scale)
         self.assertEqual(get_obstacle_speed(self.game), original_obstacle_speed)
 
-    def test_increase_obstacle_speed_after_max_fps(self):
-        set_game_fps(self.game, GameSettings.maxFps)
-        original_fps = get_game_fps(self.game)
+    def test_increase_level_after_max_fps(self):
+        self.game.player.score.level = len(self.game.difficulty)
+        set_speed_scale(self.game, GameSettings.maxFps / GameSettings.minFps)
         original_obstacle_speed = get_obstacle_speed(self.game)
+        original_boost = self.game.player.get_level_speed_boost()
 
-        side_scroller.increase_obstacle_speed(self.game)
+        side_scroller.increase_level(self.game)
 
-        self.assertEqual(get_game_fps(self.game), original_fps)
+        self.assertGreaterEqual(get_speed_scale(self.game), GameSettings.maxFps / GameSettings.minFps)
         self.assertGreater(get_obstacle_speed(self.game), original_obstacle_speed)
+        self.assertEqual(self.game.player.get_level_speed_boost(),
+                         original_boost + GameSettings.obstacle_tick_speed_adjustments / 2)
 
-    def test_if_necessary_increase_obstacle_frequency_when_not_necessary(self):
+    def test_increase_level_lowers_obstacle_frequency_on_schedule(self):
         original_obstacle_frequency = get_obstacle_frequency(self.game)
-        set_count_to_frequency_tick(self.game, GameSettings.frequencyTick - 1)
-
-        side_scroller.if_necessary_increase_obstacle_frequency(self.game)
+        for _ in range(self.game.difficulty.frequency_levels - 1):
+            side_scroller.increase_level(self.game)
         self.assertEqual(get_obstacle_frequency(self.game), original_obstacle_frequency)
 
-    def test_if_necessary_increase_obstacle_frequency_when_necessary(self):
-        set_obstacle_frequency(self.game, GameSettings.obstacle_tick_adjustment + 1)
-        original_obstacle_frequency = get_obstacle_frequency(self.game)
-        set_count_to_frequency_tick(self.game, GameSettings.frequencyTick + 1)
-
-        side_scroller.if_necessary_increase_obstacle_frequency(self.game)
+        side_scroller.increase_level(self.game)
+        #Lower means more frequent
         self.assertLess(get_obstacle_frequency(self.game), original_obstacle_frequency)
 
-        set_obstacle_frequency(self.game, GameSettings.obstacle_tick_adjustment - 1)
-        original_obstacle_frequency = get_obstacle_frequency(self.game)
-        set_count_to_frequency_tick(self.game, GameSettings.frequencyTick + 1)
+    def test_obstacle_frequency_never_drops_below_floor(self):
+        for _ in range(self.game.difficulty.frequency_levels * 20):
+            side_scroller.increase_level(self.game)
 
-        side_scroller.if_necessary_increase_obstacle_frequency(self.game)
-        #Lower means more frequent
-        self.assertLess(get_obstacle_frequency(self.game), original_obstacle_frequency)
+        self.assertEqual(get_obstacle_frequency(self.game), GameSettings.min_obstacle_frequency)
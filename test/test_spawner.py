@@ -0,0 +1,57 @@
+import random
+import unittest
+from side_scroller.settings import GameSettings
+from side_scroller.difficulty import DifficultyTable
+from side_scroller.spawner import SpawnScheduler, SPAWN_OBSTACLE, INCREASE_LEVEL
+from side_scroller.sweep import override_settings
+
+class SpawnSchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = SpawnScheduler(random.Random(1), lookahead=100)
+
+    def test_first_spawn_follows_obstacle_frequency(self):
+        spawn = self.scheduler.upcoming(kind=SPAWN_OBSTACLE)[0]
+        self.assertEqual(spawn.tick, GameSettings.obstacle_frequency + 1)
+
+    def test_advance_pops_only_due_events(self):
+        ticks = {}
+        for _ in range(300):
+            for event in self.scheduler.advance():
+                self.assertEqual(event.tick, self.scheduler.tick)
+                ticks.setdefault(event.kind, []).append(event.tick)
+
+        self.assertEqual(ticks[INCREASE_LEVEL][0], GameSettings.levelTick + 1)
+        self.assertEqual(len(ticks[SPAWN_OBSTACLE]), 7)
+
+    def test_lookahead_is_kept_generated(self):
+        self.scheduler.advance()
+        self.assertGreaterEqual(self.scheduler.generated_tick, self.scheduler.tick + 100)
+        self.assertTrue(all(event.tick <= self.scheduler.tick + 50 for event in self.scheduler.upcoming(50)))
+
+    def test_same_seed_gives_same_timeline(self):
+        other = SpawnScheduler(random.Random(1), lookahead=100)
+        self.assertEqual(
+            [(event.tick, event.x, event.y, event.image_index, event.speed) for event in self.scheduler.upcoming(500)],
+            [(event.tick, event.x, event.y, event.image_index, event.speed) for event in other.upcoming(500)])
+
+    def test_rising_speed_keeps_spawn_interval_in_ticks(self):
+        #Levels speed up movement, not the tick rate, so only the spawn interval spaces spawns
+        with override_settings({"frequencyTick": 10 ** 9}):
+            scheduler = SpawnScheduler(random.Random(1), DifficultyTable(), lookahead=100)
+        spawns = scheduler.upcoming(3000, SPAWN_OBSTACLE)
+        intervals = {later.tick - earlier.tick for earlier, later in zip(spawns, spawns[1:])}
+        self.assertEqual(intervals, {GameSettings.obstacle_frequency})
+
+    def test_spawns_follow_the_difficulty_table(self):
+        difficulty = DifficultyTable()
+        level = difficulty.frequency_levels + 1
+        self.assertLess(difficulty.get(level).spawn_interval, difficulty.get(1).spawn_interval)
+
+        level_ticks = [event.tick for event in self.scheduler.upcoming(5000, INCREASE_LEVEL)]
+        start = level_ticks[level - 2]
+        spawns = [event.tick for event in self.scheduler.upcoming(5000, SPAWN_OBSTACLE)]
+        early_interval = spawns[1] - spawns[0]
+        later_interval = min(later - earlier for earlier, later in zip(spawns, spawns[1:]) if earlier > start)
+
+        self.assertLess(later_interval, early_interval)
@@ -16,7 +16,6 @@ class StatesTest(unittest.TestCase):
 
     def setUp(self):
         pygame.init()
-        self.game.fps_over_min = 1
         self.game.player.current_speed = 1
 
     def tearDown(self):
@@ -55,7 +54,7 @@ class StatesTest(unittest.TestCase):
         open_game.neutral_count = 0
         self.assertEqual(
             neutral_key_state(open_game),
-            open_game.neutral_count + open_game.fps_over_min)
+            open_game.neutral_count + 1)
         close_display_window()
 
     def test_up_key_state_moves_up_when_possible(self):
@@ -101,6 +100,20 @@ class StatesTest(unittest.TestCase):
         self.assertEqual(open_game.player.y, open_game.player.y_bottom_barrier)
         close_display_window()
 
+    def test_up_key_state_moves_further_at_higher_speed_scale(self):
+        open_game = Game()
+        player = open_game.player
+        player.move_to_y(300)
+        player.orientation = DIRECTIONS.get(1) #Up
+        player.current_speed = 2
+        player.game_settings.speed_scale = 1.5
+
+        for _ in range(4):
+            up_key_state(open_game)
+        #Speed 2 at 1.5 times is 3 pixels a tick
+        self.assertEqual(player.y, 300 - 4 * 3)
+        close_display_window()
+
     def test_neutral_key_state_when_oriented_up(self):
         open_game = Game()
         open_game.player.orientation = DIRECTIONS.get(1) #Up
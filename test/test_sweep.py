@@ -0,0 +1,38 @@
+import argparse
+import unittest
+from side_scroller.settings import GameSettings
+from side_scroller.sweep import (parse_param, expand_grid, override_settings, simulate_game,
+                                 run_sweep)
+
+class SweepTests(unittest.TestCase):
+
+    def test_parse_param(self):
+        self.assertEqual(parse_param("levelTick=100,200"), ("levelTick", [100, 200]))
+        self.assertEqual(parse_param("fpsTick=1.5"), ("fpsTick", [1.5]))
+
+    def test_parse_param_rejects_unknown_setting(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_param("width=100")
+
+    def test_expand_grid(self):
+        grid = expand_grid([("levelTick", [1, 2]), ("fpsTick", [3, 4])])
+        self.assertEqual(grid, [
+            {"levelTick": 1, "fpsTick": 3}, {"levelTick": 1, "fpsTick": 4},
+            {"levelTick": 2, "fpsTick": 3}, {"levelTick": 2, "fpsTick": 4}])
+
+    def test_settings_are_restored(self):
+        original = GameSettings.levelTick
+        with override_settings({"levelTick": 1}):
+            self.assertEqual(GameSettings.levelTick, 1)
+        self.assertEqual(GameSettings.levelTick, original)
+
+    def test_simulated_game_is_repeatable(self):
+        task = (0, {"obstacle_frequency": 20}, 5, "random")
+        self.assertEqual(simulate_game(task), simulate_game(task))
+
+    def test_faster_levels_reach_higher_levels(self):
+        results = run_sweep(expand_grid([("levelTick", [100, 20])]), games=4, processes=2)
+        slow, fast = (result.summary() for result in results)
+
+        self.assertEqual(slow["games"], 4)
+        self.assertGreater(fast["level_mean"], slow["level_mean"])
@@ -0,0 +1,59 @@
+import unittest
+import pygame
+from side_scroller.constants import BLACK
+from side_scroller.game import Game
+from side_scroller.loss_screen import LossScreen
+from side_scroller.player import Player
+from side_scroller.settings import Fonts
+from side_scroller.text import DigitAtlas, render_text
+
+class TextTests(unittest.TestCase):
+
+    def test_render_text_is_cached(self):
+        self.assertIs(render_text(Fonts.hud_font, "Paused", BLACK),
+                      render_text(Fonts.hud_font, "Paused", BLACK))
+
+    def test_loss_screen_scores_are_not_cached(self):
+        player = Player()
+        LossScreen(player)
+        cached = render_text.cache_info().currsize
+        player.score.score = 123
+        LossScreen(player)
+
+        self.assertEqual(render_text.cache_info().currsize, cached)
+
+    def test_digit_atlas_layout(self):
+        atlas = DigitAtlas(Fonts.hud_font, BLACK, "Score: ")
+        blits, rect = atlas.layout(120, (5, 0))
+
+        self.assertEqual(len(blits), 4)
+        self.assertEqual(blits[0][1], (5, 0))
+        self.assertEqual(rect.width, sum(surface.get_width() for surface, _ in blits))
+
+class ScoreHudTests(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game(headless=True)
+        self.redraw_count = 0
+        original_extend = self.game.render_queue.extend
+        def counting_extend(blit_sequence, track=False):
+            self.redraw_count += 1
+            return original_extend(blit_sequence, track)
+        self.game.render_queue.extend = counting_extend
+
+    def test_hud_only_redraws_when_value_changes(self):
+        self.game.update_score_hud()
+        self.game.player.score.score += 0.5
+        self.game.update_score_hud()
+        self.assertEqual(self.redraw_count, 1)
+
+        self.game.player.score.score += 1
+        self.game.update_score_hud()
+        self.assertEqual(self.redraw_count, 2)
+
+    def test_hud_redraws_after_sprite_erased_over_it(self):
+        self.game.update_score_hud()
+        self.game.drawn_rects.append(pygame.Rect(0, 0, 10, 10))
+        self.game.erase_drawn_sprites()
+        self.game.update_score_hud()
+        self.assertEqual(self.redraw_count, 3)